@@ -0,0 +1,122 @@
+"""
+모델/행 매핑 벤치마크.
+
+N행(기본 1,000,000행)을 읽어 모델 객체로 만들 때의 시간과 최대 메모리를 비교합니다.
+- 기존: fetchall() 튜플 목록 → 리스트 컴프리헨션 → __dict__ 모델 (키워드 인자)
+- map_all: 커서 → starmap → __slots__ 모델
+- iter_mapped: fetchmany 묶음 단위로 하나씩 (목록을 만들지 않음, 개수만 셈)
+Todo와 같은 열의 테이블, 그리고 TemplateRepository.get_all_templates를 각각 측정합니다.
+
+실행: python benchmarks/bench_row_mapping.py [행 수]
+"""
+import gc
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, fields
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.todo import Todo  # noqa: E402
+from repositories.row_mapping import iter_mapped, map_all  # noqa: E402
+from repositories.template_repository import TemplateRepository  # noqa: E402
+
+
+@dataclass
+class DictTodo:
+    """비교용: __slots__ 없는 기존 Todo와 같은 dataclass."""
+    id: int
+    content: str
+    status: str
+    created_at: str
+    sort_order: int = 0
+    parent_id: Optional[int] = None
+    archived_at: Optional[str] = None
+    child_total: int = 0
+    child_completed: int = 0
+    version: int = 0
+    due_at: Optional[str] = None
+    remind_at: Optional[str] = None
+    recurrence: Optional[str] = None
+    priority: Optional[int] = None
+
+
+class DictTemplate:
+    def __init__(self, id, title, content):
+        self.id = id
+        self.title = title
+        self.content = content
+
+
+COLUMNS = [f.name for f in fields(Todo)]
+
+
+def _legacy_todos(conn):
+    rows = conn.execute(f"SELECT {', '.join(COLUMNS)} FROM todos").fetchall()
+    return [DictTodo(id=r[0], content=r[1], status=r[2], created_at=r[3], sort_order=r[4], parent_id=r[5],
+                     archived_at=r[6], child_total=r[7], child_completed=r[8], version=r[9], due_at=r[10],
+                     remind_at=r[11], recurrence=r[12], priority=r[13]) for r in rows]
+
+
+def _mapped_todos(conn):
+    return map_all(conn.execute(f"SELECT {', '.join(COLUMNS)} FROM todos"), Todo)
+
+
+def _iter_todos(conn):
+    return sum(1 for _ in iter_mapped(conn.execute(f"SELECT {', '.join(COLUMNS)} FROM todos"), Todo))
+
+
+def _legacy_templates(repo):
+    repo.cursor.execute("SELECT id, title, content FROM templates ORDER BY title")
+    return [DictTemplate(id, title, content) for id, title, content in repo.cursor.fetchall()]
+
+
+def _measure(label: str, func, *args) -> None:
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    count = result if isinstance(result, int) else len(result)
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    print(f"{label:<34}: {count:9d}행 {elapsed * 1000:9.1f} ms  최대 {peak / 1024 / 1024:8.1f} MiB")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "rows.db"))
+        conn.execute(f"CREATE TABLE todos ({', '.join(COLUMNS)})")
+        conn.executemany(
+            f"INSERT INTO todos VALUES ({', '.join(['?'] * len(COLUMNS))})",
+            ((i, f"todo {i}", 'pending', '2026-01-01 00:00:00', i * 1024, i // 10 or None, None, 0, 0, 1,
+              None, None, None, None) for i in range(1, n + 1))
+        )
+        conn.commit()
+        print(f"Todo {n}행")
+        _measure("기존 (fetchall + dict dataclass)", _legacy_todos, conn)
+        _measure("map_all (slots Todo)", _mapped_todos, conn)
+        _measure("iter_mapped (slots Todo)", _iter_todos, conn)
+        conn.close()
+
+        repo = TemplateRepository(os.path.join(tmp, "config.db"))
+        repo.conn.executemany("INSERT INTO templates (title, content) VALUES (?, ?)",
+                              ((f"template {i:07d}", f"content {i}") for i in range(n)))
+        repo.conn.commit()
+        print(f"Template {n}행")
+        _measure("기존 (fetchall + dict 모델)", _legacy_templates, repo)
+        _measure("get_all_templates", repo.get_all_templates)
+        repo.conn.close()
+
+
+if __name__ == "__main__":
+    main()
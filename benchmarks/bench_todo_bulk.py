@@ -0,0 +1,94 @@
+"""
+Todo 대량 작업 벤치마크.
+
+N개(기본 100,000개) 항목 전체를 대상으로 저장소의 일괄 문장(임시 테이블 todo_ids 조인:
+update_status_bulk, complete_subtrees, delete_many)을 실행해 바뀐 행 수와 시간을 출력합니다.
+비교용으로 ID 전체를 IN (?, ?, ...) 하나에 넣던 기존 방식도 실행합니다 (SQLite 바인딩 변수 제한을 넘으면 오류 메시지를 출력).
+이어서 앱이 쓰는 TodoService 명령(색인 반영 + 위 문장, 되돌리기는 쓰기 지연 큐)의 명령 시간과 기록(flush) 시간을 출력합니다.
+
+실행: python benchmarks/bench_todo_bulk.py [항목 수]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.todo_repository import TodoRepository  # noqa: E402
+from services.todo_service import TodoService  # noqa: E402
+
+
+def _single_in_update(repo: TodoRepository, ids, status: str) -> int:
+    """기존 update_status_bulk 재현: 모든 ID를 한 IN 절에 바인딩."""
+    with repo._db.transaction() as conn:
+        qmarks = ",".join(["?"] * len(ids))
+        return conn.execute(f"UPDATE todos SET status = ? WHERE id IN ({qmarks})", [status, *ids]).rowcount
+
+
+def _timed(label: str, func, *args) -> None:
+    start = time.perf_counter()
+    try:
+        count = func(*args)
+    except sqlite3.Error as e:
+        print(f"{label:<28}: 실패 ({e})")
+        return
+    elapsed = time.perf_counter() - start
+    count = len(count) if isinstance(count, list) else count
+    print(f"{label:<28}: {count:8d}건 {elapsed * 1000:10.1f} ms")
+
+
+def _timed_command(service: TodoService, label: str, func, *args) -> None:
+    """명령과 그 뒤 쓰기 지연 큐에 남은 DB 기록(apply_changes 한 트랜잭션)을 따로 잽니다."""
+    start = time.perf_counter()
+    count = func(*args)
+    command = time.perf_counter() - start
+    # 일괄 문장으로 바로 기록하는 명령은 바뀐 행 수, 되돌리기는 큐에 쌓인 행 수
+    count = service._writer.pending_count if not isinstance(count, int) else count
+    start = time.perf_counter()
+    ok = service.flush()
+    written = time.perf_counter() - start
+    print(f"{label:<28}: {count:8d}건 명령 {command * 1000:8.1f} ms  기록 {written * 1000:8.1f} ms"
+          + ("" if ok else "  (기록 실패)"))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = TodoRepository(os.path.join(tmp, "bulk.db"))
+        service = TodoService(repo)
+        try:
+            # 최상위 항목 절반 + 각각의 자식 하나
+            parents = repo.bulk_create([f"todo {i}" for i in range(n // 2)])
+            with repo._db.transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO todos (content, status, sort_order, parent_id) VALUES (?, 'pending', 1024, ?)",
+                    [(f"child of {pid}", pid) for pid in parents[:n - len(parents)]]
+                )
+                children = [r[0] for r in conn.execute("SELECT id FROM todos WHERE parent_id IS NOT NULL")]
+            ids = parents + children
+            print(f"항목 {len(ids)}개")
+
+            _timed("IN (...) 한 문장 (기존)", _single_in_update, repo, ids, 'completed')
+            _timed("update_status_bulk (미완료)", repo.update_status_bulk, ids, 'pending')
+            _timed("update_status_bulk (완료)", repo.update_status_bulk, ids, 'completed')
+            _timed("update_status_bulk (변경 없음)", repo.update_status_bulk, ids, 'completed')
+            _timed("update_status_bulk (미완료)", repo.update_status_bulk, ids, 'pending')
+            _timed("complete_subtrees", repo.complete_subtrees, parents)
+            _timed("update_status_bulk (미완료)", repo.update_status_bulk, ids, 'pending')
+
+            # 색인은 처음 한 번만 읽음 (명령 시간에 포함되지 않도록 미리 읽어 둠)
+            _timed("색인 읽기", lambda: len(service.index.by_id))
+            _timed_command(service, "set_status (하위 트리 완료)", service.set_status, parents, 'completed')
+            _timed_command(service, "undo (완료 되돌리기)", service.undo)
+            _timed_command(service, "delete_many", service.delete_many, parents)
+            _timed_command(service, "undo (삭제 되돌리기)", service.undo)
+            _timed("archive_todos", service.archive_todos, parents)
+            _timed("restore_archived", service.restore_archived, parents)
+        finally:
+            service.close()
+
+
+if __name__ == "__main__":
+    main()
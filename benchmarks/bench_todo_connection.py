@@ -0,0 +1,73 @@
+"""
+TodoRepository 연결 방식 벤치마크.
+
+작업마다 sqlite3.connect/close 하던 기존 방식과 장기 연결(SQLiteConnectionManager)을
+같은 작업(create_advanced + update_status)과 같은 SQL로 비교해 ops/sec를 출력합니다.
+
+실행: python benchmarks/bench_todo_connection.py [반복 횟수]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.connection import SQLiteConnectionManager  # noqa: E402
+from repositories.todo_repository import TodoRepository  # noqa: E402
+
+
+class PerCallConnection(SQLiteConnectionManager):
+    """기존 동작 재현: 트랜잭션마다 연결을 열고 닫음."""
+
+    @contextmanager
+    def transaction(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+class ConnectionPerCallRepository(TodoRepository):
+    """
+    연결 방식만 바꾼 TodoRepository. 메서드는 그대로 물려받으므로 두 쪽이 같은 SQL을 실행합니다
+    (create_advanced의 INSERT 뒤 다시 읽는 SELECT와 태그 기록 포함).
+    """
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        # 장기 연결은 스키마 생성에만 쓰고 닫아 둔다
+        self._db.close()
+        self._db = PerCallConnection(db_path)
+
+
+def _bench(repo, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        created = repo.create_advanced(f"todo {i}")
+        repo.update_status(created.id, 'completed')
+    elapsed = time.perf_counter() - start
+    return (n * 2) / elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as tmp:
+        per_call = ConnectionPerCallRepository(os.path.join(tmp, "per_call.db"))
+        pooled = TodoRepository(os.path.join(tmp, "pooled.db"))
+        try:
+            per_call_ops = _bench(per_call, n)
+            pooled_ops = _bench(pooled, n)
+        finally:
+            pooled.close()
+    print(f"connection-per-call: {per_call_ops:10.0f} ops/sec")
+    print(f"persistent (WAL)   : {pooled_ops:10.0f} ops/sec")
+    print(f"speedup            : {pooled_ops / per_call_ops:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+TodoRepository 태그 조건 조회 벤치마크.
+
+N개(기본 100,000개) 항목에 태그를 0~3개씩 붙이고, 태그 1~3개 조합으로 find_by_tags를 실행해
+결과 수와 소요 시간을 출력합니다. 비교용으로 내용에서 '#태그'를 LIKE로 찾는 방식도 실행합니다.
+
+실행: python benchmarks/bench_todo_tags.py [항목 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.todo_repository import TodoRepository  # noqa: E402
+
+# 자주 쓰는 태그 몇 개와 드문 태그 여러 개
+TAGS = ["work", "home", "errand"] + [f"project{i}" for i in range(50)]
+
+
+def _like_scan(repo: TodoRepository, tags) -> int:
+    """태그 테이블 없이 내용 LIKE로 찾던 방식 (전체 스캔)."""
+    sql = "SELECT COUNT(*) FROM todos WHERE archived_at IS NULL" + " AND content LIKE ?" * len(tags)
+    with repo._db.transaction() as conn:
+        return conn.execute(sql, [f"%#{tag}%" for tag in tags]).fetchone()[0]
+
+
+def _timed(label: str, func, *args) -> None:
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    count = len(result) if isinstance(result, list) else result
+    print(f"{label:<36}: {count:8d}건 {elapsed * 1000:10.1f} ms")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rnd = random.Random(0)
+    weights = [30, 20, 10] + [1] * 50
+    contents = []
+    for i in range(n):
+        tags = set(rnd.choices(TAGS, weights, k=rnd.randint(0, 3)))
+        contents.append(" ".join([f"todo {i}"] + [f"#{tag}" for tag in sorted(tags)]))
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = TodoRepository(os.path.join(tmp, "tags.db"))
+        try:
+            start = time.perf_counter()
+            repo.bulk_create(contents)
+            print(f"항목 {n}개 추가 (태그 포함): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+            for tags in (["work"], ["project7"], ["work", "home"], ["work", "project7"], ["work", "home", "errand"]):
+                label = " ".join(f"#{t}" for t in tags)
+                _timed(f"LIKE {label}", _like_scan, repo, tags)
+                _timed(f"find_by_tags {label}", repo.find_by_tags, tags)
+                _timed(f"find_by_tags {label} (200개)", repo.find_by_tags, tags, 'pending', 200)
+            _timed("get_tag_counts", repo.get_tag_counts)
+        finally:
+            repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+클립보드 히스토리 트라이그램 검색 벤치마크.
+
+N개(기본 10,000개) 한영 혼합 항목을 TrigramIndex에 넣고, 정확한 검색어와 오타가 섞인 검색어로
+search를 반복 실행해 결과 수, 첫 결과, 평균/최대 소요 시간을 출력합니다.
+비교용으로 모든 항목에 대해 부분 문자열(in)을 확인하는 방식도 실행합니다 (오타는 찾지 못함).
+
+실행: python benchmarks/bench_trigram_search.py [항목 수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.trigram_index import TrigramIndex  # noqa: E402
+
+WORDS = ["클립보드", "히스토리", "회의록", "보고서", "일정", "배포", "서버", "로그", "오류", "데이터베이스",
+         "report", "deploy", "server", "error", "meeting", "invoice", "customer", "python", "release", "backup"]
+QUERIES = ["회의록", "회의룩", "데이터베이스 오류", "deploy server", "depoly sever", "customer invoice",
+           "클립보드 히스토리", "pyhton", "2025"]
+REPEAT = 20
+
+
+def _make_entry(rnd: random.Random, i: int) -> str:
+    words = rnd.choices(WORDS, k=rnd.randint(3, 12))
+    return f"{' '.join(words)} #{i} {rnd.randint(2000, 2030)}-{rnd.randint(1, 12):02d}"
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rnd = random.Random(0)
+    entries = [_make_entry(rnd, i) for i in range(n)]
+
+    index = TrigramIndex()
+    start = time.perf_counter()
+    for i, text in enumerate(entries):
+        index.add(i, text)
+    print(f"항목 {n}개 색인: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for query in QUERIES:
+        times = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            results = index.search(query, limit=200)
+            times.append(time.perf_counter() - start)
+        top = entries[results[0][0]][:40] if results else '-'
+        print(f"search {query!r:<24}: {len(results):5d}건  평균 {sum(times) / REPEAT * 1000:6.2f} ms  "
+              f"최대 {max(times) * 1000:6.2f} ms  첫 결과: {top}")
+
+        start = time.perf_counter()
+        scan = sum(1 for text in entries if query.casefold() in text.casefold())
+        print(f"{'  부분 문자열 비교':<33}: {scan:5d}건  {(time.perf_counter() - start) * 1000:6.2f} ms")
+
+    # 히스토리 예산 때문에 오래된 항목이 빠지고 새 항목이 들어오는 경우
+    start = time.perf_counter()
+    for i in range(1000):
+        index.remove(i)
+        index.add(n + i, _make_entry(rnd, n + i))
+    print(f"항목 1000개 교체(제거 + 추가): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
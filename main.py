@@ -6,6 +6,7 @@ import subprocess
 from datetime import datetime
 
 from repositories.todo_repository import TodoRepository
+from repositories.clipboard_repository import ClipboardRepository
 from services.todo_service import TodoService
 from services.screenshot_service import ScreenshotService
 from services.config_service import ConfigService
@@ -15,6 +16,7 @@ from services.launcher_service import LauncherService
 from services.formatter_service import FormatterService
 from services.template_service import TemplateService
 from services.translate_service import TranslateService
+from services.maintenance_service import MaintenanceService
 
 from ui.todo_frame import TodoFrame
 from ui.clipboard_frame import ClipboardFrame
@@ -64,9 +66,16 @@ class Application(BaseTk):
         # --- Services ---
         self.config_service = ConfigService()
         self.todo_service = TodoService(repository=TodoRepository(db_path="todos.db"))
+        # 유지보수/가져오기 작업 스레드가 바꾼 색인은 Tk 스레드에서 정리
+        self.todo_service.call_on_ui = lambda fn: self.after(0, fn)
         self.screenshot_service = ScreenshotService(config_service=self.config_service)
         self.ocr_service = OCRService(tesseract_cmd_path=self.config_service.get('tesseract_cmd_path'))
-        self.clipboard_service = ClipboardService(root=self, on_change_callback=None)
+        # clipboard_watch_primary: X11에서 마우스로 선택한 텍스트(PRIMARY)도 히스토리에 기록
+        watch_primary = bool(self.config_service.get('clipboard_watch_primary') or False)
+        self.clipboard_service = ClipboardService(root=self, on_change_callback=None,
+                                                  repository=ClipboardRepository(db_path="clipboard.db"),
+                                                  selections=('CLIPBOARD', 'PRIMARY') if watch_primary
+                                                  else ('CLIPBOARD',))
         self.launcher_service = LauncherService()
         self.formatter_service = FormatterService()
         self.template_service = TemplateService()
@@ -233,6 +242,11 @@ class Application(BaseTk):
 
         # Start background services
         self.clipboard_service.start_monitoring()
+        # Todo 자동 보관 등 DB 유지보수: 시작 시 1회 + 설정 주기마다 (화면 갱신과 분리)
+        self.maintenance_service = MaintenanceService(
+            self, self.todo_service, self.config_service,
+            on_archived=lambda count: self.todo_frame.refresh_todos())
+        self.maintenance_service.start()
 
         # Enable Drag-and-Drop if available
         if _DND_AVAILABLE:
@@ -416,7 +430,7 @@ class Application(BaseTk):
                 messagebox.showwarning("추가 실패", "추가할 내용이 없습니다.")
                 return
             if hasattr(self.todo_service, 'add_from_text'):
-                count = self.todo_service.add_from_text(content)
+                count = self.todo_service.add_from_text(content, skip_existing=True)
                 messagebox.showinfo("TODO 추가", f"{count}건 추가했습니다.")
             else:
                 self.todo_service.add_todo(content.strip())
@@ -485,6 +499,20 @@ class Application(BaseTk):
         except Exception:
             pass
         finally:
+            # 하나가 실패해도 나머지 서비스의 남은 변경은 기록되도록 따로 정리
+            try:
+                if hasattr(self, 'maintenance_service'):
+                    self.maintenance_service.stop()
+            except Exception as e:
+                print(f"유지보수 작업 중지 중 오류 발생: {e}")
+            try:
+                self.todo_service.close()
+            except Exception as e:
+                print(f"할 일 저장 중 오류 발생: {e}")
+            try:
+                self.clipboard_service.close()
+            except Exception as e:
+                print(f"클립보드 히스토리 저장 중 오류 발생: {e}")
             self.destroy()
 
     def set_geometry_preset(self, w: int, h: int):
@@ -621,7 +649,7 @@ class Application(BaseTk):
         if choice:  # Todo
             count = 0
             if hasattr(self.todo_service, 'add_from_text'):
-                count = self.todo_service.add_from_text(text_payload)
+                count = self.todo_service.add_from_text(text_payload, skip_existing=True)
             else:
                 # 한 줄씩 추가
                 lines = [ln.strip() for ln in text_payload.splitlines() if ln.strip()]
@@ -726,7 +754,7 @@ class Application(BaseTk):
                     return
                 try:
                     if hasattr(self.todo_service, 'add_from_text'):
-                        count = self.todo_service.add_from_text(text)
+                        count = self.todo_service.add_from_text(text, skip_existing=True)
                         self.update_status(f"TODO {count}개 추가")
                     else:
                         self.todo_service.add_todo(text.strip())
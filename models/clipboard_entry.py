@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ClipboardEntry:
+    """
+    클립보드 히스토리 항목 하나
+    """
+    hash: str
+    content: str
+    size: int  # UTF-8 바이트 수 (용량 예산 계산용)
+    seq: int  # 마지막으로 복사된 순서 (클수록 최근)
+    copied_at: float  # 마지막으로 복사된 시각 (time.time())
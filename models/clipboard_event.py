@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from models.clipboard_entry import ClipboardEntry
+
+# ClipboardEvent.kind 값
+ADDED = 'added'  # 새 항목이 맨 앞에 추가됨
+MOVED = 'moved'  # 이미 있던 항목이 다시 복사되어 맨 앞으로 옮겨짐
+EVICTED = 'evicted'  # 히스토리 예산 때문에 제거됨
+
+
+@dataclass(slots=True)
+class ClipboardEvent:
+    """
+    클립보드 히스토리 변경 한 건 (ClipboardService.subscribe로 받음)
+    """
+    kind: str
+    entry: ClipboardEntry
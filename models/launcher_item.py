@@ -1,4 +1,6 @@
 class LauncherItem:
+    __slots__ = ('id', 'name', 'path', 'item_type')
+
     def __init__(self, id, name, path, item_type):
         self.id = id
         self.name = name
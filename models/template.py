@@ -1,4 +1,6 @@
 class Template:
+    __slots__ = ('id', 'title', 'content')
+
     def __init__(self, id, title, content):
         self.id = id
         self.title = title
@@ -1,11 +1,20 @@
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
-@dataclass
+# 내용 안의 #태그 (앞이 공백이거나 줄 처음, 숫자만으로 된 '#123'은 제외). 대소문자 구분 없이 소문자로 저장
+TAG_PATTERN = re.compile(r'(?<!\S)#(?!\d+(?:\s|$))([\w][\w\-/]*)')
+
+
+def extract_tags(content: str) -> List[str]:
+    """내용에서 태그를 중복 없이 순서대로 뽑습니다 (todo_tags 테이블에 저장되는 값)."""
+    return list(dict.fromkeys(m.lower() for m in TAG_PATTERN.findall(content or '')))
+
+@dataclass(slots=True)
 class Todo:
     """
-    Todo 항목을 위한 데이터 클래스
+    Todo 항목을 위한 데이터 클래스 (__slots__, 필드 순서는 저장소 SELECT 열 순서와 같음)
     """
     id: int
     content: str
@@ -14,3 +23,14 @@ class Todo:
     sort_order: int = 0
     parent_id: Optional[int] = None
     archived_at: Optional[str] = None
+    # 보관되지 않은 직계 자식 수 / 그 중 완료된 수 (DB 트리거가 유지)
+    child_total: int = 0
+    child_completed: int = 0
+    # 행 버전. 내용/상태/순서/부모/보관 값이 바뀔 때마다 1 증가 (동시 수정 충돌 감지용)
+    version: int = 0
+    # 마감/알림 시각 ('YYYY-MM-DD HH:MM', 로컬 시각)과 반복 규칙 (services.todo_scheduler.RECURRENCE_RULES)
+    due_at: Optional[str] = None
+    remind_at: Optional[str] = None
+    recurrence: Optional[str] = None
+    # 우선순위 (1 높음 ~ 3 낮음, 없으면 None)
+    priority: Optional[int] = None
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from models.todo import Todo
+
+
+@dataclass(slots=True)
+class TodoStats:
+    """
+    Todo 대시보드 집계 (todo_status_counts / todo_stats 테이블에서 읽음)
+    """
+    pending: int = 0
+    completed: int = 0
+    archived: int = 0
+    # 오래된 주부터 순서대로 (그 주 월요일 'YYYY-MM-DD', 추가 수, 완료 수)
+    weeks: List[Tuple[str, int, int]] = field(default_factory=list)
+    oldest_pending: Optional[Todo] = None
+
+    @staticmethod
+    def rate(created: int, completed: int) -> Optional[float]:
+        """한 주의 완료율 (완료 ÷ 추가, 추가가 없으면 None)."""
+        return completed / created if created > 0 else None
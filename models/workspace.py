@@ -1,4 +1,6 @@
 class Workspace:
+    __slots__ = ('id', 'name')
+
     def __init__(self, id, name):
         self.id = id
         self.name = name
@@ -0,0 +1,60 @@
+import sqlite3
+from typing import Iterable, List, Optional
+from models.clipboard_entry import ClipboardEntry
+from repositories.connection import SQLiteConnectionManager
+from repositories.migrations import CLIPBOARD_MIGRATIONS, run_migrations
+from repositories.row_mapping import map_all
+
+
+class ClipboardRepository:
+    """
+    클립보드 히스토리를 저장하는 저장소 (내용 해시가 키)
+    """
+    def __init__(self, db_path: str):
+        """
+        :param db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._db = SQLiteConnectionManager(db_path)
+        with self._db.lock:
+            run_migrations(self._db.get_connection(), CLIPBOARD_MIGRATIONS)
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다. 앱 종료 시 호출합니다."""
+        self._db.close()
+
+    def load_recent(self, limit: Optional[int] = None) -> List[ClipboardEntry]:
+        """
+        최근에 복사된 순서로 항목을 읽습니다.
+        :param limit: 최대 개수 (None이면 전부)
+        """
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "SELECT hash, content, size, seq, copied_at FROM clipboard_history ORDER BY seq DESC LIMIT ?",
+                (-1 if limit is None else limit,)
+            )
+            return map_all(cursor, ClipboardEntry)
+
+    def apply_batch(self, upserts: Iterable[ClipboardEntry], deletes: Iterable[str]) -> None:
+        """
+        추가/순서 변경과 삭제를 한 트랜잭션으로 기록합니다.
+        이미 있는 해시는 내용을 다시 쓰지 않고 순서(seq)와 시각만 바꿉니다.
+        :param upserts: 추가하거나 맨 앞으로 옮긴 항목
+        :param deletes: 제거할 항목의 해시
+        """
+        with self._db.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO clipboard_history (hash, content, size, seq, copied_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(hash) DO UPDATE SET seq = excluded.seq, copied_at = excluded.copied_at",
+                ((e.hash, e.content, e.size, e.seq, e.copied_at) for e in upserts)
+            )
+            conn.executemany("DELETE FROM clipboard_history WHERE hash = ?", ((h,) for h in deletes))
+
+    def delete_older_than(self, seq: int) -> int:
+        """seq가 주어진 값보다 작은 항목을 지웁니다 (예산이 줄어 시작 시 잘린 항목 정리용)."""
+        try:
+            with self._db.transaction() as conn:
+                return conn.execute("DELETE FROM clipboard_history WHERE seq < ?", (seq,)).rowcount
+        except sqlite3.Error as e:
+            print(f"클립보드 히스토리 정리 중 오류 발생: {e}")
+            return 0
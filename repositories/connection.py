@@ -0,0 +1,99 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class SQLiteConnectionManager:
+    """
+    하나의 SQLite 파일에 대한 장기(persistent) 연결을 관리합니다.
+    작업마다 connect/close 하지 않고 연결을 재사용하며, 여러 스레드에서 호출되어도
+    내부 락으로 직렬화합니다.
+    """
+    def __init__(self, db_path: str, busy_timeout_ms: int = 5000, synchronous: str = 'NORMAL',
+                 cached_statements: int = 256):
+        """
+        :param db_path: SQLite 데이터베이스 파일 경로
+        :param busy_timeout_ms: 다른 프로세스가 잠금을 잡고 있을 때 대기할 최대 시간(ms)
+        :param synchronous: PRAGMA synchronous 값 (WAL 모드에서는 NORMAL 권장)
+        :param cached_statements: sqlite3 모듈의 prepared statement 캐시 크기
+        """
+        self.db_path = db_path
+        self.busy_timeout_ms = int(busy_timeout_ms)
+        self.synchronous = synchronous
+        self.cached_statements = int(cached_statements)
+        self._conn = None
+        self._lock = threading.RLock()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000.0,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms}")
+        # :memory: DB 등 WAL을 지원하지 않는 경우 SQLite가 기존 모드를 그대로 돌려줌
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        return conn
+
+    def get_connection(self) -> sqlite3.Connection:
+        """연결을 반환합니다. 아직 열리지 않았다면 새로 엽니다."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open()
+            return self._conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        락을 잡은 상태로 하나의 트랜잭션을 실행합니다.
+        블록이 정상 종료되면 commit, 예외가 발생하면 rollback 합니다.
+        """
+        with self._lock:
+            conn = self.get_connection()
+            with conn:
+                yield conn
+
+    @contextmanager
+    def reader(self):
+        """
+        긴 읽기(내보내기 등)용 별도 연결을 열어 읽기 트랜잭션 하나로 사용합니다.
+        WAL 모드이므로 읽는 동안에도 공유 연결의 쓰기는 막히지 않고, 읽는 쪽은 시작 시점의 스냅샷을 봅니다.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000.0)
+        try:
+            conn.execute("BEGIN")
+            yield conn
+        finally:
+            conn.close()
+
+    def data_version(self) -> int:
+        """
+        PRAGMA data_version 값을 반환합니다. 다른 연결(다른 프로세스 포함)이 커밋할 때마다 바뀌고,
+        이 연결 자신의 쓰기로는 바뀌지 않으므로 외부 변경 감지에 씁니다. 파일을 읽지 않아 가볍습니다.
+        """
+        with self._lock:
+            return self.get_connection().execute("PRAGMA data_version").fetchone()[0]
+
+    @property
+    def lock(self):
+        return self._lock
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def close(self) -> None:
+        """연결을 닫습니다. 이후 호출 시 필요하면 다시 엽니다."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    # 통계가 없거나 오래된 테이블만 다시 분석 (부분 색인처럼 통계가 있어야 고르는 색인용)
+                    self._conn.execute("PRAGMA optimize")
+                    # 종료 시 WAL 내용을 본 파일에 반영
+                    self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error:
+                    pass
+                self._conn.close()
+                self._conn = None
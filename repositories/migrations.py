@@ -0,0 +1,626 @@
+"""
+PRAGMA user_version 기반 스키마 마이그레이션.
+
+각 데이터베이스 파일은 순서가 있는 단계(step) 목록을 가지며, user_version 에는
+마지막으로 적용된 단계 수가 기록됩니다. 아직 적용되지 않은 단계만 하나의
+트랜잭션 안에서 실행하므로, 스키마가 최신이면 시작 시 DDL 이 전혀 실행되지 않습니다.
+
+새 단계는 항상 목록 끝에 추가하고, 이미 배포된 단계는 수정하지 않습니다.
+"""
+import sqlite3
+from typing import Callable, List, Sequence
+from models.todo import extract_tags
+
+Migration = Callable[[sqlite3.Connection], None]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(conn: sqlite3.Connection, migrations: Sequence[Migration]) -> int:
+    """
+    적용되지 않은 마이그레이션 단계를 한 트랜잭션으로 실행합니다.
+    :param conn: 대상 연결 (진행 중인 트랜잭션이 없어야 함)
+    :param migrations: 버전 순서대로 정렬된 단계 목록
+    :return: 실행 후 스키마 버전
+    """
+    current = get_schema_version(conn)
+    target = len(migrations)
+    if current >= target:
+        return current
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # 다른 프로세스가 먼저 올렸을 수 있으므로 잠금 후 다시 확인
+        current = get_schema_version(conn)
+        for step in migrations[current:]:
+            step(conn)
+        conn.execute(f"PRAGMA user_version = {target}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return target
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [info[1] for info in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+
+
+def _add_column_if_missing(conn: sqlite3.Connection, table: str, column: str, ddl: str) -> None:
+    if column not in _columns(conn, table):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+
+
+# --- todos.db ---
+
+def _todos_v1_base(conn: sqlite3.Connection) -> None:
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS todos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            sort_order INTEGER DEFAULT 0,
+            parent_id INTEGER NULL,
+            archived_at TIMESTAMP NULL
+        )
+    ''')
+    # 정렬/계층/보관 컬럼이 없던 구버전 DB 보정
+    _add_column_if_missing(conn, 'todos', 'sort_order', "INTEGER DEFAULT 0")
+    _add_column_if_missing(conn, 'todos', 'parent_id', "INTEGER NULL")
+    _add_column_if_missing(conn, 'todos', 'archived_at', "TIMESTAMP NULL")
+
+
+def _todos_v2_indexes(conn: sqlite3.Connection) -> None:
+    # 부모별 자식 조회 + 다음 sort_order 계산(MAX) 용
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todos_parent ON todos(parent_id, archived_at, sort_order)")
+    # 상태 필터 + 완료 항목 자동 보관(created_at 범위) 용
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todos_status ON todos(status, archived_at, created_at)")
+    # 보관/미보관 구분 조회 용
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todos_archived ON todos(archived_at)")
+
+
+def _todos_v3_maintenance_runs(conn: sqlite3.Connection) -> None:
+    # 유지보수 작업별 마지막 실행 시각 (주기 안의 반복 실행을 건너뛰기 위함)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS maintenance_runs (
+            task TEXT PRIMARY KEY,
+            last_run_at TIMESTAMP NOT NULL
+        )
+    ''')
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    try:
+        return bool(conn.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()[0])
+    except sqlite3.Error:
+        return False
+
+
+def _todos_v4_fulltext(conn: sqlite3.Connection) -> None:
+    # FTS5가 없는 SQLite 빌드에서는 건너뛰고, 검색은 LIKE로 대체됨
+    # (나중에 FTS5가 있는 빌드에서 열면 ensure_fulltext가 색인을 만듦)
+    if not fts5_available(conn):
+        return
+    # rowid = todos.id 인 독립 색인 (트리거로 동기화)
+    conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS todos_fts "
+                 "USING fts5(content, tokenize='unicode61', prefix='1 2 3')")
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_fts_ai AFTER INSERT ON todos BEGIN
+            INSERT INTO todos_fts(rowid, content) VALUES (NEW.id, NEW.content);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_fts_ad AFTER DELETE ON todos BEGIN
+            DELETE FROM todos_fts WHERE rowid = OLD.id;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_fts_au AFTER UPDATE OF content ON todos BEGIN
+            UPDATE todos_fts SET content = NEW.content WHERE rowid = NEW.id;
+        END
+    ''')
+    conn.execute("DELETE FROM todos_fts")
+    conn.execute("INSERT INTO todos_fts(rowid, content) SELECT id, content FROM todos")
+
+
+# 형제 사이 순서값 간격. 이동 시 앞뒤 항목 사이 값을 쓰므로 이동한 행 하나만 갱신됨
+RANK_GAP = 1024
+# 이동 후 앞뒤 간격이 이보다 작으면 형제 순서값을 다시 매김
+MIN_RANK_GAP = 16
+
+
+def _todos_v5_rank_gaps(conn: sqlite3.Connection) -> None:
+    # 1, 2, 3... 으로 촘촘한 기존 sort_order를 부모별로 RANK_GAP 간격으로 다시 매김 (보관 항목 포함)
+    rows = conn.execute("SELECT id, parent_id FROM todos ORDER BY parent_id, sort_order, id").fetchall()
+    updates = []
+    prev_parent, rank = object(), 0
+    for todo_id, parent_id in rows:
+        if parent_id != prev_parent:
+            prev_parent, rank = parent_id, 0
+        rank += RANK_GAP
+        updates.append((rank, todo_id))
+    conn.executemany("UPDATE todos SET sort_order = ? WHERE id = ?", updates)
+
+
+def _todos_v6_hierarchy(conn: sqlite3.Connection) -> None:
+    # 부모가 사라진 고아 항목은 최상위로 올림 (이전 delete_many가 남긴 것)
+    conn.execute("UPDATE todos SET parent_id = NULL WHERE parent_id IS NOT NULL "
+                 "AND parent_id NOT IN (SELECT id FROM todos)")
+
+    # 클로저 테이블: 모든 (조상, 자손, 거리) 쌍. 자기 자신도 거리 0으로 포함
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS todo_closure (
+            ancestor INTEGER NOT NULL,
+            descendant INTEGER NOT NULL,
+            depth INTEGER NOT NULL,
+            PRIMARY KEY (ancestor, descendant)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todo_closure_descendant ON todo_closure(descendant, depth)")
+    conn.execute("DELETE FROM todo_closure")
+    conn.execute('''
+        INSERT OR IGNORE INTO todo_closure (ancestor, descendant, depth)
+        WITH RECURSIVE tree(ancestor, descendant, depth) AS (
+            SELECT id, id, 0 FROM todos
+            UNION ALL
+            -- 깊이 제한: 잘못된 데이터에 순환이 있어도 마이그레이션이 끝나도록
+            SELECT tree.ancestor, t.id, tree.depth + 1 FROM tree JOIN todos t ON t.parent_id = tree.descendant
+             WHERE tree.depth < 256
+        )
+        SELECT ancestor, descendant, depth FROM tree
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todo_closure_ai AFTER INSERT ON todos BEGIN
+            INSERT INTO todo_closure (ancestor, descendant, depth)
+                SELECT ancestor, NEW.id, depth + 1 FROM todo_closure WHERE descendant = NEW.parent_id
+                UNION ALL SELECT NEW.id, NEW.id, 0;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todo_closure_ad AFTER DELETE ON todos BEGIN
+            DELETE FROM todo_closure WHERE descendant = OLD.id;
+        END
+    ''')
+    # 부모가 바뀌면 하위 트리 전체를 옛 조상에서 떼어내 새 조상에 붙임
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todo_closure_au AFTER UPDATE OF parent_id ON todos
+        WHEN OLD.parent_id IS NOT NEW.parent_id BEGIN
+            DELETE FROM todo_closure
+             WHERE descendant IN (SELECT descendant FROM todo_closure WHERE ancestor = NEW.id)
+               AND ancestor NOT IN (SELECT descendant FROM todo_closure WHERE ancestor = NEW.id);
+            INSERT INTO todo_closure (ancestor, descendant, depth)
+                SELECT up.ancestor, sub.descendant, up.depth + sub.depth + 1
+                  FROM todo_closure up, todo_closure sub
+                 WHERE up.descendant = NEW.parent_id AND sub.ancestor = NEW.id;
+        END
+    ''')
+
+    # 진행률: 보관되지 않은 직계 자식 수 / 그 중 완료 수 (트리거로 증감)
+    _add_column_if_missing(conn, 'todos', 'child_total', "INTEGER NOT NULL DEFAULT 0")
+    _add_column_if_missing(conn, 'todos', 'child_completed', "INTEGER NOT NULL DEFAULT 0")
+    conn.execute('''
+        UPDATE todos SET
+            child_total = (SELECT COUNT(*) FROM todos c WHERE c.parent_id = todos.id AND c.archived_at IS NULL),
+            child_completed = (SELECT COUNT(*) FROM todos c WHERE c.parent_id = todos.id AND c.archived_at IS NULL
+                               AND c.status = 'completed')
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todo_counts_ai AFTER INSERT ON todos
+        WHEN NEW.parent_id IS NOT NULL AND NEW.archived_at IS NULL BEGIN
+            UPDATE todos SET child_total = child_total + 1,
+                             child_completed = child_completed + (NEW.status = 'completed')
+             WHERE id = NEW.parent_id;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todo_counts_ad AFTER DELETE ON todos
+        WHEN OLD.parent_id IS NOT NULL AND OLD.archived_at IS NULL BEGIN
+            UPDATE todos SET child_total = child_total - 1,
+                             child_completed = child_completed - (OLD.status = 'completed')
+             WHERE id = OLD.parent_id;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todo_counts_au AFTER UPDATE OF parent_id, status, archived_at ON todos
+        WHEN OLD.parent_id IS NOT NEW.parent_id OR OLD.status IS NOT NEW.status
+          OR (OLD.archived_at IS NULL) != (NEW.archived_at IS NULL) BEGIN
+            UPDATE todos SET child_total = child_total - 1,
+                             child_completed = child_completed - (OLD.status = 'completed')
+             WHERE id = OLD.parent_id AND OLD.archived_at IS NULL;
+            UPDATE todos SET child_total = child_total + 1,
+                             child_completed = child_completed + (NEW.status = 'completed')
+             WHERE id = NEW.parent_id AND NEW.archived_at IS NULL;
+        END
+    ''')
+
+
+def _todos_v7_cold_archive(conn: sqlite3.Connection) -> None:
+    # 보관 항목을 옮겨 두는 콜드 테이블. 자동 보관 작업이 배치 단위로 옮기므로 todos에는 사용 중인 항목만 남음
+    # ID는 todos에서 그대로 가져옴 (todos의 AUTOINCREMENT가 재사용을 막으므로 두 테이블 사이에 겹치지 않음)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS todos_archive (
+            id INTEGER PRIMARY KEY,
+            content TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TIMESTAMP,
+            sort_order INTEGER DEFAULT 0,
+            parent_id INTEGER NULL,
+            archived_at TIMESTAMP NOT NULL,
+            child_total INTEGER NOT NULL DEFAULT 0,
+            child_completed INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    # 보관함 페이지 ((archived_at, id) keyset) / 하위 트리 탐색 용
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todos_archive_archived ON todos_archive(archived_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todos_archive_parent ON todos_archive(parent_id)")
+    # 보관 항목까지 포함하는 조회용
+    conn.execute('''
+        CREATE VIEW IF NOT EXISTS todos_all AS
+            SELECT id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed
+              FROM todos
+            UNION ALL
+            SELECT id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed
+              FROM todos_archive
+    ''')
+
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'todos_fts'").fetchone() is None:
+        return
+    _fulltext_archive_triggers(conn)
+
+
+def _fulltext_archive_triggers(conn: sqlite3.Connection) -> None:
+    # 전문 색인은 두 테이블이 함께 씀 (rowid = id). 테이블 사이를 옮기는 동안에는 색인 행을 지우지 않도록,
+    # 반대편 테이블에 같은 ID가 있으면 추가/삭제를 건너뜀
+    conn.execute("DROP TRIGGER IF EXISTS todos_fts_ai")
+    conn.execute("DROP TRIGGER IF EXISTS todos_fts_ad")
+    conn.execute('''
+        CREATE TRIGGER todos_fts_ai AFTER INSERT ON todos
+        WHEN NOT EXISTS (SELECT 1 FROM todos_archive WHERE id = NEW.id) BEGIN
+            INSERT INTO todos_fts(rowid, content) VALUES (NEW.id, NEW.content);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER todos_fts_ad AFTER DELETE ON todos
+        WHEN NOT EXISTS (SELECT 1 FROM todos_archive WHERE id = OLD.id) BEGIN
+            DELETE FROM todos_fts WHERE rowid = OLD.id;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_archive_fts_ai AFTER INSERT ON todos_archive
+        WHEN NOT EXISTS (SELECT 1 FROM todos WHERE id = NEW.id) BEGIN
+            INSERT INTO todos_fts(rowid, content) VALUES (NEW.id, NEW.content);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_archive_fts_ad AFTER DELETE ON todos_archive
+        WHEN NOT EXISTS (SELECT 1 FROM todos WHERE id = OLD.id) BEGIN
+            DELETE FROM todos_fts WHERE rowid = OLD.id;
+        END
+    ''')
+
+
+def _todos_v8_row_versions(conn: sqlite3.Connection) -> None:
+    # 낙관적 동시성 제어용 행 버전. 쓰기 지연 기록은 읽었던 버전과 비교한 뒤 직접 올리고,
+    # 버전을 지정하지 않는 쓰기(다른 프로세스/스크립트, 일괄 UPDATE)는 트리거가 올림
+    _add_column_if_missing(conn, 'todos', 'version', "INTEGER NOT NULL DEFAULT 0")
+    _add_column_if_missing(conn, 'todos_archive', 'version', "INTEGER NOT NULL DEFAULT 0")
+    conn.execute("DROP VIEW IF EXISTS todos_all")
+    conn.execute('''
+        CREATE VIEW todos_all AS
+            SELECT id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed,
+                   version
+              FROM todos
+            UNION ALL
+            SELECT id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed,
+                   version
+              FROM todos_archive
+    ''')
+    # 자식 카운터 변경은 사용자의 수정이 아니므로 버전을 올리지 않음
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_version_au
+        AFTER UPDATE OF content, status, sort_order, parent_id, archived_at ON todos
+        WHEN NEW.version = OLD.version AND (OLD.content IS NOT NEW.content OR OLD.status IS NOT NEW.status
+          OR OLD.sort_order IS NOT NEW.sort_order OR OLD.parent_id IS NOT NEW.parent_id
+          OR OLD.archived_at IS NOT NEW.archived_at) BEGIN
+            UPDATE todos SET version = OLD.version + 1 WHERE id = NEW.id;
+        END
+    ''')
+
+
+def _todos_v9_schedule(conn: sqlite3.Connection) -> None:
+    # 마감/알림 시각('YYYY-MM-DD HH:MM', 로컬 시각)과 반복 규칙 ('daily', 'weekly' 등)
+    for table in ('todos', 'todos_archive'):
+        _add_column_if_missing(conn, table, 'due_at', "TEXT NULL")
+        _add_column_if_missing(conn, table, 'remind_at', "TEXT NULL")
+        _add_column_if_missing(conn, table, 'recurrence', "TEXT NULL")
+    # 시각 범위 조회(오늘/지연, 다음 알림)는 TodoIndex의 정렬 목록으로 처리하므로 DB 색인은 두지 않음
+    conn.execute("DROP VIEW IF EXISTS todos_all")
+    conn.execute('''
+        CREATE VIEW todos_all AS
+            SELECT id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed,
+                   version, due_at, remind_at, recurrence
+              FROM todos
+            UNION ALL
+            SELECT id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed,
+                   version, due_at, remind_at, recurrence
+              FROM todos_archive
+    ''')
+    # 일정 변경도 버전을 올림
+    conn.execute("DROP TRIGGER IF EXISTS todos_version_au")
+    conn.execute('''
+        CREATE TRIGGER todos_version_au
+        AFTER UPDATE OF content, status, sort_order, parent_id, archived_at, due_at, remind_at, recurrence ON todos
+        WHEN NEW.version = OLD.version AND (OLD.content IS NOT NEW.content OR OLD.status IS NOT NEW.status
+          OR OLD.sort_order IS NOT NEW.sort_order OR OLD.parent_id IS NOT NEW.parent_id
+          OR OLD.archived_at IS NOT NEW.archived_at OR OLD.due_at IS NOT NEW.due_at
+          OR OLD.remind_at IS NOT NEW.remind_at OR OLD.recurrence IS NOT NEW.recurrence) BEGIN
+            UPDATE todos SET version = OLD.version + 1 WHERE id = NEW.id;
+        END
+    ''')
+
+
+def _todos_v10_tags(conn: sqlite3.Connection) -> None:
+    # 우선순위 (1 높음 ~ 3 낮음)
+    for table in ('todos', 'todos_archive'):
+        _add_column_if_missing(conn, table, 'priority', "INTEGER NULL")
+    conn.execute("DROP VIEW IF EXISTS todos_all")
+    conn.execute('''
+        CREATE VIEW todos_all AS
+            SELECT id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed,
+                   version, due_at, remind_at, recurrence, priority
+              FROM todos
+            UNION ALL
+            SELECT id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed,
+                   version, due_at, remind_at, recurrence, priority
+              FROM todos_archive
+    ''')
+    conn.execute("DROP TRIGGER IF EXISTS todos_version_au")
+    conn.execute('''
+        CREATE TRIGGER todos_version_au
+        AFTER UPDATE OF content, status, sort_order, parent_id, archived_at, due_at, remind_at, recurrence, priority
+        ON todos
+        WHEN NEW.version = OLD.version AND (OLD.content IS NOT NEW.content OR OLD.status IS NOT NEW.status
+          OR OLD.sort_order IS NOT NEW.sort_order OR OLD.parent_id IS NOT NEW.parent_id
+          OR OLD.archived_at IS NOT NEW.archived_at OR OLD.due_at IS NOT NEW.due_at
+          OR OLD.remind_at IS NOT NEW.remind_at OR OLD.recurrence IS NOT NEW.recurrence
+          OR OLD.priority IS NOT NEW.priority) BEGIN
+            UPDATE todos SET version = OLD.version + 1 WHERE id = NEW.id;
+        END
+    ''')
+    # 내용의 #태그를 (tag, todo_id)로 정규화. 태그 조건 조회는 PK 범위 검색끼리의 INTERSECT가 되고,
+    # 항목별 삭제/다시 쓰기는 todo_id 색인을 씀. 보관(콜드 테이블 이동) 중에도 유지되며,
+    # 두 테이블 어디에도 없는 항목이 되면 지움 (FTS 트리거와 같은 규칙)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS todo_tags (
+            tag TEXT NOT NULL,
+            todo_id INTEGER NOT NULL,
+            PRIMARY KEY (tag, todo_id)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todo_tags_todo ON todo_tags(todo_id)")
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_tags_ad AFTER DELETE ON todos
+        WHEN NOT EXISTS (SELECT 1 FROM todos_archive WHERE id = OLD.id) BEGIN
+            DELETE FROM todo_tags WHERE todo_id = OLD.id;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_archive_tags_ad AFTER DELETE ON todos_archive
+        WHEN NOT EXISTS (SELECT 1 FROM todos WHERE id = OLD.id) BEGIN
+            DELETE FROM todo_tags WHERE todo_id = OLD.id;
+        END
+    ''')
+    rows = conn.execute("SELECT id, content FROM todos_all WHERE content LIKE '%#%'").fetchall()
+    conn.executemany(
+        "INSERT OR IGNORE INTO todo_tags (tag, todo_id) VALUES (?, ?)",
+        ((tag, tid) for tid, content in rows for tag in extract_tags(content))
+    )
+
+
+def _todos_v11_stats(conn: sqlite3.Connection) -> None:
+    # 대시보드용 집계. 항목 수와 관계없이 몇 행만 읽도록 트리거가 유지함
+    # todo_status_counts: 현재 상태별 항목 수 (보관 항목은 상태와 관계없이 'archived', 콜드 테이블 포함)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS todo_status_counts (
+            status TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    ''')
+    # todo_stats: 로컬 날짜별 버킷. created = 그날 만들어져 지금도 있는(보관 포함) 항목 수,
+    # completed = 그날 완료로 바뀐 횟수에서 미완료로 되돌린 횟수를 뺀 값
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS todo_stats (
+            day TEXT PRIMARY KEY,
+            created INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    ''')
+    conn.execute("DELETE FROM todo_status_counts")
+    conn.execute("DELETE FROM todo_stats")
+    conn.execute("""
+        INSERT INTO todo_status_counts (status, count)
+        SELECT s.status, (SELECT COUNT(*) FROM todos WHERE archived_at IS NULL AND status = s.status)
+          FROM (SELECT 'pending' AS status UNION ALL SELECT 'completed') s
+        UNION ALL
+        SELECT 'archived', (SELECT COUNT(*) FROM todos WHERE archived_at IS NOT NULL)
+                           + (SELECT COUNT(*) FROM todos_archive)
+    """)
+    # 지난 완료 시각은 기록이 없으므로 created만 채움
+    conn.execute("""
+        INSERT INTO todo_stats (day, created)
+        SELECT date(created_at, 'localtime'), COUNT(*) FROM todos_all
+         GROUP BY 1 HAVING date(created_at, 'localtime') IS NOT NULL
+    """)
+    # 상태 버킷: 보관이면 'archived', 아니면 status
+    bucket = "CASE WHEN {row}.archived_at IS NOT NULL THEN 'archived' ELSE {row}.status END"
+    new_bucket, old_bucket = bucket.format(row='NEW'), bucket.format(row='OLD')
+    # 콜드 테이블로 옮기거나 되살릴 때는 두 테이블에 잠시 함께 있으므로 created는 바꾸지 않음 (FTS 트리거와 같은 규칙)
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS todos_stats_ai AFTER INSERT ON todos BEGIN
+            UPDATE todo_status_counts SET count = count + 1 WHERE status = {new_bucket};
+            INSERT INTO todo_stats (day, created)
+            SELECT date(NEW.created_at, 'localtime'), 1
+             WHERE NOT EXISTS (SELECT 1 FROM todos_archive WHERE id = NEW.id)
+            ON CONFLICT(day) DO UPDATE SET created = created + 1;
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS todos_stats_ad AFTER DELETE ON todos BEGIN
+            UPDATE todo_status_counts SET count = count - 1 WHERE status = {old_bucket};
+            UPDATE todo_stats SET created = created - 1
+             WHERE day = date(OLD.created_at, 'localtime')
+               AND NOT EXISTS (SELECT 1 FROM todos_archive WHERE id = OLD.id);
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS todos_stats_au AFTER UPDATE OF status, archived_at ON todos
+        WHEN OLD.status IS NOT NEW.status OR (OLD.archived_at IS NULL) != (NEW.archived_at IS NULL) BEGIN
+            UPDATE todo_status_counts SET count = count - 1 WHERE status = {old_bucket};
+            UPDATE todo_status_counts SET count = count + 1 WHERE status = {new_bucket};
+            INSERT INTO todo_stats (day, completed)
+            SELECT date('now', 'localtime'), CASE WHEN NEW.status = 'completed' THEN 1 ELSE -1 END
+             WHERE OLD.status IS NOT NEW.status AND 'completed' IN (OLD.status, NEW.status)
+            ON CONFLICT(day) DO UPDATE SET completed = completed + excluded.completed;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_archive_stats_ai AFTER INSERT ON todos_archive BEGIN
+            UPDATE todo_status_counts SET count = count + 1 WHERE status = 'archived';
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS todos_archive_stats_ad AFTER DELETE ON todos_archive BEGIN
+            UPDATE todo_status_counts SET count = count - 1 WHERE status = 'archived';
+            UPDATE todo_stats SET created = created - 1
+             WHERE day = date(OLD.created_at, 'localtime') AND NOT EXISTS (SELECT 1 FROM todos WHERE id = OLD.id);
+        END
+    ''')
+
+
+def ensure_fulltext(conn: sqlite3.Connection) -> bool:
+    """
+    마이그레이션 후 호출합니다. FTS5가 없는 빌드에서 v4 단계가 건너뛴 전문 색인을, 지금 빌드에 FTS5가 있으면
+    최신 스키마 기준(콜드 테이블 트리거 포함)으로 만들고 두 테이블의 기존 항목으로 채웁니다.
+    색인이 이미 있으면 sqlite_master 한 행만 읽습니다.
+    :param conn: 대상 연결 (진행 중인 트랜잭션이 없어야 함)
+    :return: 전문 색인이 있는지
+    """
+    exists = "SELECT 1 FROM sqlite_master WHERE name = 'todos_fts'"
+    if conn.execute(exists).fetchone() is not None:
+        return True
+    if not fts5_available(conn):
+        return False
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # 다른 프로세스가 먼저 만들었을 수 있으므로 잠금 후 다시 확인
+        if conn.execute(exists).fetchone() is None:
+            _todos_v4_fulltext(conn)
+            _fulltext_archive_triggers(conn)
+            conn.execute("INSERT INTO todos_fts(rowid, content) SELECT id, content FROM todos_archive")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return True
+
+
+def _todos_v12_schedule_indexes(conn: sqlite3.Connection) -> None:
+    # 마감/알림 시각 범위 조회용 부분 색인. 앱 안의 조회는 TodoIndex 정렬 목록을 쓰지만, 같은 DB를 여는
+    # 다른 프로세스/스크립트의 조회(WHERE due_at < ? AND archived_at IS NULL)는 DB 색인이 필요함.
+    # 일정이 있는 사용 중 항목만 담으므로 대부분의 행은 색인에 들어가지 않고 쓰기 비용도 거의 늘지 않음
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todos_due ON todos(due_at) "
+                 "WHERE due_at IS NOT NULL AND archived_at IS NULL")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todos_remind ON todos(remind_at) "
+                 "WHERE remind_at IS NOT NULL AND archived_at IS NULL")
+
+
+TODOS_MIGRATIONS: List[Migration] = [
+    _todos_v1_base,
+    _todos_v2_indexes,
+    _todos_v3_maintenance_runs,
+    _todos_v4_fulltext,
+    _todos_v5_rank_gaps,
+    _todos_v6_hierarchy,
+    _todos_v7_cold_archive,
+    _todos_v8_row_versions,
+    _todos_v9_schedule,
+    _todos_v10_tags,
+    _todos_v11_stats,
+    _todos_v12_schedule_indexes,
+]
+
+
+# --- config.db (workspaces / launcher_items / templates) ---
+
+_LAUNCHER_ITEMS_DDL = '''
+    CREATE TABLE IF NOT EXISTS launcher_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        path TEXT NOT NULL,
+        item_type TEXT NOT NULL CHECK(item_type IN ('file', 'folder', 'url')),
+        workspace_id INTEGER,
+        FOREIGN KEY (workspace_id) REFERENCES workspaces (id)
+    )
+'''
+
+
+def _config_v1_base(conn: sqlite3.Connection) -> None:
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS workspaces (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS templates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL UNIQUE,
+            content TEXT NOT NULL
+        )
+    ''')
+    # 'url' 타입이 없던 구버전 launcher_items 는 새 CHECK 제약으로 재생성
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='launcher_items'").fetchone()
+    if row and "CHECK(item_type IN ('file', 'folder'))" in row[0]:
+        conn.execute("ALTER TABLE launcher_items RENAME TO launcher_items_old")
+        conn.execute(_LAUNCHER_ITEMS_DDL)
+        # workspace_id 가 없는 더 오래된 스키마도 있으므로 공통 컬럼만 한 번에 복사
+        cols = ", ".join(c for c in _columns(conn, 'launcher_items_old') if c in _columns(conn, 'launcher_items'))
+        conn.execute(f"INSERT INTO launcher_items ({cols}) SELECT {cols} FROM launcher_items_old")
+        conn.execute("DROP TABLE launcher_items_old")
+    else:
+        conn.execute(_LAUNCHER_ITEMS_DDL)
+
+
+def _config_v2_indexes(conn: sqlite3.Connection) -> None:
+    # get_items_by_workspace: WHERE workspace_id = ? ORDER BY name
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_launcher_items_workspace ON launcher_items(workspace_id, name)")
+
+
+CONFIG_MIGRATIONS: List[Migration] = [
+    _config_v1_base,
+    _config_v2_indexes,
+]
+
+
+# --- clipboard.db ---
+
+def _clipboard_v1_history(conn: sqlite3.Connection) -> None:
+    # hash: 내용의 blake2b 해시 (같은 내용은 한 행), seq: 마지막으로 복사된 순서 (클수록 최근)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS clipboard_history (
+            hash TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            seq INTEGER NOT NULL,
+            copied_at REAL NOT NULL
+        )
+    ''')
+    # 시작 시 최근 순으로 읽기
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_clipboard_history_seq ON clipboard_history(seq)")
+
+
+CLIPBOARD_MIGRATIONS: List[Migration] = [
+    _clipboard_v1_history,
+]
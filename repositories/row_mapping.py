@@ -0,0 +1,31 @@
+"""
+저장소 공용 행 매핑.
+SELECT 열 순서를 모델 생성자 인자 순서와 같게 두고, 커서를 모델 생성자에 바로 넘겨(starmap) 객체를 만듭니다.
+fetchall() 튜플 목록과 그것을 다시 도는 리스트 컴프리헨션을 거치지 않으므로 행마다 한 번만 변환합니다.
+"""
+from itertools import starmap
+from typing import Callable, Iterator, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+# 지연 조회(iter_*)가 한 번에 가져오는 행 수
+FETCH_BATCH_SIZE = 1000
+
+
+def map_all(rows, model: Callable[..., T]) -> List[T]:
+    """실행한 커서(또는 행 목록)의 모든 행을 모델 목록으로 만듭니다."""
+    return list(starmap(model, rows))
+
+
+def map_one(cursor, model: Callable[..., T]) -> Optional[T]:
+    row = cursor.fetchone()
+    return model(*row) if row is not None else None
+
+
+def iter_mapped(cursor, model: Callable[..., T], batch_size: int = FETCH_BATCH_SIZE) -> Iterator[T]:
+    """batch_size개씩 가져와 하나씩 돌려줍니다. 행 수와 관계없이 메모리 사용이 일정합니다."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from starmap(model, rows)
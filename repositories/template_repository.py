@@ -1,20 +1,13 @@
 import sqlite3
+from models.template import Template
+from repositories.migrations import CONFIG_MIGRATIONS, run_migrations
+from repositories.row_mapping import map_all, map_one
 
 class TemplateRepository:
     def __init__(self, db_path='config.db'):
         self.conn = sqlite3.connect(db_path)
         self.cursor = self.conn.cursor()
-        self.create_table()
-
-    def create_table(self):
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS templates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL UNIQUE,
-                content TEXT NOT NULL
-            )
-        ''')
-        self.conn.commit()
+        run_migrations(self.conn, CONFIG_MIGRATIONS)
 
     def add_template(self, title, content):
         try:
@@ -26,11 +19,11 @@ class TemplateRepository:
 
     def get_all_templates(self):
         self.cursor.execute("SELECT id, title, content FROM templates ORDER BY title")
-        return self.cursor.fetchall()
+        return map_all(self.cursor, Template)
 
     def get_template(self, template_id):
         self.cursor.execute("SELECT id, title, content FROM templates WHERE id = ?", (template_id,))
-        return self.cursor.fetchone()
+        return map_one(self.cursor, Template)
 
     def update_template(self, template_id, title, content):
         try:
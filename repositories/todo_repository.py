@@ -1,7 +1,113 @@
-
+import re
 import sqlite3
-from typing import List, Optional
-from models.todo import Todo
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from models.todo import Todo, extract_tags
+from repositories.connection import SQLiteConnectionManager
+from repositories.migrations import RANK_GAP, TODOS_MIGRATIONS, ensure_fulltext, run_migrations
+from repositories.row_mapping import FETCH_BATCH_SIZE, iter_mapped, map_all, map_one
+
+# IN (...) 절 하나에 넣는 최대 바인딩 수 (SQLite 변수 개수 제한 이하)
+_IN_CHUNK_SIZE = 500
+# Todo 필드 순서와 같음 (행을 Todo(*row)로 바로 만듦)
+_TODO_COLUMNS = ("id, content, status, created_at, sort_order, parent_id, archived_at, child_total, child_completed, "
+                 "version, due_at, remind_at, recurrence, priority")
+
+
+# 내보내기/가져오기 파일의 열 (순서대로)
+EXPORT_FIELDS = ("id", "parent_id", "content", "status", "created_at", "sort_order", "archived_at",
+                 "due_at", "remind_at", "recurrence", "priority")
+
+
+def _prefixed_columns(alias: str) -> str:
+    return ", ".join(f"{alias}.{c.strip()}" for c in _TODO_COLUMNS.split(","))
+
+
+def _parents_first(todos: List[Todo]) -> List[Todo]:
+    """같은 묶음 안의 부모가 자식보다 먼저 오도록 정렬합니다 (클로저 트리거가 부모 행을 참조하므로)."""
+    by_id = {t.id: t for t in todos}
+    depth: Dict[int, int] = {}
+
+    def depth_of(t: Todo) -> int:
+        chain = []
+        while t.id not in depth and t.parent_id in by_id and len(chain) <= len(by_id):
+            chain.append(t)
+            t = by_id[t.parent_id]
+        d = depth.setdefault(t.id, 0)
+        for c in reversed(chain):
+            d += 1
+            depth[c.id] = d
+        return depth[chain[0].id] if chain else d
+
+    return sorted(todos, key=depth_of)
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+# 대량 작업 대상 ID를 담는 임시 테이블. IN (?, ?, ...) 대신 이 테이블과 조인하므로
+# 선택 항목 수와 관계없이 바인딩 변수 개수 제한에 걸리지 않고 문장 크기도 일정함
+_SELECTED_IDS = "SELECT id FROM temp.todo_ids"
+
+
+def _load_ids(cur, todo_ids: Iterable[int]) -> None:
+    """
+    _SELECTED_IDS 임시 테이블을 주어진 ID로 채웁니다 (중복 제거).
+    같은 연결의 잠금 안(한 트랜잭션)에서 채우고 바로 사용해야 합니다.
+    """
+    cur.execute("CREATE TEMP TABLE IF NOT EXISTS todo_ids (id INTEGER PRIMARY KEY)")
+    cur.execute("DELETE FROM temp.todo_ids")
+    cur.executemany("INSERT OR IGNORE INTO temp.todo_ids (id) VALUES (?)", ((tid,) for tid in todo_ids))
+
+
+def _normalize_tags(tags: Iterable[str]) -> List[str]:
+    """'#Work', 'work' 같은 입력을 todo_tags에 저장된 형태로 (중복 제거, 순서 유지)."""
+    return list(dict.fromkeys(t.lower().lstrip('#') for t in tags if t and t.strip('#')))
+
+
+def _insert_tags(cur, todos: Iterable[Tuple[int, str]]) -> None:
+    """(id, content) 목록의 #태그를 todo_tags에 추가합니다 (이미 있으면 무시)."""
+    cur.executemany(
+        "INSERT OR IGNORE INTO todo_tags (tag, todo_id) VALUES (?, ?)",
+        ((tag, tid) for tid, content in todos if '#' in (content or '') for tag in extract_tags(content))
+    )
+
+
+# 선택 항목과 그 모든 자손을 고르는 WHERE 조건 (클로저 테이블 사용, _load_ids 후)
+_SUBTREE_CLAUSE = f"id IN (SELECT descendant FROM todo_closure WHERE ancestor IN ({_SELECTED_IDS}))"
+
+# 선택 항목과 모든 자손(down)을 두 테이블(todos, todos_archive)에 걸쳐 찾는 재귀 CTE 본문 (_load_ids 후).
+# 콜드 테이블에는 클로저 행이 없으므로 parent_id를 따라감
+_DOWN_CTE = f"""down(id) AS (
+        SELECT id FROM todos WHERE id IN ({_SELECTED_IDS})
+        UNION SELECT id FROM todos_archive WHERE id IN ({_SELECTED_IDS})
+        UNION SELECT t.id FROM todos t JOIN down ON t.parent_id = down.id
+        UNION SELECT a.id FROM todos_archive a JOIN down ON a.parent_id = down.id)"""
+# 선택 항목과 모든 조상(up)
+_UP_CTE = f"""up(id, parent_id) AS (
+        SELECT id, parent_id FROM todos WHERE id IN ({_SELECTED_IDS})
+        UNION SELECT id, parent_id FROM todos_archive WHERE id IN ({_SELECTED_IDS})
+        UNION SELECT t.id, t.parent_id FROM todos t JOIN up ON t.id = up.parent_id
+        UNION SELECT a.id, a.parent_id FROM todos_archive a JOIN up ON a.id = up.parent_id)"""
+
+
+# 자동 보관 대상: 기준일보다 오래된 완료 항목 중, 하위에 미완료 항목이 없는 것과 그 하위 트리 전체
+_ARCHIVE_COMPLETED_SQL = """
+    UPDATE todos SET archived_at = CURRENT_TIMESTAMP
+     WHERE archived_at IS NULL AND id IN (
+        SELECT c.descendant FROM todos r JOIN todo_closure c ON c.ancestor = r.id
+         WHERE r.archived_at IS NULL AND r.status = 'completed' AND r.created_at < datetime('now', ?)
+           AND NOT EXISTS (
+               SELECT 1 FROM todo_closure c2 JOIN todos d ON d.id = c2.descendant
+                WHERE c2.ancestor = r.id AND d.archived_at IS NULL AND d.status != 'completed'))
+"""
+
 
 class TodoRepository:
     """
@@ -13,150 +119,674 @@ class TodoRepository:
         :param db_path: SQLite 데이터베이스 파일 경로
         """
         self.db_path = db_path
-        self._create_table()
-        # Ensure new columns exist for advanced features
+        self._db = SQLiteConnectionManager(db_path)
         self._migrate()
 
-    def _get_connection(self):
-        """데이터베이스 연결을 반환합니다."""
-        return sqlite3.connect(self.db_path)
+    def _get_connection(self) -> sqlite3.Connection:
+        """장기 연결을 반환합니다 (작업마다 새로 열지 않음)."""
+        return self._db.get_connection()
 
-    def _create_table(self):
-        """
-        'todos' 테이블이 없으면 생성합니다.
-        """
-        conn = self._get_connection()
-        try:
-            with conn:
-                conn.execute('''
-                    CREATE TABLE IF NOT EXISTS todos (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        content TEXT NOT NULL,
-                        status TEXT NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        sort_order INTEGER DEFAULT 0,
-                        parent_id INTEGER NULL,
-                        archived_at TIMESTAMP NULL
-                    )
-                ''')
-        finally:
-            conn.close()
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다. 앱 종료 시 호출합니다."""
+        self._db.close()
 
     def _migrate(self):
-        """Add missing columns for older databases (SQLite ALTER TABLE ADD COLUMN is idempotent)."""
-        conn = self._get_connection()
-        try:
-            with conn:
-                cur = conn.cursor()
-                for sql in (
-                    "ALTER TABLE todos ADD COLUMN sort_order INTEGER DEFAULT 0",
-                    "ALTER TABLE todos ADD COLUMN parent_id INTEGER NULL",
-                    "ALTER TABLE todos ADD COLUMN archived_at TIMESTAMP NULL",
-                ):
-                    try:
-                        cur.execute(sql)
-                    except Exception:
-                        # Ignore if column already exists
-                        pass
-        finally:
-            conn.close()
+        """스키마를 최신 버전으로 올립니다. 이미 최신이면 DDL을 실행하지 않습니다."""
+        with self._db.lock:
+            conn = self._get_connection()
+            run_migrations(conn, TODOS_MIGRATIONS)
+            self._has_fts = ensure_fulltext(conn)
+
+    @staticmethod
+    def _next_rank(cur, parent_id: Optional[int]) -> int:
+        """부모의 마지막 자식 뒤에 올 순서값 (간격 RANK_GAP)."""
+        cur.execute("SELECT COALESCE(MAX(sort_order), 0) FROM todos WHERE parent_id IS ? AND archived_at IS NULL",
+                    (parent_id,))
+        return (cur.fetchone()[0] or 0) + RANK_GAP
 
     # --- Advanced CRUD helpers ---
-    def create_advanced(self, content: str, parent_id: Optional[int] = None):
-        conn = self._get_connection()
-        try:
-            with conn:
-                cur = conn.cursor()
-                # next sort order within same parent
-                if parent_id is None:
-                    cur.execute("SELECT COALESCE(MAX(sort_order), 0) + 1 FROM todos WHERE parent_id IS NULL AND archived_at IS NULL")
-                else:
-                    cur.execute("SELECT COALESCE(MAX(sort_order), 0) + 1 FROM todos WHERE parent_id = ? AND archived_at IS NULL", (parent_id,))
-                next_order = cur.fetchone()[0] or 1
+    def create_advanced(self, content: str, parent_id: Optional[int] = None, priority: Optional[int] = None,
+                        due_at: Optional[str] = None):
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            # next sort order within same parent
+            next_order = self._next_rank(cur, parent_id)
 
-                cur.execute(
-                    "INSERT INTO todos (content, status, sort_order, parent_id) VALUES (?, 'pending', ?, ?)",
-                    (content, next_order, parent_id)
-                )
-                new_id = cur.lastrowid
-                cur.execute("SELECT id, content, status, created_at, sort_order, parent_id, archived_at FROM todos WHERE id = ?", (new_id,))
-                row = cur.fetchone()
-                if row:
-                    return Todo(id=row[0], content=row[1], status=row[2], created_at=row[3], sort_order=row[4], parent_id=row[5], archived_at=row[6])
-                return None
-        finally:
-            conn.close()
+            cur.execute(
+                "INSERT INTO todos (content, status, sort_order, parent_id, priority, due_at) "
+                "VALUES (?, 'pending', ?, ?, ?, ?)",
+                (content, next_order, parent_id, priority, due_at)
+            )
+            new_id = cur.lastrowid
+            _insert_tags(cur, [(new_id, content)])
+            cur.execute(f"SELECT {_TODO_COLUMNS} FROM todos WHERE id = ?", (new_id,))
+            return map_one(cur, Todo)
+
+    def bulk_create(self, contents: List[str], parent_id: Optional[int] = None,
+                    skip_existing: bool = False) -> List[int]:
+        """
+        여러 할 일을 한 트랜잭션으로 추가합니다. 다음 sort_order는 한 번만 계산합니다.
+        :param contents: 추가할 내용 목록 (입력 순서대로 정렬됨)
+        :param parent_id: 상위 항목 ID (None이면 최상위)
+        :param skip_existing: 같은 부모 아래 이미 있는(보관되지 않은) 내용과 입력 내 중복을 건너뜀
+        :return: 실제로 추가된 항목의 ID 목록 (입력 순서)
+        """
+        if not contents:
+            return []
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            if skip_existing:
+                existing = set()
+                unique = list(dict.fromkeys(contents))
+                for i in range(0, len(unique), _IN_CHUNK_SIZE):
+                    chunk = unique[i:i + _IN_CHUNK_SIZE]
+                    qmarks = ",".join(["?"] * len(chunk))
+                    cur.execute(
+                        "SELECT content FROM todos WHERE parent_id IS ? AND archived_at IS NULL "
+                        f"AND content IN ({qmarks})",
+                        [parent_id, *chunk]
+                    )
+                    existing.update(r[0] for r in cur.fetchall())
+                contents = [c for c in unique if c not in existing]
+                if not contents:
+                    return []
+            start = self._next_rank(cur, parent_id)
+            cur.executemany(
+                "INSERT INTO todos (content, status, sort_order, parent_id) VALUES (?, 'pending', ?, ?)",
+                [(content, start + i * RANK_GAP, parent_id) for i, content in enumerate(contents)]
+            )
+            # 같은 트랜잭션 안의 AUTOINCREMENT 삽입이므로 ID는 연속됨
+            last_id = cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+            ids = list(range(last_id - len(contents) + 1, last_id + 1))
+            _insert_tags(cur, zip(ids, contents))
+            return ids
+
+    @staticmethod
+    def _source(show_archived: bool) -> str:
+        """조회 대상 테이블. 보관 항목까지 보려면 콜드 테이블을 합친 todos_all 뷰를 읽습니다."""
+        return "todos_all" if show_archived else "todos"
+
+    def _all_advanced_query(self, status_filter: Optional[str], show_archived: bool) -> Tuple[str, list]:
+        q = f"SELECT {_TODO_COLUMNS} FROM {self._source(show_archived)}"
+        clauses = []
+        params = []
+        if not show_archived:
+            clauses.append("archived_at IS NULL")
+        if status_filter in ('pending','completed'):
+            clauses.append("status = ?")
+            params.append(status_filter)
+        if clauses:
+            q += " WHERE " + " AND ".join(clauses)
+        # 부모별로 묶어 형제 순서대로 (최상위 먼저). 트리 구성은 parent_id로 함
+        q += " ORDER BY parent_id IS NOT NULL, parent_id, sort_order, id"
+        return q, params
 
     def get_all_advanced(self, status_filter: Optional[str] = None, show_archived: bool = False) -> List[Todo]:
-        conn = self._get_connection()
-        try:
-            with conn:
-                cur = conn.cursor()
-                q = "SELECT id, content, status, created_at, sort_order, parent_id, archived_at FROM todos"
-                clauses = []
-                params = []
-                if not show_archived:
-                    clauses.append("archived_at IS NULL")
-                if status_filter in ('pending','completed'):
-                    clauses.append("status = ?")
-                    params.append(status_filter)
-                if clauses:
-                    q += " WHERE " + " AND ".join(clauses)
-                q += " ORDER BY COALESCE(parent_id, id) ASC, sort_order ASC, created_at ASC"
-                cur.execute(q, params)
-                rows = cur.fetchall()
-                return [Todo(id=r[0], content=r[1], status=r[2], created_at=r[3], sort_order=r[4], parent_id=r[5], archived_at=r[6]) for r in rows]
-        finally:
-            conn.close()
+        q, params = self._all_advanced_query(status_filter, show_archived)
+        with self._db.transaction() as conn:
+            return map_all(conn.execute(q, params), Todo)
+
+    def iter_all_advanced(self, status_filter: Optional[str] = None, show_archived: bool = False,
+                          batch_size: int = FETCH_BATCH_SIZE) -> Iterator[Todo]:
+        """
+        get_all_advanced와 같은 순서로 하나씩 돌려줍니다. 별도 읽기 연결의 스냅샷에서 batch_size개씩 읽으므로
+        전체 목록을 만들지 않고, 도는 동안 공유 연결의 잠금도 잡지 않습니다.
+        """
+        q, params = self._all_advanced_query(status_filter, show_archived)
+        with self._db.reader() as conn:
+            yield from iter_mapped(conn.execute(q, params), Todo, batch_size)
+
+    @staticmethod
+    def _filter_clauses(status_filter: Optional[str], show_archived: bool, alias: str = ''):
+        clauses, params = [], []
+        if not show_archived:
+            clauses.append(f"{alias}archived_at IS NULL")
+        if status_filter in ('pending', 'completed'):
+            clauses.append(f"{alias}status = ?")
+            params.append(status_filter)
+        return clauses, params
+
+    def get_many(self, todo_ids: List[int]) -> List[Todo]:
+        """ID 목록에 해당하는 항목을 조회합니다 (없는 ID는 무시)."""
+        todos = []
+        with self._db.transaction() as conn:
+            for i in range(0, len(todo_ids), _IN_CHUNK_SIZE):
+                chunk = todo_ids[i:i + _IN_CHUNK_SIZE]
+                qmarks = ",".join(["?"] * len(chunk))
+                todos.extend(map_all(
+                    conn.execute(f"SELECT {_TODO_COLUMNS} FROM todos WHERE id IN ({qmarks})", chunk), Todo))
+        return todos
+
+    def get_children(self, parent_id: Optional[int], status_filter: Optional[str] = None, show_archived: bool = False,
+                     after: Optional[Tuple[int, int]] = None, start_at: Optional[Tuple[int, int]] = None,
+                     before: Optional[Tuple[int, int]] = None, limit: Optional[int] = None) -> List[Todo]:
+        """
+        한 부모의 직계 자식만 (sort_order, id) 순으로 조회합니다. parent_id가 None이면 최상위 항목입니다.
+        :param after: 이 (sort_order, id) 키 다음부터 조회 (keyset 페이지네이션)
+        :param start_at: 이 키를 포함하여 조회 (현재 창 다시 읽기 용)
+        :param before: 이 키 이전 항목을 조회 (역방향 페이지)
+        :param limit: 최대 조회 건수
+        """
+        clauses, params = self._filter_clauses(status_filter, show_archived)
+        if parent_id is None:
+            clauses.append("parent_id IS NULL")
+        else:
+            clauses.append("parent_id = ?")
+            params.append(parent_id)
+        if after is not None:
+            clauses.append("(sort_order, id) > (?, ?)")
+            params.extend(after)
+        if start_at is not None:
+            clauses.append("(sort_order, id) >= (?, ?)")
+            params.extend(start_at)
+        if before is not None:
+            clauses.append("(sort_order, id) < (?, ?)")
+            params.extend(before)
+        direction = "DESC" if before is not None else "ASC"
+        q = (f"SELECT {_TODO_COLUMNS} FROM {self._source(show_archived)} WHERE " + " AND ".join(clauses)
+             + f" ORDER BY sort_order {direction}, id {direction}")
+        if limit is not None:
+            q += " LIMIT ?"
+            params.append(int(limit))
+        with self._db.transaction() as conn:
+            todos = map_all(conn.execute(q, params), Todo)
+        if before is not None:
+            todos.reverse()
+        return todos
+
+    def ids_with_children(self, parent_ids: List[int], status_filter: Optional[str] = None,
+                          show_archived: bool = False) -> Set[int]:
+        """주어진 항목 중 (필터 조건에 맞는) 자식이 하나 이상 있는 항목의 ID 집합을 반환합니다."""
+        if not parent_ids:
+            return set()
+        clauses, params = self._filter_clauses(status_filter, show_archived)
+        qmarks = ",".join(["?"] * len(parent_ids))
+        clauses.append(f"parent_id IN ({qmarks})")
+        params.extend(parent_ids)
+        with self._db.transaction() as conn:
+            rows = conn.execute(f"SELECT DISTINCT parent_id FROM {self._source(show_archived)} WHERE "
+                                + " AND ".join(clauses), params).fetchall()
+        return {r[0] for r in rows}
+
+    def search(self, query: str, limit: int = 50, include_archived: bool = False,
+               status_filter: Optional[str] = None, tags: Optional[List[str]] = None) -> List[Todo]:
+        """
+        내용 전문 검색. 입력한 각 단어를 접두어로 보고 모두 포함하는 항목을 관련도 순으로 반환합니다.
+        상태/태그 조건도 같은 쿼리에서 걸러내므로 limit은 모든 조건을 만족하는 항목에 적용됩니다.
+        :param query: 검색어 (공백으로 구분된 단어)
+        :param limit: 최대 결과 수
+        :param include_archived: 보관된 항목 포함 여부
+        :param status_filter: 'pending' 또는 'completed'면 해당 상태만
+        :param tags: 모두 가져야 하는 태그 목록
+        """
+        terms = re.findall(r"\w+", query or '')
+        if not terms:
+            return []
+        # 보관 항목을 포함하면 콜드 테이블도 같은 조건으로 읽어 합침
+        tables = ("todos", "todos_archive") if include_archived else ("todos",)
+        extra = "" if include_archived else " AND t.archived_at IS NULL"
+        extra_params: list = []
+        if status_filter in ('pending', 'completed'):
+            extra += " AND t.status = ?"
+            extra_params.append(status_filter)
+        for tag in _normalize_tags(tags or []):
+            extra += " AND EXISTS (SELECT 1 FROM todo_tags g WHERE g.tag = ? AND g.todo_id = t.id)"
+            extra_params.append(tag)
+        with self._db.transaction() as conn:
+            if self._has_fts:
+                match = " ".join(f'"{term}"*' for term in terms)
+                q = " UNION ALL ".join(
+                    f"SELECT {_prefixed_columns('t')}, f.rank FROM todos_fts f JOIN {table} t ON t.id = f.rowid "
+                    f"WHERE todos_fts MATCH ?{extra}" for table in tables)
+                # 정렬용 rank 열은 바깥 SELECT에서 빼서 행이 Todo 필드와 맞게 함
+                return map_all(conn.execute(
+                    f"SELECT {_TODO_COLUMNS} FROM ({q}) ORDER BY rank LIMIT ?",
+                    [*([match, *extra_params] * len(tables)), int(limit)]
+                ), Todo)
+            likes = " AND ".join(["t.content LIKE ?"] * len(terms))
+            q = " UNION ALL ".join(
+                f"SELECT {_prefixed_columns('t')} FROM {table} t WHERE {likes}{extra}" for table in tables)
+            return map_all(conn.execute(
+                q + " ORDER BY id DESC LIMIT ?",
+                [*([*(f"%{term}%" for term in terms), *extra_params] * len(tables)), int(limit)]
+            ), Todo)
 
     def update_status_bulk(self, todo_ids: List[int], status: str) -> int:
+        """
+        여러 항목의 상태를 한 문장으로 바꿉니다. ID 수에 제한이 없습니다 (임시 테이블 조인).
+        :return: 실제로 바뀐 행 수
+        """
         if not todo_ids:
             return 0
-        conn = self._get_connection()
-        try:
-            with conn:
-                cur = conn.cursor()
-                qmarks = ",".join(["?"]*len(todo_ids))
-                cur.execute(f"UPDATE todos SET status = ? WHERE id IN ({qmarks})", [status, *todo_ids])
-                return cur.rowcount
-        finally:
-            conn.close()
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            _load_ids(cur, todo_ids)
+            cur.execute(f"UPDATE todos SET status = ? WHERE status != ? AND id IN ({_SELECTED_IDS})", (status, status))
+            return cur.rowcount
+
+    def delete_many(self, todo_ids: List[int]) -> List[Todo]:
+        """
+        항목과 그 하위 트리 전체(보관된 자손과 콜드 테이블로 옮겨진 항목 포함)를 삭제합니다.
+        :return: 삭제된 행 (되돌리기 기록용, 콜드 쪽 행 먼저)
+        """
+        if not todo_ids:
+            return []
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            # 콜드 쪽 자손은 todos의 부모를 거쳐 찾으므로 todos보다 먼저 지움
+            _load_ids(cur, todo_ids)
+            cold = f"todos_archive WHERE id IN (WITH RECURSIVE {_DOWN_CTE} SELECT id FROM down)"
+            removed = map_all(cur.execute(f"SELECT {_TODO_COLUMNS} FROM {cold}"), Todo)
+            cur.execute(f"DELETE FROM {cold}")
+            removed += map_all(cur.execute(f"SELECT {_TODO_COLUMNS} FROM todos WHERE {_SUBTREE_CLAUSE}"), Todo)
+            cur.execute(f"DELETE FROM todos WHERE {_SUBTREE_CLAUSE}")
+            return removed
 
-    def delete_many(self, todo_ids: List[int]) -> int:
+    def archive_subtrees(self, todo_ids: List[int]) -> int:
+        """항목과 모든 하위 항목을 한 문장으로 보관합니다. 보관된 행 수를 반환합니다."""
         if not todo_ids:
             return 0
-        conn = self._get_connection()
-        try:
-            with conn:
-                cur = conn.cursor()
-                qmarks = ",".join(["?"]*len(todo_ids))
-                cur.execute(f"DELETE FROM todos WHERE id IN ({qmarks})", todo_ids)
-                return cur.rowcount
-        finally:
-            conn.close()
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            _load_ids(cur, todo_ids)
+            cur.execute("UPDATE todos SET archived_at = CURRENT_TIMESTAMP "
+                        f"WHERE archived_at IS NULL AND {_SUBTREE_CLAUSE}")
+            return cur.rowcount
+
+    def complete_subtrees(self, todo_ids: List[int]) -> int:
+        """항목과 보관되지 않은 모든 하위 항목을 한 문장으로 완료 처리합니다. 바뀐 행 수를 반환합니다."""
+        if not todo_ids:
+            return 0
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            _load_ids(cur, todo_ids)
+            cur.execute("UPDATE todos SET status = 'completed' "
+                        f"WHERE status != 'completed' AND archived_at IS NULL AND {_SUBTREE_CLAUSE}")
+            return cur.rowcount
+
+    def move(self, todo_id: int, parent_id: Optional[int], sort_order: int,
+             reranked: Optional[Dict[int, int]] = None) -> bool:
+        """
+        항목을 parent_id 아래 sort_order 자리로 옮깁니다. 옮긴 행 하나만 갱신하며, 하위 트리는 클로저 트리거가 따라 옮깁니다.
+        :param reranked: 간격이 좁아져 형제를 다시 매기는 경우 id → 새 순서값 (같은 트랜잭션에서 기록)
+        :return: 성공 여부 (없는 항목이거나 자기 자신/자손 아래로 옮기려는 경우 False)
+        """
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "UPDATE todos SET parent_id = ?, sort_order = ? WHERE id = ? "
+                "AND NOT EXISTS (SELECT 1 FROM todo_closure WHERE ancestor = ? AND descendant = ?)",
+                (parent_id, sort_order, todo_id, todo_id, parent_id)
+            )
+            if cur.rowcount == 0:
+                return False
+            if reranked:
+                cur.executemany("UPDATE todos SET sort_order = ? WHERE id = ?",
+                                [(rank, tid) for tid, rank in reranked.items()])
+            return True
+
+    def iter_export_rows(self, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        모든 항목(보관 포함)을 EXPORT_FIELDS 순서의 튜플로 하나씩 돌려줍니다 (todos, 콜드 테이블 순으로 각각 ID 순).
+        기본 키 순서대로 읽으므로 정렬 단계가 없습니다. 이동한 항목은 부모보다 먼저 나올 수 있으며,
+        import_rows가 파일 끝까지 읽은 뒤 그런 부모 참조를 이어 줍니다.
+        별도 읽기 연결에서 batch_size개씩 가져오므로 항목 수와 관계없이 메모리 사용이 일정합니다.
+        """
+        columns = ", ".join(EXPORT_FIELDS)
+        with self._db.reader() as conn:
+            for table in ("todos", "todos_archive"):
+                cur = conn.execute(f"SELECT {columns} FROM {table} ORDER BY id")
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
 
-    def update_sort_orders(self, parent_id: Optional[int], ordered_ids: List[int]) -> None:
-        conn = self._get_connection()
+    def import_rows(self, rows: Iterable[dict], batch_size: int = 1000,
+                    progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        내보낸 행을 새 항목으로 추가합니다. batch_size개마다 한 트랜잭션으로 기록합니다.
+        ID는 새로 매기고, parent_id는 같은 파일에 있는 부모의 새 ID로 바꿉니다. 부모가 뒤에 나오는 행은
+        일단 최상위로 넣었다가 끝에서 부모 아래로 옮기고, 파일에 없는 부모를 가리키면 최상위로 둡니다.
+        최상위 항목은 기존 항목 뒤에 원래 순서대로 붙습니다.
+        :param rows: EXPORT_FIELDS 키를 가진 dict (content는 비어 있지 않아야 함)
+        :param progress: 배치마다 지금까지 추가한 건수로 호출
+        :return: 추가한 항목 수
+        """
+        # 옛 ID → 새 ID 대응표와 부모를 나중에 이을 행은 임시 테이블에 두어 파일 크기와 관계없이 메모리를 쓰지 않음
+        with self._db.transaction() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS todo_import_map "
+                         "(old_id INTEGER PRIMARY KEY, new_id INTEGER NOT NULL)")
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS todo_import_deferred "
+                         "(new_id INTEGER PRIMARY KEY, old_parent_id INTEGER NOT NULL, sort_order INTEGER)")
+            conn.execute("DELETE FROM temp.todo_import_map")
+            conn.execute("DELETE FROM temp.todo_import_deferred")
+            top_offset = conn.execute(
+                "SELECT COALESCE(MAX(sort_order), 0) FROM todos WHERE parent_id IS NULL").fetchone()[0]
+        total = 0
         try:
-            with conn:
-                cur = conn.cursor()
-                for idx, tid in enumerate(ordered_ids, start=1):
-                    cur.execute("UPDATE todos SET sort_order = ? WHERE id = ?", (idx, tid))
+            for batch in _batched(rows, batch_size):
+                with self._db.transaction() as conn:
+                    cur = conn.cursor()
+                    for r in batch:
+                        parent_id = None
+                        if r.get("parent_id") is not None:
+                            found = cur.execute("SELECT new_id FROM temp.todo_import_map WHERE old_id = ?",
+                                                (r["parent_id"],)).fetchone()
+                            parent_id = found[0] if found else None
+                        sort_order = r.get("sort_order") or 0
+                        cur.execute(
+                            "INSERT INTO todos (content, status, created_at, sort_order, parent_id, archived_at, "
+                            "due_at, remind_at, recurrence, priority) "
+                            "VALUES (?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?, ?, ?, ?, ?)",
+                            (r["content"], r.get("status") or 'pending', r.get("created_at"),
+                             sort_order + (top_offset if parent_id is None else 0), parent_id, r.get("archived_at"),
+                             r.get("due_at"), r.get("remind_at"), r.get("recurrence"), r.get("priority"))
+                        )
+                        new_id = cur.lastrowid
+                        _insert_tags(cur, [(new_id, r["content"])])
+                        if r.get("id") is not None:
+                            cur.execute("INSERT OR REPLACE INTO temp.todo_import_map (old_id, new_id) VALUES (?, ?)",
+                                        (r["id"], new_id))
+                        if parent_id is None and r.get("parent_id") is not None:
+                            cur.execute("INSERT INTO temp.todo_import_deferred (new_id, old_parent_id, sort_order) "
+                                        "VALUES (?, ?, ?)", (new_id, r["parent_id"], sort_order))
+                total += len(batch)
+                if progress:
+                    progress(total)
         finally:
-            conn.close()
+            with self._db.transaction() as conn:
+                self._link_deferred_parents(conn.cursor())
+                conn.execute("DROP TABLE IF EXISTS temp.todo_import_map")
+                conn.execute("DROP TABLE IF EXISTS temp.todo_import_deferred")
+        return total
 
-    def archive_completed_older_than_days(self, days: int) -> int:
-        conn = self._get_connection()
-        try:
-            with conn:
+    @staticmethod
+    def _link_deferred_parents(cur) -> None:
+        """가져오는 동안 부모보다 먼저 나온 행을 부모 아래로 옮깁니다 (클로저/카운터는 트리거가 맞춤)."""
+        links = cur.execute(
+            "SELECT d.new_id, m.new_id, d.sort_order FROM temp.todo_import_deferred d "
+            "JOIN temp.todo_import_map m ON m.old_id = d.old_parent_id ORDER BY d.new_id"
+        ).fetchall()
+        for todo_id, parent_id, sort_order in links:
+            # 파일의 부모 관계가 순환하면 그 고리는 최상위로 남김
+            if cur.execute("SELECT 1 FROM todo_closure WHERE ancestor = ? AND descendant = ?",
+                           (todo_id, parent_id)).fetchone():
+                continue
+            cur.execute("UPDATE todos SET parent_id = ?, sort_order = ? WHERE id = ?", (parent_id, sort_order, todo_id))
+
+    def get_archived_page(self, before: Optional[Tuple[str, int]] = None, since: Optional[str] = None,
+                          until: Optional[str] = None, limit: int = 100) -> List[Todo]:
+        """
+        보관된 항목을 최근 보관 순으로 한 페이지 조회합니다 ((archived_at, id) 기준 keyset).
+        보관 항목 수와 관계없이 인덱스에서 limit개만 읽습니다.
+        :param before: 이전 페이지 마지막 행의 (archived_at, id). 이 키보다 오래된 항목부터 조회
+        :param since: 보관 시각 하한 ('YYYY-MM-DD' 등, 포함)
+        :param until: 보관 시각 상한 (미포함)
+        :param limit: 최대 조회 건수
+        """
+        clauses, params = ["archived_at IS NOT NULL"], []
+        if since:
+            clauses.append("archived_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("archived_at < ?")
+            params.append(until)
+        if before is not None:
+            clauses.append("(archived_at, id) < (?, ?)")
+            params.extend(before)
+        params.append(int(limit))
+        # 아직 옮겨지지 않은 보관 항목(todos)과 콜드 테이블에서 각각 limit개를 읽어 합침
+        rows = []
+        with self._db.transaction() as conn:
+            for table in ("todos", "todos_archive"):
+                rows.extend(conn.execute(
+                    f"SELECT {_TODO_COLUMNS} FROM {table} WHERE " + " AND ".join(clauses)
+                    + " ORDER BY archived_at DESC, id DESC LIMIT ?",
+                    params
+                ).fetchall())
+        rows.sort(key=lambda r: (r[6], r[0]), reverse=True)
+        return map_all(rows[:int(limit)], Todo)
+
+    def restore_archived(self, todo_ids: List[int]) -> List[int]:
+        """
+        보관된 항목을 하위 항목과 함께 되살립니다. 보관된 조상도 함께 되살려 트리에서 보이게 합니다.
+        :return: 되살린 항목 ID 목록
+        """
+        if not todo_ids:
+            return []
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            _load_ids(cur, todo_ids)
+            family = [r[0] for r in cur.execute(
+                f"WITH RECURSIVE {_DOWN_CTE}, {_UP_CTE} SELECT id FROM down UNION SELECT id FROM up").fetchall()]
+            _load_ids(cur, family)
+            cold = map_all(
+                cur.execute(f"SELECT {_TODO_COLUMNS} FROM todos_archive WHERE id IN ({_SELECTED_IDS})"), Todo)
+            hot = [r[0] for r in cur.execute(
+                f"SELECT id FROM todos WHERE archived_at IS NOT NULL AND id IN ({_SELECTED_IDS})").fetchall()]
+            # 콜드 항목은 부모부터 todos로 되돌림 (자식 카운터는 트리거가 자식 삽입 때 다시 셈)
+            cur.executemany(
+                "INSERT INTO todos (id, content, status, created_at, sort_order, parent_id, version, due_at, "
+                "remind_at, recurrence, priority) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(t.id, t.content, t.status, t.created_at, t.sort_order, t.parent_id, t.version + 1, t.due_at,
+                  t.remind_at, t.recurrence, t.priority)
+                 for t in _parents_first(cold)]
+            )
+            cur.execute(f"DELETE FROM todos_archive WHERE id IN ({_SELECTED_IDS})")
+            cur.execute("UPDATE todos SET archived_at = NULL "
+                        f"WHERE archived_at IS NOT NULL AND id IN ({_SELECTED_IDS})")
+            # 보관 중에 부모가 삭제된 항목은 최상위로 올림
+            cur.execute(f"UPDATE todos SET parent_id = NULL WHERE id IN ({_SELECTED_IDS}) AND parent_id IS NOT NULL "
+                        "AND parent_id NOT IN (SELECT id FROM todos)")
+            return [t.id for t in cold] + hot
+
+    def move_archived_to_cold(self, batch_size: int = _IN_CHUNK_SIZE) -> int:
+        """
+        보관된 항목을 todos에서 콜드 테이블(todos_archive)로 옮깁니다. batch_size개마다 한 트랜잭션.
+        todos에 자식이 남지 않은 항목(자식이 이미 옮겨진 항목)만 고르므로 중간에 멈춰도 콜드 항목의 자손은
+        항상 콜드 쪽에 있습니다. 각 배치는 idx_todos_archived 범위를 색인 순서대로 읽고 자식 유무는
+        idx_todos_parent로 확인하므로 정렬 단계가 없습니다 (깊은 트리는 깊이만큼 배치가 나뉨).
+        :return: 옮긴 항목 수
+        """
+        moved = 0
+        while True:
+            with self._db.transaction() as conn:
                 cur = conn.cursor()
+                ids = [r[0] for r in cur.execute(
+                    "SELECT id FROM todos t WHERE archived_at IS NOT NULL "
+                    "AND NOT EXISTS (SELECT 1 FROM todos k WHERE k.parent_id = t.id) "
+                    "ORDER BY archived_at, id LIMIT ?",
+                    (int(batch_size),)
+                ).fetchall()]
+                if not ids:
+                    return moved
+                qmarks = ",".join(["?"] * len(ids))
+                # 보관 항목의 자식은 모두 보관 상태이므로 콜드 쪽 자식 카운터는 0
                 cur.execute(
-                    "UPDATE todos SET archived_at = CURRENT_TIMESTAMP WHERE archived_at IS NULL AND status = 'completed' AND created_at < datetime('now', ?)",
-                    (f'-{int(days)} days',)
+                    "INSERT INTO todos_archive (id, content, status, created_at, sort_order, parent_id, archived_at, "
+                    "version, due_at, remind_at, recurrence, priority) "
+                    "SELECT id, content, status, created_at, sort_order, parent_id, archived_at, version, "
+                    "due_at, remind_at, recurrence, priority "
+                    f"FROM todos WHERE id IN ({qmarks})",
+                    ids
                 )
-                return cur.rowcount
-        finally:
-            conn.close()
+                cur.execute(f"DELETE FROM todos WHERE id IN ({qmarks})", ids)
+                moved += len(ids)
+
+    def get_ancestors(self, todo_id: int) -> List[Todo]:
+        """최상위부터 바로 위 부모까지의 조상 목록."""
+        with self._db.transaction() as conn:
+            return map_all(conn.execute(
+                f"SELECT {_prefixed_columns('t')} FROM todo_closure c JOIN todos t ON t.id = c.ancestor "
+                "WHERE c.descendant = ? AND c.depth > 0 ORDER BY c.depth DESC",
+                (todo_id,)
+            ), Todo)
+
+    def get_subtree_ids(self, todo_ids: List[int]) -> List[int]:
+        """주어진 항목과 그 모든 자손의 ID 목록."""
+        if not todo_ids:
+            return []
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            _load_ids(cur, todo_ids)
+            rows = cur.execute(f"SELECT id FROM todos WHERE {_SUBTREE_CLAUSE}").fetchall()
+        return [r[0] for r in rows]
+
+    def apply_changes(self, states: Dict[int, Optional[Todo]],
+                      expected: Optional[Dict[int, Optional[int]]] = None) -> List[int]:
+        """
+        쓰기 지연 큐가 모은 최종 상태를 한 트랜잭션으로 기록합니다.
+        :param states: id → Todo(상태/순서/부모/보관/버전 값을 그대로 기록, 없으면 다시 삽입) 또는 None(삭제)
+        :param expected: id → 변경 전 DB에 있어야 할 행 버전 (None이면 행이 없어야 함).
+                         DB 값이 다르면 다른 곳에서 먼저 바뀐 것이므로 그 항목은 기록하지 않음
+        :return: 충돌로 기록하지 않은 항목 ID 목록
+        """
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            conflicts: List[int] = []
+            if expected:
+                _load_ids(cur, expected)
+                current = dict(cur.execute(f"SELECT id, version FROM todos WHERE id IN ({_SELECTED_IDS})").fetchall())
+                conflicts = [tid for tid, version in expected.items() if tid in states and current.get(tid) != version]
+                if conflicts:
+                    skipped = set(conflicts)
+                    states = {tid: t for tid, t in states.items() if tid not in skipped}
+            deletes = [tid for tid, t in states.items() if t is None]
+            upserts = _parents_first([t for t in states.values() if t is not None])
+            if deletes:
+                _load_ids(cur, deletes)
+                # 되돌린 삭제를 다시 실행할 때 그 사이 콜드 테이블로 옮겨진 보관 항목도 지움
+                cur.execute(f"DELETE FROM todos_archive WHERE id IN ({_SELECTED_IDS})")
+                cur.execute(f"DELETE FROM todos WHERE id IN ({_SELECTED_IDS})")
+            # 다시 삽입되는 행(되돌린 삭제)의 자식 카운터는 트리거가 자식 삽입 때 다시 셈
+            cur.executemany(
+                "INSERT INTO todos (id, content, status, created_at, sort_order, parent_id, archived_at, version, "
+                "due_at, remind_at, recurrence, priority) "
+                "VALUES (?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET status = excluded.status, sort_order = excluded.sort_order, "
+                "parent_id = excluded.parent_id, archived_at = excluded.archived_at, version = excluded.version, "
+                "due_at = excluded.due_at, remind_at = excluded.remind_at, recurrence = excluded.recurrence, "
+                "priority = excluded.priority",
+                [(t.id, t.content, t.status, t.created_at, t.sort_order, t.parent_id, t.archived_at, t.version,
+                  t.due_at, t.remind_at, t.recurrence, t.priority) for t in upserts]
+            )
+            # 내용은 바뀌지 않으므로 다시 삽입된 행(되돌린 삭제)의 태그만 채워짐
+            _insert_tags(cur, ((t.id, t.content) for t in upserts))
+            return conflicts
+
+    # --- Tags ---
+    def find_by_tags(self, tags: List[str], status_filter: Optional[str] = None,
+                     limit: Optional[int] = None, within: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        모든 태그를 가진 (보관되지 않은) 항목 ID를 최근 추가 순으로 반환합니다.
+        가장 드문 태그의 todo_tags PK 범위를 ID 역순으로 읽으면서 나머지 태그는 PK로 하나씩 확인하므로,
+        정렬 없이 limit개를 찾으면 멈추고 비용은 전체 항목 수가 아니라 그 태그의 항목 수에 비례합니다.
+        :param within: 주어지면 이 ID 중에서만 찾음 (limit은 이 조건까지 적용한 뒤에 자름)
+        """
+        tags = _normalize_tags(tags)
+        if not tags:
+            return []
+        with self._db.transaction() as conn:
+            counts = {tag: conn.execute("SELECT COUNT(*) FROM todo_tags WHERE tag = ?", (tag,)).fetchone()[0]
+                      for tag in tags}
+            tags.sort(key=counts.get)
+            if counts[tags[0]] == 0:
+                return []
+            sql = ("SELECT g.todo_id FROM todo_tags g JOIN todos t ON t.id = g.todo_id "
+                   "WHERE g.tag = ? AND t.archived_at IS NULL")
+            params: list = [tags[0]]
+            for tag in tags[1:]:
+                sql += " AND EXISTS (SELECT 1 FROM todo_tags o WHERE o.tag = ? AND o.todo_id = g.todo_id)"
+                params.append(tag)
+            if status_filter in ('pending', 'completed'):
+                sql += " AND t.status = ?"
+                params.append(status_filter)
+            if within is not None:
+                _load_ids(conn.cursor(), within)
+                sql += f" AND g.todo_id IN ({_SELECTED_IDS})"
+            sql += " ORDER BY g.todo_id DESC"
+            if limit is not None:
+                sql += " LIMIT ?"
+                params.append(int(limit))
+            return [r[0] for r in conn.execute(sql, params).fetchall()]
+
+    def get_tag_counts(self) -> List[Tuple[str, int]]:
+        """태그별 항목 수 (많은 순, 보관 항목 포함). todo_tags 색인만 읽습니다."""
+        with self._db.transaction() as conn:
+            return conn.execute(
+                "SELECT tag, COUNT(*) FROM todo_tags GROUP BY tag ORDER BY COUNT(*) DESC, tag"
+            ).fetchall()
+
+    def sync_tags(self, todo_ids: List[int]) -> None:
+        """항목들의 태그를 현재 내용에서 다시 만듭니다 (다른 프로세스가 내용을 바꾼 경우)."""
+        if not todo_ids:
+            return
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            _load_ids(cur, todo_ids)
+            cur.execute(f"DELETE FROM todo_tags WHERE todo_id IN ({_SELECTED_IDS})")
+            _insert_tags(cur, cur.execute(
+                f"SELECT id, content FROM todos_all WHERE id IN ({_SELECTED_IDS})").fetchall())
+
+    # --- Stats ---
+    def read_stats(self, since: str) -> Tuple[Dict[str, int], List[Tuple[str, int, int]], Optional[Todo]]:
+        """
+        대시보드 집계를 한 스냅샷에서 읽습니다. 트리거가 유지하는 집계 행과 색인 앞쪽 한 행만 읽고,
+        별도 읽기 연결을 쓰므로 작업 스레드가 공유 연결로 기록하는 동안에도 기다리지 않습니다.
+        :param since: 날짜별 집계 시작일 ('YYYY-MM-DD', 로컬 날짜)
+        :return: (상태별 항목 수 ('pending', 'completed', 'archived'), 날짜별 (day, created, completed),
+                  가장 오래된 미완료 항목)
+        """
+        with self._db.reader() as conn:
+            counts = dict(conn.execute("SELECT status, count FROM todo_status_counts").fetchall())
+            daily = conn.execute(
+                "SELECT day, created, completed FROM todo_stats WHERE day >= ? ORDER BY day", (since,)
+            ).fetchall()
+            # idx_todos_status 색인 앞쪽 한 행
+            oldest = map_one(conn.execute(
+                f"SELECT {_TODO_COLUMNS} FROM todos WHERE status = 'pending' AND archived_at IS NULL "
+                "ORDER BY created_at, id LIMIT 1"
+            ), Todo)
+        return counts, daily, oldest
+
+    def get_row_versions(self) -> List[Tuple[int, int, int, int]]:
+        """보관되지 않은 모든 항목의 (id, version, child_total, child_completed). 외부 변경과 색인을 비교하는 데 씁니다."""
+        with self._db.transaction() as conn:
+            return conn.execute(
+                "SELECT id, version, child_total, child_completed FROM todos WHERE archived_at IS NULL"
+            ).fetchall()
+
+    def data_version(self) -> int:
+        """다른 연결이 DB에 커밋할 때마다 바뀌는 값 (이 저장소 자신의 쓰기로는 바뀌지 않음)."""
+        return self._db.data_version()
+
+    def archive_completed_older_than_days(self, days: int) -> int:
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            cur.execute(_ARCHIVE_COMPLETED_SQL, (f'-{int(days)} days',))
+            return cur.rowcount
+
+    def archive_completed_if_due(self, days: int, min_interval_seconds: int) -> int:
+        """
+        마지막 실행 후 min_interval_seconds가 지났을 때만 완료 항목 자동 보관을 실행하고 실행 시각을 기록합니다.
+        :return: 보관된 항목 수 (건너뛴 경우 0)
+        """
+        with self._db.transaction() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT 1 FROM maintenance_runs WHERE task = 'archive_completed' AND last_run_at > datetime('now', ?)",
+                (f'-{int(min_interval_seconds)} seconds',)
+            )
+            if cur.fetchone():
+                return 0
+            cur.execute(_ARCHIVE_COMPLETED_SQL, (f'-{int(days)} days',))
+            archived = cur.rowcount
+            cur.execute(
+                "INSERT INTO maintenance_runs (task, last_run_at) VALUES ('archive_completed', CURRENT_TIMESTAMP) "
+                "ON CONFLICT(task) DO UPDATE SET last_run_at = excluded.last_run_at"
+            )
+            return archived
 
     def create(self, content: str) -> Optional[Todo]:
         """
@@ -164,39 +794,28 @@ class TodoRepository:
         :param content: 할 일 내용
         :return: 생성된 할 일 객체 또는 None
         """
-        conn = self._get_connection()
-        try:
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO todos (content, status) VALUES (?, ?)",
-                    (content, 'pending')
-                )
-                new_id = cursor.lastrowid
-                
-                # 방금 삽입된 행을 다시 조회하여 객체로 반환
-                cursor.execute("SELECT id, content, status, created_at FROM todos WHERE id = ?", (new_id,))
-                row = cursor.fetchone()
-                if row:
-                    return Todo(id=row[0], content=row[1], status=row[2], created_at=row[3])
-            return None
-        finally:
-            conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO todos (content, status) VALUES (?, ?)",
+                (content, 'pending')
+            )
+            new_id = cursor.lastrowid
+            _insert_tags(cursor, [(new_id, content)])
+
+            # 방금 삽입된 행을 다시 조회하여 객체로 반환
+            cursor.execute("SELECT id, content, status, created_at FROM todos WHERE id = ?", (new_id,))
+            return map_one(cursor, Todo)
 
     def get_all(self) -> List[Todo]:
         """
         모든 할 일 목록을 데이터베이스에서 가져옵니다.
         :return: Todo 객체 리스트
         """
-        conn = self._get_connection()
-        try:
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT id, content, status, created_at FROM todos ORDER BY created_at DESC")
-                rows = cursor.fetchall()
-                return [Todo(id=row[0], content=row[1], status=row[2], created_at=row[3]) for row in rows]
-        finally:
-            conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, content, status, created_at FROM todos ORDER BY created_at DESC")
+            return map_all(cursor, Todo)
 
     def update_status(self, todo_id: int, status: str) -> bool:
         """
@@ -205,29 +824,18 @@ class TodoRepository:
         :param status: 새로운 상태 ('pending' 또는 'completed')
         :return: 성공 여부
         """
-        conn = self._get_connection()
-        try:
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE todos SET status = ? WHERE id = ?",
-                    (status, todo_id)
-                )
-                return cursor.rowcount > 0
-        finally:
-            conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE todos SET status = ? WHERE id = ?",
+                (status, todo_id)
+            )
+            return cursor.rowcount > 0
 
     def delete(self, todo_id: int) -> bool:
         """
-        특정 할 일을 데이터베이스에서 삭제합니다.
+        특정 할 일을 하위 항목과 함께 데이터베이스에서 삭제합니다.
         :param todo_id: 삭제할 할 일의 ID
         :return: 성공 여부
         """
-        conn = self._get_connection()
-        try:
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
-                return cursor.rowcount > 0
-        finally:
-            conn.close()
+        return bool(self.delete_many([todo_id]))
@@ -0,0 +1,160 @@
+"""
+클립보드 히스토리 (개수/용량 예산이 있는 LRU, SQLite에 영구 저장).
+
+항목은 내용 해시로 찾고, OrderedDict(해시 → 항목)를 오래된 것부터 최근 것 순서의 연결 목록으로 씁니다.
+다시 복사된 항목은 move_to_end로, 예산을 넘으면 popitem(last=False)로 가장 오래된 항목부터 빼므로
+추가/맨 앞으로 옮기기/제거가 모두 O(1)입니다.
+DB 기록은 작업 스레드가 모아서 하므로 클립보드 감지(Tk 스레드)는 디스크를 기다리지 않습니다.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.clipboard_entry import ClipboardEntry
+from services.write_behind import WriteBehind
+
+# 히스토리 예산 (둘 중 하나라도 넘으면 오래된 항목부터 제거)
+MAX_ENTRIES = 500
+MAX_BYTES = 32 * 1024 * 1024
+# 연속 복사를 한 번의 쓰기로 모으기 위한 대기 시간
+FLUSH_DELAY_SECONDS = 0.5
+
+
+def content_hash(content: str) -> str:
+    return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+def content_size(content: str) -> int:
+    """UTF-8 바이트 수 (용량 예산 단위)."""
+    return len(content.encode('utf-8', 'surrogatepass'))
+
+
+class ClipboardHistoryWriter(WriteBehind):
+    """
+    히스토리 변경(해시 → 항목, None이면 삭제)을 모아 두었다가 작업 스레드에서 한 트랜잭션으로 기록합니다.
+    """
+    thread_name = "clipboard-writer"
+    action = "클립보드 히스토리 저장"
+
+    def __init__(self, repository, delay: float = FLUSH_DELAY_SECONDS,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        :param repository: apply_batch(upserts, deletes)를 제공하는 ClipboardRepository
+        :param delay: 첫 변경 후 기록까지 기다리는 시간(초)
+        :param on_error: 기록이 실패하면 호출 (WriteBehind 참고)
+        """
+        super().__init__(delay, on_error)
+        self.repository = repository
+
+    def _write(self, batch: Dict[str, Optional[ClipboardEntry]]) -> None:
+        self.repository.apply_batch([e for e in batch.values() if e is not None],
+                                    [h for h, e in batch.items() if e is None])
+
+
+class ClipboardHistory:
+    """
+    개수/용량 예산이 있는 LRU 클립보드 히스토리.
+    repository가 없으면 메모리에만 보관합니다.
+    """
+    def __init__(self, repository=None, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        """
+        :param repository: ClipboardRepository (None이면 저장하지 않음)
+        :param max_entries: 최대 항목 수
+        :param max_bytes: 최대 총 용량 (UTF-8 바이트). 이보다 큰 항목 하나는 히스토리에 넣지 않음
+        """
+        self.repository = repository
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._entries: "OrderedDict[str, ClipboardEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._seq = 0
+        self._writer = ClipboardHistoryWriter(repository) if repository is not None else None
+        if repository is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            recent = self.repository.load_recent(self.max_entries)
+        except Exception as e:
+            print(f"클립보드 히스토리 불러오기 중 오류 발생: {e}")
+            return
+        kept = []
+        for entry in recent:
+            if self._total_bytes + entry.size > self.max_bytes:
+                break
+            kept.append(entry)
+            self._total_bytes += entry.size
+        for entry in reversed(kept):
+            self._entries[entry.hash] = entry
+        if recent:
+            self._seq = recent[0].seq
+        # 예산이 줄었거나 이전 실행이 예산 밖 항목을 남긴 경우 DB에서도 정리
+        if kept:
+            self.repository.delete_older_than(kept[-1].seq)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def entries(self) -> List[ClipboardEntry]:
+        """최근 항목부터 순서대로."""
+        return list(reversed(self._entries.values()))
+
+    def get(self, hash_: str) -> Optional[ClipboardEntry]:
+        return self._entries.get(hash_)
+
+    def add(self, content: str, hash_: Optional[str] = None,
+            size: Optional[int] = None) -> Tuple[Optional[ClipboardEntry], bool, List[ClipboardEntry]]:
+        """
+        복사된 내용을 맨 앞에 둡니다. 이미 있는 내용이면 그 항목을 맨 앞으로 옮깁니다.
+        :param hash_: 미리 계산한 content_hash (큰 내용은 작업 스레드에서 계산해 넘김)
+        :param size: 미리 계산한 UTF-8 바이트 수
+        :return: (맨 앞 항목 또는 None(용량 초과로 제외), 기존 항목을 옮겼는지, 예산 때문에 제거된 항목)
+        """
+        hash_ = hash_ or content_hash(content)
+        now = time.time()
+        changes: Dict[str, Optional[ClipboardEntry]] = {}
+        entry = self._entries.get(hash_)
+        if entry is not None:
+            self._seq += 1
+            entry.seq = self._seq
+            entry.copied_at = now
+            self._entries.move_to_end(hash_)
+            changes[hash_] = entry
+            moved = True
+        else:
+            if size is None:
+                size = content_size(content)
+            if size > self.max_bytes:
+                return None, False, []
+            self._seq += 1
+            entry = ClipboardEntry(hash_, content, size, self._seq, now)
+            self._entries[hash_] = entry
+            self._total_bytes += size
+            changes[hash_] = entry
+            moved = False
+        evicted = []
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            old_hash, old = self._entries.popitem(last=False)
+            self._total_bytes -= old.size
+            changes[old_hash] = None
+            evicted.append(old)
+        if self._writer is not None:
+            # 항목 객체는 이후에도 바뀌므로(seq) 기록 시점 값이 섞이지 않게 복사본을 넘김
+            self._writer.submit({h: replace(e) if e else None for h, e in changes.items()})
+        return entry, moved, evicted
+
+    def flush(self) -> bool:
+        return self._writer.flush() if self._writer is not None else True
+
+    def close(self) -> None:
+        """남은 변경을 기록하고 저장소를 닫습니다."""
+        if self._writer is not None:
+            self._writer.close()
+        if self.repository is not None:
+            self.repository.close()
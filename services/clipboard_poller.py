@@ -0,0 +1,196 @@
+"""
+작업 스레드에서 도는 클립보드 변경 확인.
+
+싼 신호부터 확인하고 필요할 때만 전체 내용을 가져옵니다.
+1. 변경 번호 (Windows GetClipboardSequenceNumber, macOS NSPasteboard changeCount, X11 소유자/TIMESTAMP):
+   그대로면 아무것도 읽지 않음
+2. 텍스트 길이 (Windows GlobalSize, X11 TARGETS와 변환 결과 크기): 텍스트가 없거나
+   히스토리 용량 예산보다 크면 가져오지 않음
+3. 가져온 내용의 전체 해시를 직전과 비교
+변경이 없으면 확인 간격을 점점 늘리고(최대 POLL_MAX_SECONDS), 변경이 생기면 다시 짧게 줄입니다.
+X11 선택 영역 이벤트를 쓸 수 있으면 주기 확인 없이 wake()가 불릴 때만 확인합니다.
+결과(on_change)는 작업 스레드에서 호출되므로, Tk 위젯을 다룰 때는 호출하는 쪽에서 after_idle로 넘깁니다.
+"""
+import ctypes
+import ctypes.util
+import sys
+import threading
+from typing import Callable, Optional, Tuple
+
+from services.clipboard_history import content_hash, content_size
+from services.clipboard_watch import create_selection_probe
+
+POLL_MIN_SECONDS = 0.25
+POLL_MAX_SECONDS = 2.0
+POLL_BACKOFF = 1.5
+_CF_UNICODETEXT = 13
+
+Probes = Tuple[Optional[Callable[[], object]], Optional[Callable[[], Optional[int]]], Optional[Callable[[], None]]]
+
+
+def clipboard_probes() -> Probes:
+    """
+    (변경 번호 함수, 텍스트 길이 함수, 정리 함수)를 돌려줍니다. 해당 플랫폼에서 쓸 수 없는 것은 None.
+    텍스트 길이는 텍스트가 없으면 0. Windows는 UTF-16 단위 수, X11은 변환 결과 바이트 수
+    (둘 다 UTF-8 바이트 수 이하이므로 용량 예산 비교에 그대로 씀).
+    """
+    if sys.platform == 'win32':
+        return _windows_probes()
+    if sys.platform == 'darwin':
+        return _mac_change_count(), None, None
+    probe = create_selection_probe('CLIPBOARD')
+    if probe is None:
+        return None, None, None
+    return probe.sequence_number, probe.text_length, probe.close
+
+
+def _windows_probes() -> Probes:
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+    user32.GetClipboardSequenceNumber.restype = ctypes.c_uint32
+    user32.OpenClipboard.argtypes = [ctypes.c_void_p]
+    user32.GetClipboardData.argtypes = [ctypes.c_uint]
+    user32.GetClipboardData.restype = ctypes.c_void_p
+    kernel32.GlobalSize.argtypes = [ctypes.c_void_p]
+    kernel32.GlobalSize.restype = ctypes.c_size_t
+
+    def text_length() -> Optional[int]:
+        # 다른 앱이 클립보드를 열고 있으면 크기를 모르는 채로 진행
+        if not user32.OpenClipboard(None):
+            return None
+        try:
+            handle = user32.GetClipboardData(_CF_UNICODETEXT)
+            return kernel32.GlobalSize(handle) // 2 if handle else 0
+        finally:
+            user32.CloseClipboard()
+
+    return user32.GetClipboardSequenceNumber, text_length, None
+
+
+def _mac_change_count() -> Optional[Callable[[], int]]:
+    """NSPasteboard generalPasteboard의 changeCount (복사할 때마다 늘어남). 쓸 수 없으면 None."""
+    try:
+        objc = ctypes.cdll.LoadLibrary(ctypes.util.find_library('objc'))
+        ctypes.cdll.LoadLibrary('/System/Library/Frameworks/AppKit.framework/AppKit')
+    except (OSError, TypeError):
+        return None
+    objc.objc_getClass.argtypes = [ctypes.c_char_p]
+    objc.objc_getClass.restype = ctypes.c_void_p
+    objc.sel_registerName.argtypes = [ctypes.c_char_p]
+    objc.sel_registerName.restype = ctypes.c_void_p
+    objc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    objc.objc_msgSend.restype = ctypes.c_long
+    pasteboard = objc.objc_msgSend(objc.objc_getClass(b'NSPasteboard'), objc.sel_registerName(b'generalPasteboard'))
+    if not pasteboard:
+        return None
+    change_count = objc.sel_registerName(b'changeCount')
+    return lambda: objc.objc_msgSend(pasteboard, change_count)
+
+
+class ClipboardPoller:
+    """
+    클립보드 변경을 작업 스레드에서 확인합니다.
+    """
+    def __init__(self, on_change: Callable[[str, str, int], None], read_text: Callable[[], str],
+                 sequence_number: Optional[Callable[[], object]] = None,
+                 text_length: Optional[Callable[[], Optional[int]]] = None,
+                 max_length: Optional[int] = None, poll: bool = True,
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 on_stop: Optional[Callable[[], None]] = None):
+        """
+        :param on_change: 바뀐 내용으로 호출 (내용, content_hash, UTF-8 바이트 수). 작업 스레드에서 호출됨
+        :param read_text: 클립보드 텍스트를 읽는 함수 (작업 스레드에서 호출해도 안전해야 함)
+        :param sequence_number: 클립보드 변경 번호 함수 (없으면 매번 내용을 읽음)
+        :param text_length: 가져오기 전 텍스트 길이를 알려 주는 함수 (0이면 텍스트 없음, None이면 알 수 없음)
+        :param max_length: 이보다 긴 내용은 가져오지 않음 (히스토리 용량 예산)
+        :param poll: False면 주기 확인 없이 wake() 때만 확인 (선택 영역 이벤트 사용 시)
+        :param on_error: read_text가 실패하면 한 번 호출되고 스레드가 끝남
+        :param on_stop: 작업 스레드가 끝날 때 그 스레드에서 호출 (확인 함수가 연 연결 정리)
+        """
+        self.on_change = on_change
+        self.read_text = read_text
+        self.sequence_number = sequence_number
+        self.text_length = text_length
+        self.max_length = max_length
+        self.poll = poll
+        self.on_error = on_error
+        self.on_stop = on_stop
+        self.interval = POLL_MIN_SECONDS
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._last_sequence: Optional[object] = None
+        self._last_hash: Optional[str] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="clipboard-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """스레드를 멈춥니다 (기다리지 않음)."""
+        self._stopped = True
+        self._wake.set()
+
+    def wake(self) -> None:
+        """지금 확인합니다 (선택 영역 소유자가 바뀌었을 때)."""
+        self._wake.set()
+
+    def ignore(self, text: str) -> None:
+        """앱이 직접 복사한 내용은 변경으로 알리지 않습니다."""
+        self._last_hash = content_hash(text)
+
+    def _run(self):
+        try:
+            self._loop()
+        finally:
+            if self.on_stop:
+                self.on_stop()
+
+    def _loop(self):
+        # 시작 시점의 내용은 기준으로만 삼고 알리지 않음
+        primed = False
+        while not self._stopped:
+            woke = primed and self._wake.wait(self.interval if self.poll else None)
+            self._wake.clear()
+            if self._stopped:
+                return
+            try:
+                changed = self.check(force=woke, notify=primed)
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+                return
+            primed = True
+            self.interval = POLL_MIN_SECONDS if changed else min(self.interval * POLL_BACKOFF, POLL_MAX_SECONDS)
+
+    def check(self, force: bool = False, notify: bool = True) -> bool:
+        """
+        한 번 확인합니다.
+        :param force: 변경 번호가 그대로여도 내용을 읽음
+        :param notify: False면 내용을 기준으로만 기록
+        :return: 클립보드가 바뀌었는지 (간격 조절용)
+        """
+        if self.sequence_number is not None:
+            sequence = self.sequence_number()
+            if sequence == self._last_sequence and not force:
+                return False
+            self._last_sequence = sequence
+        if self.text_length is not None:
+            length = self.text_length()
+            if length == 0:
+                # 텍스트가 아닌 내용(이미지 등)이거나 비어 있음
+                return False
+            if length is not None and self.max_length is not None and length > self.max_length:
+                # 히스토리에 넣을 수 없는 크기이므로 가져오지 않음
+                return True
+        text = self.read_text()
+        if not text:
+            return False
+        hash_ = content_hash(text)
+        if hash_ == self._last_hash:
+            return False
+        self._last_hash = hash_
+        if notify:
+            self.on_change(text, hash_, content_size(text))
+        return True
@@ -1,34 +1,169 @@
 
+from typing import Callable, Dict, List, Optional, Sequence
 import pyperclip
-from tkinter import Tk
+from tkinter import READABLE, Tk
+from models.clipboard_entry import ClipboardEntry
+from models.clipboard_event import ADDED, EVICTED, MOVED, ClipboardEvent
+from services.clipboard_history import MAX_BYTES, MAX_ENTRIES, ClipboardHistory
+from services.clipboard_poller import ClipboardPoller, clipboard_probes
+from services.clipboard_watch import create_selection_probe, create_selection_watcher
+from services.event_bus import EventBus
+from services.trigram_index import TrigramIndex
 
 class ClipboardService:
     """
     클립보드 히스토리를 관리하고, 클립보드 변경을 감지합니다.
     """
-    def __init__(self, root: Tk, on_change_callback=None):
+    def __init__(self, root: Tk, on_change_callback=None, repository=None,
+                 max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES,
+                 selections: Sequence[str] = ('CLIPBOARD',)):
         """
         서비스를 초기화합니다.
         :param root: Tkinter의 루트 창 (after 메서드 사용을 위해)
-        :param on_change_callback: 클립보드 히스토리가 변경될 때 호출될 콜백 함수
+        :param on_change_callback: 클립보드 히스토리가 변경될 때 호출될 콜백 함수 (하나뿐이므로 화면은 subscribe 사용)
+        :param repository: 히스토리를 저장할 ClipboardRepository (None이면 메모리에만 보관)
+        :param max_entries: 히스토리 최대 항목 수
+        :param max_bytes: 히스토리 최대 총 용량 (바이트)
+        :param selections: 감시할 선택 영역. X11에서 'PRIMARY'를 넣으면 마우스로 선택한 텍스트도 기록
         """
         self.root = root
         self.on_change_callback = on_change_callback
-        self.history = []
-        self.max_history_size = 50
+        self.history = ClipboardHistory(repository, max_entries, max_bytes)
+        self.events = EventBus()
+        # 히스토리 검색용 (항목 해시 → 내용 앞부분 트라이그램). 추가/제거될 때 그 항목만 고침
+        self.search_index = TrigramIndex()
+        for entry in self.history.entries():
+            self.search_index.add(entry.hash, entry.content)
         self._last_clipboard_content = ""
         self._is_monitoring = False
+        self._poll_id = None
+        self.selections = tuple(selections)
+        self._watcher = None
+        self._poller = None
+        # 선택 영역 이름 → 이벤트가 오면 깨울 폴러
+        self._pollers: Dict[str, ClipboardPoller] = {}
 
     def start_monitoring(self):
-        """클립보드 모니터링을 시작합니다."""
-        if not self._is_monitoring:
-            self._is_monitoring = True
-            self._last_clipboard_content = self._get_clipboard_content()
-            self._check_clipboard()
+        """
+        클립보드 모니터링을 시작합니다.
+        내용 확인은 작업 스레드(ClipboardPoller)에서 하고, 바뀐 내용만 after_idle로 Tk 스레드에 넘깁니다.
+        X11에서는 선택 영역 소유자 변경 이벤트(XFixes)가 올 때만 확인하고, 그 밖의 환경에서는 변경이 없을수록
+        확인 간격을 늘립니다.
+        """
+        if self._is_monitoring:
+            return
+        self._is_monitoring = True
+        self._start_selection_events()
+        sequence_number, text_length, close_probes = clipboard_probes()
+        self._poller = ClipboardPoller(self._on_poller_change, pyperclip.paste, sequence_number, text_length,
+                                       max_length=self.history.max_bytes, poll=self._watcher is None,
+                                       on_error=self._on_poller_error, on_stop=close_probes)
+        self._poller.start()
+        self._pollers = {'CLIPBOARD': self._poller}
+        if self._watcher is not None and 'PRIMARY' in self.selections:
+            self._start_primary_poller()
+
+    def _start_primary_poller(self):
+        """PRIMARY는 pyperclip이 읽지 않으므로 Xlib로 직접 읽고, 선택 영역 이벤트가 올 때만 확인합니다."""
+        probe = create_selection_probe('PRIMARY')
+        if probe is None:
+            return
+        poller = ClipboardPoller(self._on_poller_change, probe.read_text, probe.sequence_number, probe.text_length,
+                                 max_length=self.history.max_bytes, poll=False,
+                                 on_error=self._on_primary_error, on_stop=probe.close)
+        self._pollers['PRIMARY'] = poller
+        poller.start()
 
     def stop_monitoring(self):
         """클립보드 모니터링을 중지합니다."""
         self._is_monitoring = False
+        for poller in self._pollers.values():
+            poller.stop()
+        self._pollers = {}
+        self._poller = None
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self._watcher is not None:
+            try:
+                self.root.tk.deletefilehandler(self._watcher.fileno())
+            except Exception:
+                pass
+            self._watcher.close()
+            self._watcher = None
+
+    @property
+    def uses_selection_events(self) -> bool:
+        """폴링 대신 X11 선택 영역 이벤트로 감지 중인지 여부"""
+        return self._watcher is not None
+
+    def _start_selection_events(self) -> bool:
+        watcher = create_selection_watcher(self.selections)
+        if watcher is None:
+            return False
+        try:
+            # X 연결 소켓을 Tk 이벤트 루프에 등록 (이벤트가 있을 때만 Tk 스레드에서 호출됨)
+            self.root.tk.createfilehandler(watcher.fileno(), READABLE, self._on_selection_event)
+        except Exception as e:
+            print(f"클립보드 이벤트 등록 중 오류 발생, 폴링으로 대체: {e}")
+            watcher.close()
+            return False
+        self._watcher = watcher
+        return True
+
+    def _on_selection_event(self, fd, mask):
+        if self._watcher is None:
+            return
+        for name in self._watcher.read_events():
+            poller = self._pollers.get(name)
+            if poller is not None:
+                poller.wake()
+
+    def _on_poller_change(self, text: str, hash_: str, size: int):
+        """작업 스레드에서 호출됨. 히스토리와 UI는 Tk 스레드에서만 다룸."""
+        try:
+            self.root.after_idle(self._apply_change, text, hash_, size)
+        except RuntimeError:
+            # 종료 중이라 Tk 이벤트 루프가 없음
+            pass
+
+    def _on_poller_error(self, error: Exception):
+        """작업 스레드에서 클립보드를 읽을 수 없으면(pyperclip 백엔드 없음 등) Tk 스레드 폴링으로 전환."""
+        print(f"클립보드 작업 스레드 확인 중 오류 발생, Tk 폴링으로 대체: {error}")
+        try:
+            self.root.after_idle(self._fall_back_to_tk_polling)
+        except RuntimeError:
+            pass
+
+    def _on_primary_error(self, error: Exception):
+        """PRIMARY를 읽을 수 없으면 그 감시만 멈춥니다 (CLIPBOARD 확인은 계속)."""
+        print(f"PRIMARY 선택 영역 확인 중 오류 발생: {error}")
+
+    def _fall_back_to_tk_polling(self):
+        if not self._is_monitoring:
+            return
+        self.stop_monitoring()
+        self._is_monitoring = True
+        self._last_clipboard_content = self._get_clipboard_content()
+        self._check_clipboard()
+
+    def _apply_change(self, text: str, hash_: Optional[str] = None, size: Optional[int] = None):
+        """바뀐 클립보드 내용을 히스토리에 반영합니다 (Tk 스레드)."""
+        if not self._is_monitoring or not text or text == self._last_clipboard_content:
+            return
+        self._last_clipboard_content = text
+        # 이미 있는 내용이면 맨 앞으로 옮김 (DB 기록은 작업 스레드에서)
+        entry, moved, evicted = self.history.add(text, hash_, size)
+        # 제거를 먼저 알려야 화면 목록도 예산 크기를 넘지 않음
+        for old in evicted:
+            self.search_index.remove(old.hash)
+            self.events.publish(ClipboardEvent(EVICTED, old))
+        if entry is not None:
+            if not moved:
+                self.search_index.add(entry.hash, entry.content)
+            self.events.publish(ClipboardEvent(MOVED if moved else ADDED, entry))
+            if self.on_change_callback:
+                self.on_change_callback()
 
     def _get_clipboard_content(self):
         """현재 클립보드 내용을 가져옵니다."""
@@ -41,36 +176,54 @@ class ClipboardService:
                 return ""
 
     def _check_clipboard(self):
-        """주기적으로 클립보드를 확인하고 변경 사항을 처리합니다."""
+        """주기적으로 클립보드를 확인하고 변경 사항을 처리합니다 (작업 스레드로 읽을 수 없을 때)."""
+        self._poll_id = None
         if not self._is_monitoring:
             return
-
         try:
-            current_content = self._get_clipboard_content()
-            if current_content and current_content != self._last_clipboard_content:
-                self._last_clipboard_content = current_content
-                
-                # 중복 항목이 맨 위에 있는 경우 추가하지 않음
-                if not self.history or self.history[0] != current_content:
-                    self.history.insert(0, current_content)
-                    
-                    # 최대 히스토리 크기 유지
-                    if len(self.history) > self.max_history_size:
-                        self.history.pop()
-
-                    if self.on_change_callback:
-                        self.on_change_callback()
+            self._apply_change(self._get_clipboard_content())
         except Exception as e:
             print(f"클립보드 확인 중 오류 발생: {e}") # 로깅으로 대체하는 것이 좋음
         finally:
-            self.root.after(1000, self._check_clipboard) # 1초마다 확인
+            self._poll_id = self.root.after(1000, self._check_clipboard) # 1초마다 확인
 
     def get_history(self) -> list:
-        """현재 클립보드 히스토리를 반환합니다."""
-        return self.history
+        """현재 클립보드 히스토리를 반환합니다 (최근 항목부터)."""
+        return [entry.content for entry in self.history.entries()]
+
+    def search_entries(self, query: str, limit: Optional[int] = None) -> List[ClipboardEntry]:
+        """
+        검색어와 비슷한 히스토리 항목을 돌려줍니다 (오타 허용, 점수가 같으면 최근 항목부터).
+        :param query: 검색어 (비어 있으면 전체 히스토리)
+        :param limit: 최대 결과 수
+        """
+        if not query.strip():
+            return self.history.entries()[:limit]
+        # 점수가 같은 항목의 최근 순서는 여기서 정하므로, 색인에서는 자르지 않고 정렬한 뒤에 자름
+        entries = [(self.history.get(doc_id), score) for doc_id, score in self.search_index.search(query)]
+        entries = [(entry, score) for entry, score in entries if entry is not None]
+        entries.sort(key=lambda r: (r[1], r[0].seq), reverse=True)
+        return [entry for entry, _ in entries[:limit]]
+
+    def subscribe(self, callback: Callable[[ClipboardEvent], None]) -> None:
+        """
+        히스토리 변경 이벤트(ADDED/MOVED/EVICTED)를 받을 콜백을 등록합니다. Tk 스레드에서 호출됩니다.
+        콜백은 약하게 참조되므로 화면이 사라지면 자동으로 빠지지만, 가능하면 unsubscribe로 해제합니다.
+        """
+        self.events.subscribe(callback)
+
+    def unsubscribe(self, callback: Callable[[ClipboardEvent], None]) -> None:
+        self.events.unsubscribe(callback)
+
+    def close(self):
+        """모니터링을 멈추고 남은 히스토리 변경을 기록합니다. 앱 종료 시 호출합니다."""
+        self.stop_monitoring()
+        self.history.close()
 
     def copy_to_clipboard(self, text: str):
         """주어진 텍스트를 클립보드에 복사합니다."""
         pyperclip.copy(text)
         # 사용자가 히스토리에서 항목을 복사할 때, 그게 다시 히토리에 추가되는 것을 방지
         self._last_clipboard_content = text
+        if self._poller is not None:
+            self._poller.ignore(text)
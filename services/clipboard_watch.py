@@ -0,0 +1,366 @@
+"""
+X11 선택 영역(CLIPBOARD/PRIMARY) 소유자 변경 감지.
+
+XFixes 확장의 SelectionNotify 이벤트를 ctypes로 받습니다. 다른 앱이 복사해 선택 영역 소유자가 바뀔 때만
+X 연결 소켓이 읽을 수 있는 상태가 되므로, 이 소켓(fileno)을 Tk 이벤트 루프나 select()에 걸어 두면
+주기적으로 깨어나지 않고도 변경을 바로 알 수 있습니다.
+libX11/libXfixes가 없거나 X 서버에 연결할 수 없으면(Windows, macOS, DISPLAY 없음) create_selection_watcher가
+None을 돌려주고, 호출하는 쪽은 기존 폴링을 씁니다.
+
+폴링할 때는 X11SelectionProbe가 내용을 가져오지 않고 소유자/TIMESTAMP(변경 여부)와 TARGETS/크기만 묻습니다.
+
+Xvfb에서 단독으로 확인:
+    xvfb-run -a sh -c 'python -m services.clipboard_watch & sleep 1; echo hi | xclip -selection clipboard'
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# XFixes 이벤트 마스크 (소유자 설정 / 소유 창 파괴 / 소유 클라이언트 종료)
+_SET_SELECTION_OWNER_NOTIFY_MASK = 1 << 0
+_SELECTION_WINDOW_DESTROY_NOTIFY_MASK = 1 << 1
+_SELECTION_CLIENT_CLOSE_NOTIFY_MASK = 1 << 2
+_SELECTION_EVENT_MASK = (_SET_SELECTION_OWNER_NOTIFY_MASK | _SELECTION_WINDOW_DESTROY_NOTIFY_MASK
+                         | _SELECTION_CLIENT_CLOSE_NOTIFY_MASK)
+# XFixesSelectionNotify = event_base + 0
+_XFIXES_SELECTION_NOTIFY = 0
+# 핵심 프로토콜의 SelectionNotify (XConvertSelection 응답)
+_SELECTION_NOTIFY = 31
+# 텍스트로 읽을 수 있는 변환 대상 (앞쪽을 우선 요청)
+_TEXT_TARGETS = ('UTF8_STRING', 'text/plain;charset=utf-8', 'STRING', 'TEXT')
+# 변환 결과를 받을 속성 이름
+_PROBE_PROPERTY = '_CLIPBOARD_PROBE'
+# 소유자가 변환 요청에 답하지 않을 때 기다리는 최대 시간(초)
+PROBE_TIMEOUT_SECONDS = 0.5
+
+
+class _XFixesSelectionNotifyEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('window', ctypes.c_ulong),
+        ('subtype', ctypes.c_int),
+        ('owner', ctypes.c_ulong),
+        ('selection', ctypes.c_ulong),
+        ('timestamp', ctypes.c_ulong),
+        ('selection_timestamp', ctypes.c_ulong),
+    ]
+
+
+class _XSelectionEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('requestor', ctypes.c_ulong),
+        ('selection', ctypes.c_ulong),
+        ('target', ctypes.c_ulong),
+        ('property', ctypes.c_ulong),
+        ('time', ctypes.c_ulong),
+    ]
+
+
+# XEvent 공용체 크기 (long 24개)
+_XEvent = ctypes.c_long * 24
+
+
+def _load_libraries():
+    x11_path = ctypes.util.find_library('X11')
+    xfixes_path = ctypes.util.find_library('Xfixes')
+    if not x11_path or not xfixes_path:
+        raise OSError("libX11/libXfixes를 찾을 수 없음")
+    x11 = ctypes.CDLL(x11_path)
+    xfixes = ctypes.CDLL(xfixes_path)
+
+    x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    x11.XOpenDisplay.restype = ctypes.c_void_p
+    x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+    x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+    x11.XDefaultRootWindow.restype = ctypes.c_ulong
+    x11.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    x11.XInternAtom.restype = ctypes.c_ulong
+    x11.XConnectionNumber.argtypes = [ctypes.c_void_p]
+    x11.XPending.argtypes = [ctypes.c_void_p]
+    x11.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XEvent)]
+    x11.XFlush.argtypes = [ctypes.c_void_p]
+    x11.XCreateSimpleWindow.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int, ctypes.c_int, ctypes.c_uint,
+                                        ctypes.c_uint, ctypes.c_uint, ctypes.c_ulong, ctypes.c_ulong]
+    x11.XCreateSimpleWindow.restype = ctypes.c_ulong
+    x11.XDestroyWindow.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    x11.XGetSelectionOwner.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    x11.XGetSelectionOwner.restype = ctypes.c_ulong
+    x11.XConvertSelection.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong,
+                                      ctypes.c_ulong]
+    x11.XCheckTypedWindowEvent.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int, ctypes.POINTER(_XEvent)]
+    x11.XGetWindowProperty.argtypes = [
+        ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_long, ctypes.c_long, ctypes.c_int, ctypes.c_ulong,
+        ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_ulong),
+        ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_void_p)]
+    x11.XDeleteProperty.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong]
+    x11.XFree.argtypes = [ctypes.c_void_p]
+    xfixes.XFixesQueryExtension.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int),
+                                            ctypes.POINTER(ctypes.c_int)]
+    xfixes.XFixesSelectSelectionInput.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong]
+    return x11, xfixes
+
+
+class XFixesSelectionWatcher:
+    """
+    X 서버에 별도 연결을 열고 지정한 선택 영역의 소유자 변경 이벤트를 구독합니다.
+    fileno()가 읽기 가능해지면 read_events()로 바뀐 선택 영역 이름을 꺼냅니다.
+    """
+    def __init__(self, selections: Sequence[str] = ('CLIPBOARD',), display: Optional[str] = None):
+        """
+        :param selections: 감시할 선택 영역 이름 ('CLIPBOARD', 'PRIMARY')
+        :param display: X 디스플레이 이름 (None이면 DISPLAY 환경 변수)
+        :raises OSError: 라이브러리가 없거나 X 서버/XFixes를 쓸 수 없을 때
+        """
+        self._x11, self._xfixes = _load_libraries()
+        self._display = self._x11.XOpenDisplay(display.encode() if display else None)
+        if not self._display:
+            raise OSError("X 디스플레이에 연결할 수 없음")
+        try:
+            event_base, error_base = ctypes.c_int(), ctypes.c_int()
+            if not self._xfixes.XFixesQueryExtension(self._display, ctypes.byref(event_base), ctypes.byref(error_base)):
+                raise OSError("X 서버가 XFixes 확장을 지원하지 않음")
+            self._notify_type = event_base.value + _XFIXES_SELECTION_NOTIFY
+            root = self._x11.XDefaultRootWindow(self._display)
+            # 원자(atom) 값 → 선택 영역 이름
+            self._names = {}
+            for name in selections:
+                atom = self._x11.XInternAtom(self._display, name.encode(), 0)
+                self._names[atom] = name
+                self._xfixes.XFixesSelectSelectionInput(self._display, root, atom, _SELECTION_EVENT_MASK)
+            self._x11.XFlush(self._display)
+        except Exception:
+            self.close()
+            raise
+        self._event = _XEvent()
+
+    def fileno(self) -> int:
+        return self._x11.XConnectionNumber(self._display)
+
+    def read_events(self) -> List[str]:
+        """
+        쌓인 이벤트를 모두 꺼내, 소유자가 바뀐 선택 영역 이름을 (중복 없이) 돌려줍니다.
+        이벤트가 없으면 빈 목록이며 막히지 않습니다.
+        """
+        changed = []
+        if not self._display:
+            return changed
+        while self._x11.XPending(self._display):
+            self._x11.XNextEvent(self._display, ctypes.byref(self._event))
+            event = ctypes.cast(ctypes.byref(self._event), ctypes.POINTER(_XFixesSelectionNotifyEvent)).contents
+            if event.type != self._notify_type:
+                continue
+            name = self._names.get(event.selection)
+            if name and name not in changed:
+                changed.append(name)
+        return changed
+
+    def close(self) -> None:
+        if self._display:
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+
+class X11SelectionProbe:
+    """
+    선택 영역 내용을 가져오지 않고 X 서버에 변경 여부와 텍스트 크기만 묻습니다 (ClipboardPoller의 확인용).
+    - sequence_number: (소유 창, 소유권을 잡은 시각 TIMESTAMP). 앱은 복사할 때마다 새 시각으로 소유권을 다시 잡으므로
+      값이 그대로면 내용을 읽지 않아도 됨. TIMESTAMP에 답하지 않는 소유자면 매번 새 값(항상 확인)을 돌려줌
+    - text_length: TARGETS에 텍스트 형식이 없으면 0. 있으면 변환 결과 속성의 크기(바이트)를 길이 0으로 읽어 크기만 확인.
+      큰 내용은 소유자가 INCR로 답하며 그 값(크기 하한)을 씀
+    - read_text: 텍스트를 직접 변환해 읽음 (PRIMARY 감시용)
+    Xlib 연결은 한 스레드에서만 써야 하므로 처음 호출될 때(폴러 작업 스레드) 엽니다.
+    """
+    def __init__(self, selection: str = 'CLIPBOARD', display: Optional[str] = None,
+                 timeout: float = PROBE_TIMEOUT_SECONDS):
+        """
+        :param selection: 확인할 선택 영역 이름
+        :param display: X 디스플레이 이름 (None이면 DISPLAY 환경 변수)
+        :param timeout: 소유자 응답을 기다리는 최대 시간(초)
+        """
+        self.selection = selection
+        self.timeout = timeout
+        self._display_name = display
+        self._x11 = None
+        self._display = None
+        self._window = 0
+        self._atoms: Dict[str, int] = {}
+        self._unknown = 0
+        self._event = _XEvent()
+
+    def _connect(self) -> None:
+        if self._display:
+            return
+        x11, _ = _load_libraries()
+        display = x11.XOpenDisplay(self._display_name.encode() if self._display_name else None)
+        if not display:
+            raise OSError("X 디스플레이에 연결할 수 없음")
+        self._x11, self._display = x11, display
+        # 변환 결과를 받을 보이지 않는 창
+        self._window = x11.XCreateSimpleWindow(display, x11.XDefaultRootWindow(display), 0, 0, 1, 1, 0, 0, 0)
+        self._atoms = {name: x11.XInternAtom(display, name.encode(), 0)
+                       for name in (self.selection, 'TARGETS', 'TIMESTAMP', 'INCR', _PROBE_PROPERTY, *_TEXT_TARGETS)}
+
+    def _request(self, target: str) -> bool:
+        """target 형식으로 변환을 요청하고 응답을 기다립니다. 소유자가 거절하거나 답이 없으면 False."""
+        x11, display, prop = self._x11, self._display, self._atoms[_PROBE_PROPERTY]
+        x11.XDeleteProperty(display, self._window, prop)
+        x11.XConvertSelection(display, self._atoms[self.selection], self._atoms[target], prop, self._window, 0)
+        x11.XFlush(display)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            while x11.XCheckTypedWindowEvent(display, self._window, _SELECTION_NOTIFY, ctypes.byref(self._event)):
+                notify = ctypes.cast(ctypes.byref(self._event), ctypes.POINTER(_XSelectionEvent)).contents
+                # 앞서 시간이 지나 버린 요청의 늦은 응답은 건너뜀
+                if notify.target == self._atoms[target]:
+                    return notify.property != 0
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            select.select([x11.XConnectionNumber(display)], [], [], remaining)
+
+    def _read_property(self, long_length: int) -> Tuple[int, Sequence[int], int]:
+        """
+        변환 결과 속성을 long_length개(32비트 단위)까지 읽습니다.
+        :return: (형식 원자, 값(형식 32는 정수 목록, 형식 8은 bytes), 남은 바이트 수)
+        """
+        actual_type, actual_format = ctypes.c_ulong(), ctypes.c_int()
+        nitems, bytes_after, data = ctypes.c_ulong(), ctypes.c_ulong(), ctypes.c_void_p()
+        status = self._x11.XGetWindowProperty(
+            self._display, self._window, self._atoms[_PROBE_PROPERTY], 0, long_length, 0, 0,
+            ctypes.byref(actual_type), ctypes.byref(actual_format), ctypes.byref(nitems), ctypes.byref(bytes_after),
+            ctypes.byref(data))
+        if status != 0:
+            return 0, [], 0
+        try:
+            values: Sequence[int] = []
+            if data.value and actual_format.value == 32:
+                # 형식 32 속성은 클라이언트 쪽에서 long 배열로 옴
+                values = list(ctypes.cast(data, ctypes.POINTER(ctypes.c_ulong))[:nitems.value])
+            elif data.value and actual_format.value == 8:
+                values = ctypes.string_at(data, nitems.value)
+        finally:
+            if data.value:
+                self._x11.XFree(data)
+        return actual_type.value, values, bytes_after.value
+
+    def sequence_number(self) -> Tuple[int, int]:
+        owner = 0
+        try:
+            self._connect()
+            owner = self._x11.XGetSelectionOwner(self._display, self._atoms[self.selection])
+            if not owner:
+                return 0, 0
+            if self._request('TIMESTAMP'):
+                _, values, _ = self._read_property(1)
+                if values:
+                    return owner, values[0]
+        except OSError:
+            pass
+        # 변경 여부를 알 수 없으면 매번 다른 값 (호출하는 쪽이 내용을 읽어 비교)
+        self._unknown += 1
+        return owner, -self._unknown
+
+    def _text_target(self) -> Optional[str]:
+        """소유자가 TARGETS로 알려 준 텍스트 형식 중 우선할 것. 텍스트가 없으면 None, TARGETS에 답이 없으면 UTF8_STRING."""
+        if not self._request('TARGETS'):
+            return _TEXT_TARGETS[0]
+        _, targets, _ = self._read_property(1024)
+        return next((name for name in _TEXT_TARGETS if self._atoms[name] in targets), None)
+
+    def text_length(self) -> Optional[int]:
+        """텍스트 크기(바이트). 텍스트가 없으면 0, 알 수 없으면 None."""
+        try:
+            self._connect()
+            if not self._x11.XGetSelectionOwner(self._display, self._atoms[self.selection]):
+                return 0
+            target = self._text_target()
+            if target is None:
+                return 0
+            if not self._request(target):
+                return None
+            actual_type, _, size = self._read_property(0)
+            if actual_type == self._atoms['INCR']:
+                # 나눠 보내는 큰 내용: 속성 값이 전체 크기의 하한. 전송을 시작하지 않도록 속성을 지우지 않음
+                _, values, _ = self._read_property(1)
+                return values[0] if values else None
+            self._x11.XDeleteProperty(self._display, self._window, self._atoms[_PROBE_PROPERTY])
+            return size
+        except OSError:
+            return None
+
+    def read_text(self) -> str:
+        """
+        선택 영역의 텍스트를 읽습니다 (pyperclip이 읽지 않는 PRIMARY용).
+        INCR로 나눠 보내는 큰 선택은 읽지 않고 빈 문자열을 돌려줍니다.
+        :raises OSError: X 서버에 연결할 수 없을 때
+        """
+        self._connect()
+        if not self._x11.XGetSelectionOwner(self._display, self._atoms[self.selection]):
+            return ''
+        target = self._text_target()
+        if target is None or not self._request(target):
+            return ''
+        actual_type, _, size = self._read_property(0)
+        if actual_type == self._atoms['INCR']:
+            return ''
+        _, data, _ = self._read_property((size + 3) // 4)
+        self._x11.XDeleteProperty(self._display, self._window, self._atoms[_PROBE_PROPERTY])
+        return bytes(data).decode('latin-1' if target == 'STRING' else 'utf-8', 'replace')
+
+    def close(self) -> None:
+        if self._display:
+            self._x11.XDestroyWindow(self._display, self._window)
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+
+def create_selection_probe(selection: str = 'CLIPBOARD') -> Optional[X11SelectionProbe]:
+    """X11 환경이면 X11SelectionProbe를, 아니면 None을 돌려줍니다 (연결은 처음 쓸 때 엶)."""
+    if sys.platform in ('win32', 'darwin') or not os.environ.get('DISPLAY'):
+        return None
+    try:
+        _load_libraries()
+    except OSError:
+        return None
+    return X11SelectionProbe(selection)
+
+
+def create_selection_watcher(selections: Sequence[str] = ('CLIPBOARD',)) -> Optional[XFixesSelectionWatcher]:
+    """
+    X11 환경이면 XFixesSelectionWatcher를, 아니면 None을 돌려줍니다 (호출하는 쪽은 폴링으로 대체).
+    :param selections: 감시할 선택 영역 이름
+    """
+    if sys.platform in ('win32', 'darwin') or not os.environ.get('DISPLAY'):
+        return None
+    try:
+        return XFixesSelectionWatcher(selections)
+    except OSError as e:
+        print(f"클립보드 변경 이벤트 사용 불가, 폴링으로 대체: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    watcher = create_selection_watcher(('CLIPBOARD', 'PRIMARY'))
+    if watcher is None:
+        sys.exit("XFixes를 사용할 수 없습니다.")
+    print("선택 영역 소유자 변경 대기 중 (Ctrl+C로 종료)", flush=True)
+    try:
+        while True:
+            select.select([watcher], [], [])
+            for name in watcher.read_events():
+                print(f"{name} 소유자 변경", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
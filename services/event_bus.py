@@ -0,0 +1,56 @@
+"""
+여러 구독자에게 이벤트를 전달하는 간단한 이벤트 버스.
+
+구독자는 약한 참조(WeakMethod / weakref.ref)로만 보관하므로, 구독을 해제하지 않고 사라진 화면(Frame)도
+버스 때문에 메모리에 남지 않습니다. 사라진 구독자는 다음 publish 때 목록에서 빠집니다.
+"""
+import threading
+import weakref
+from typing import Any, Callable, List
+
+
+def _ref(callback: Callable):
+    # 바인딩된 메서드는 호출할 때마다 새 객체이므로 WeakMethod로 (인스턴스, 함수)를 따로 참조
+    if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+        return weakref.WeakMethod(callback)
+    return weakref.ref(callback)
+
+
+class EventBus:
+    """
+    subscribe한 콜백을 publish 순서대로 호출합니다. 콜백은 publish한 스레드에서 호출됩니다.
+    """
+    def __init__(self):
+        self._subscribers: List[weakref.ref] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[Any], None]) -> None:
+        """
+        콜백을 등록합니다. 같은 콜백을 두 번 등록해도 한 번만 호출됩니다.
+        :param callback: 이벤트 하나를 인자로 받는 함수 또는 메서드 (약하게 참조됨)
+        """
+        with self._lock:
+            if not any(ref() == callback for ref in self._subscribers):
+                self._subscribers.append(_ref(callback))
+
+    def unsubscribe(self, callback: Callable[[Any], None]) -> None:
+        with self._lock:
+            self._subscribers = [ref for ref in self._subscribers if ref() is not None and ref() != callback]
+
+    def __len__(self) -> int:
+        """살아 있는 구독자 수"""
+        with self._lock:
+            return sum(1 for ref in self._subscribers if ref() is not None)
+
+    def publish(self, event: Any) -> None:
+        with self._lock:
+            callbacks = [ref() for ref in self._subscribers]
+            if None in callbacks:
+                self._subscribers = [ref for ref, cb in zip(self._subscribers, callbacks) if cb is not None]
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"이벤트 처리 중 오류 발생: {e}")
@@ -3,8 +3,6 @@ import subprocess
 import sys
 import webbrowser
 from repositories.launcher_repository import LauncherRepository
-from models.launcher_item import LauncherItem
-from models.workspace import Workspace
 
 class LauncherService:
     def __init__(self):
@@ -15,8 +13,7 @@ class LauncherService:
         return self.repository.add_workspace(name)
 
     def get_all_workspaces(self):
-        workspaces_data = self.repository.get_all_workspaces()
-        return [Workspace(id, name) for id, name in workspaces_data]
+        return self.repository.get_all_workspaces()
 
     def delete_workspace(self, workspace_id):
         self.repository.delete_workspace(workspace_id)
@@ -26,8 +23,7 @@ class LauncherService:
         self.repository.add_item(name, path, item_type, workspace_id)
 
     def get_items_by_workspace(self, workspace_id):
-        items_data = self.repository.get_items_by_workspace(workspace_id)
-        return [LauncherItem(id, name, path, item_type) for id, name, path, item_type in items_data]
+        return self.repository.get_items_by_workspace(workspace_id)
 
     def delete_item(self, item_id):
         self.repository.delete_item(item_id)
@@ -0,0 +1,82 @@
+import threading
+from tkinter import Tk
+
+DEFAULT_ARCHIVE_DAYS = 7
+DEFAULT_INTERVAL_MINUTES = 60
+
+
+class MaintenanceService:
+    """
+    완료 항목 자동 보관 같은 DB 유지보수 작업을 화면 갱신과 분리하여 실행합니다.
+    앱 시작 시 한 번, 이후 설정된 주기마다 작업 스레드에서 실행합니다.
+    """
+    def __init__(self, root: Tk, todo_service, config_service, on_archived=None):
+        """
+        :param root: Tkinter의 루트 창 (after 메서드 사용을 위해)
+        :param todo_service: TodoService 인스턴스
+        :param config_service: ConfigService 인스턴스 (보관 기간/주기 설정)
+        :param on_archived: 보관된 항목이 있을 때 UI 스레드에서 호출될 콜백 (인자: 보관 건수)
+        """
+        self.root = root
+        self.todo_service = todo_service
+        self.config_service = config_service
+        self.on_archived = on_archived
+        self._after_id = None
+        self._worker = None
+        self._running = False
+
+    def _config_int(self, key: str, default: int) -> int:
+        try:
+            value = int(self.config_service.get(key))
+            return value if value > 0 else default
+        except (TypeError, ValueError):
+            return default
+
+    @property
+    def archive_days(self) -> int:
+        return self._config_int('todo_archive_days', DEFAULT_ARCHIVE_DAYS)
+
+    @property
+    def interval_minutes(self) -> int:
+        return self._config_int('todo_maintenance_interval_minutes', DEFAULT_INTERVAL_MINUTES)
+
+    def start(self):
+        """유지보수 스케줄을 시작합니다 (즉시 1회 실행)."""
+        if not self._running:
+            self._running = True
+            self._tick()
+
+    def stop(self, timeout: float = 2.0):
+        """스케줄을 중지하고 실행 중인 작업이 끝나기를 잠시 기다립니다."""
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if self._worker is not None and self._worker.is_alive():
+            self._worker.join(timeout)
+
+    def _tick(self):
+        if not self._running:
+            return
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="todo-maintenance", daemon=True)
+            self._worker.start()
+        self._after_id = self.root.after(self.interval_minutes * 60 * 1000, self._tick)
+
+    def _run(self):
+        # 마지막 실행 시각이 DB에 기록되므로 주기 안의 반복 실행(재시작 포함)은 아무 작업도 하지 않음
+        try:
+            # 타이머 오차로 정상 주기 실행이 건너뛰어지지 않도록 최소 간격은 주기의 90%로 둠
+            min_interval_seconds = int(self.interval_minutes * 60 * 0.9)
+            count = self.todo_service.run_archive_maintenance(self.archive_days, min_interval_seconds)
+        except Exception as e:
+            print(f"Todo 유지보수 작업 중 오류 발생: {e}")
+            return
+        if count and self.on_archived and self._running:
+            try:
+                self.root.after(0, self.on_archived, count)
+            except Exception:
+                pass
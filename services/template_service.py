@@ -1,5 +1,4 @@
 from repositories.template_repository import TemplateRepository
-from models.template import Template
 
 class TemplateService:
     def __init__(self):
@@ -9,14 +8,11 @@ class TemplateService:
         return self.repository.add_template(title, content)
 
     def get_all_templates(self):
-        templates_data = self.repository.get_all_templates()
-        return [Template(id, title, content) for id, title, content in templates_data]
-    
+        # 저장소가 행을 바로 Template으로 만들어 돌려줌
+        return self.repository.get_all_templates()
+
     def get_template(self, template_id):
-        data = self.repository.get_template(template_id)
-        if data:
-            return Template(data[0], data[1], data[2])
-        return None
+        return self.repository.get_template(template_id)
 
     def update_template(self, template_id, title, content):
         return self.repository.update_template(template_id, title, content)
@@ -0,0 +1,121 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Set
+
+from models.todo import Todo
+from services.write_behind import WriteBehind
+
+# 항목 id → 명령 적용 후 상태 (None이면 삭제)
+TodoStates = Dict[int, Optional[Todo]]
+# 항목 id → 명령 전 DB에 있어야 할 행 버전 (None이면 행이 없어야 함)
+TodoVersions = Dict[int, Optional[int]]
+
+# 연속 입력(스페이스 연타, 드래그)을 한 번의 쓰기로 모으기 위한 대기 시간
+FLUSH_DELAY_SECONDS = 0.2
+UNDO_LIMIT = 100
+
+
+@dataclass
+class TodoCommand:
+    """되돌리기 기록 한 건. 명령 전후의 항목 상태를 그대로 보관합니다."""
+    label: str
+    before: TodoStates
+    after: TodoStates
+
+
+class UndoJournal:
+    """되돌리기/다시 실행 스택. 새 명령이 기록되면 다시 실행 목록은 비워집니다."""
+    def __init__(self, limit: int = UNDO_LIMIT):
+        self._undo: Deque[TodoCommand] = deque(maxlen=limit)
+        self._redo: Deque[TodoCommand] = deque(maxlen=limit)
+
+    def record(self, command: TodoCommand) -> None:
+        self._undo.append(command)
+        self._redo.clear()
+
+    def pop_undo(self) -> Optional[TodoCommand]:
+        if not self._undo:
+            return None
+        command = self._undo.pop()
+        self._redo.append(command)
+        return command
+
+    def pop_redo(self) -> Optional[TodoCommand]:
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        self._undo.append(command)
+        return command
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+
+class TodoWriteBehind(WriteBehind):
+    """
+    색인에 먼저 반영된 변경을 모아 두었다가 작업 스레드에서 한 트랜잭션으로 DB에 기록합니다.
+    기록 전에 DB의 행 버전이 처음 변경할 때 본 버전과 같은지 확인하고, 다르면(다른 곳에서 먼저 수정)
+    그 항목은 기록하지 않고 conflicts에 남깁니다.
+    DB를 직접 읽거나 쓰기 전에 flush()를 호출하면 그때까지의 명령이 모두 반영된 상태가 됩니다.
+    """
+    thread_name = "todo-write-behind"
+    action = "Todo 변경 사항 저장"
+
+    def __init__(self, repository, delay: float = FLUSH_DELAY_SECONDS,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        :param repository: apply_changes(states, expected)를 제공하는 TodoRepository
+        :param delay: 첫 변경 후 기록까지 기다리는 시간(초). 그 사이 들어온 변경은 함께 기록됨
+        :param on_error: 기록이 실패하면 호출 (WriteBehind 참고)
+        """
+        super().__init__(delay, on_error)
+        self.repository = repository
+        self._expected: TodoVersions = {}
+        self._conflicts: Set[int] = set()
+
+    def submit(self, states: TodoStates, expected: Optional[TodoVersions] = None) -> None:
+        """
+        :param states: 기록할 최종 상태
+        :param expected: 변경 전 행 버전. 같은 항목이 기록 전에 여러 번 바뀌면 처음 값을 유지함
+        """
+        super().submit(states, expected or {})
+
+    def _merge(self, states: TodoStates, expected: TodoVersions) -> None:
+        self._pending.update(states)
+        for tid, version in expected.items():
+            self._expected.setdefault(tid, version)
+
+    def _take(self):
+        if not self._pending:
+            return None
+        batch, self._pending = self._pending, {}
+        expected, self._expected = self._expected, {}
+        return batch, expected
+
+    def _requeue(self, batch) -> None:
+        states, expected = batch
+        super()._requeue(states)
+        for tid, version in self._expected.items():
+            expected.setdefault(tid, version)
+        self._expected = expected
+
+    def _write(self, batch) -> None:
+        conflicts = self.repository.apply_changes(*batch)
+        if conflicts:
+            with self._lock:
+                self._conflicts.update(conflicts)
+
+    def take_conflicts(self) -> List[int]:
+        """충돌로 기록하지 못한 항목 ID를 꺼냅니다 (꺼낸 뒤 비워짐)."""
+        with self._lock:
+            conflicts, self._conflicts = list(self._conflicts), set()
+        return conflicts
@@ -0,0 +1,192 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from models.todo import Todo
+
+# 시각 순 정렬 목록을 따로 유지하는 필드 (오늘/지연 보기, 알림 스케줄 용)
+_TIME_FIELDS = ('due_at', 'remind_at')
+
+
+class TodoIndex:
+    """
+    TodoService가 쓰는 메모리 색인.
+    id→Todo 맵과 부모→자식 ID 목록((sort_order, id) 순)을 유지하여 조회를 SQL 없이 처리합니다.
+    보관되지 않은 항목만 담습니다 (보관 항목은 보관함에서 DB로 조회).
+    마감/알림 시각이 있는 항목은 (시각, id) 정렬 목록에도 두어 시각 범위 조회를 이분 탐색으로 처리합니다.
+
+    저장된 Todo 객체는 변경하지 않고 교체만 합니다 (UI가 이전 객체와 비교해 바뀐 행을 찾기 때문).
+    """
+    def __init__(self, todos: Iterable[Todo] = ()):
+        self.by_id: Dict[int, Todo] = {}
+        self._children: Dict[Optional[int], List[int]] = {}
+        self._by_time: Dict[str, List[Tuple[str, int]]] = {field: [] for field in _TIME_FIELDS}
+        for t in todos:
+            self.by_id[t.id] = t
+            self._children.setdefault(t.parent_id, []).append(t.id)
+            for field, keys in self._by_time.items():
+                if getattr(t, field):
+                    keys.append((getattr(t, field), t.id))
+        for ids in self._children.values():
+            ids.sort(key=self._key)
+        for keys in self._by_time.values():
+            keys.sort()
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def _key(self, todo_id: int) -> Tuple[int, int]:
+        t = self.by_id[todo_id]
+        return (t.sort_order or 0, t.id)
+
+    def _unlink(self, t: Todo) -> None:
+        """by_id에 t가 아직 들어 있는 상태에서 자식 목록에서 떼어냅니다."""
+        ids = self._children.get(t.parent_id)
+        if not ids:
+            return
+        pos = bisect_left(ids, self._key(t.id), key=self._key)
+        if pos < len(ids) and ids[pos] == t.id:
+            del ids[pos]
+        else:
+            ids.remove(t.id)
+
+    def _relink_times(self, old: Optional[Todo], new: Optional[Todo]) -> None:
+        for field, keys in self._by_time.items():
+            before = getattr(old, field) if old is not None else None
+            after = getattr(new, field) if new is not None else None
+            if before == after:
+                continue
+            if before:
+                pos = bisect_left(keys, (before, old.id))
+                if pos < len(keys) and keys[pos] == (before, old.id):
+                    del keys[pos]
+            if after:
+                insort(keys, (after, new.id))
+
+    def get(self, todo_id: int) -> Optional[Todo]:
+        return self.by_id.get(todo_id)
+
+    def upsert(self, t: Todo) -> None:
+        self.upsert_many([t])
+
+    def upsert_many(self, todos: Iterable[Todo]) -> None:
+        """
+        여러 항목을 교체/추가합니다. 위치(부모/순서)가 바뀌는 항목을 먼저 모두 떼어낸 뒤
+        다시 끼워 넣으므로, 형제 전체의 순서를 바꾸는 경우에도 목록 정렬이 유지됩니다.
+        """
+        relink = []
+        for t in todos:
+            old = self.by_id.get(t.id)
+            self._relink_times(old, t)
+            if old is not None:
+                if (old.parent_id, old.sort_order) == (t.parent_id, t.sort_order):
+                    self.by_id[t.id] = t
+                    continue
+                self._unlink(old)
+            relink.append(t)
+        for t in relink:
+            self.by_id[t.id] = t
+        for t in relink:
+            insort(self._children.setdefault(t.parent_id, []), t.id, key=self._key)
+
+    def remove(self, todo_ids: Iterable[int]) -> None:
+        for tid in todo_ids:
+            old = self.by_id.get(tid)
+            if old is None:
+                continue
+            self._unlink(old)
+            self._relink_times(old, None)
+            del self.by_id[tid]
+
+    def ancestors(self, todo_id: int) -> List[Todo]:
+        """최상위부터 바로 위 부모까지의 조상 목록을 반환합니다."""
+        chain = []
+        seen = {todo_id}
+        t = self.by_id.get(todo_id)
+        while t is not None and t.parent_id is not None and t.parent_id not in seen:
+            seen.add(t.parent_id)
+            t = self.by_id.get(t.parent_id)
+            if t is not None:
+                chain.append(t)
+        chain.reverse()
+        return chain
+
+    def child_ids(self, parent_id: Optional[int]) -> List[int]:
+        """직계 자식 ID 목록 ((sort_order, id) 순)."""
+        return list(self._children.get(parent_id, ()))
+
+    def subtree_ids(self, todo_ids: Iterable[int]) -> List[int]:
+        """주어진 항목과 모든 자손의 ID 목록."""
+        result, seen = [], set()
+        stack = [tid for tid in todo_ids if tid in self.by_id]
+        while stack:
+            tid = stack.pop()
+            if tid in seen:
+                continue
+            seen.add(tid)
+            result.append(tid)
+            stack.extend(self._children.get(tid, ()))
+        return result
+
+    def due_between(self, start: Optional[str], end: str, status_filter: Optional[str] = None) -> List[Todo]:
+        """마감 시각이 [start, end) 범위인 항목을 마감 순으로 반환합니다 (start가 None이면 처음부터)."""
+        keys = self._by_time['due_at']
+        lo = bisect_left(keys, (start,)) if start is not None else 0
+        hi = bisect_left(keys, (end,))
+        return [t for t in (self.by_id[tid] for _, tid in keys[lo:hi]) if self._matches(t, status_filter)]
+
+    def scheduled(self) -> List[Todo]:
+        """마감 또는 알림 시각이 있는 항목."""
+        ids = {tid for keys in self._by_time.values() for _, tid in keys}
+        return [self.by_id[tid] for tid in ids]
+
+    @staticmethod
+    def _matches(t: Todo, status_filter: Optional[str]) -> bool:
+        return status_filter not in ('pending', 'completed') or t.status == status_filter
+
+    def children(self, parent_id: Optional[int], status_filter: Optional[str] = None,
+                 after: Optional[Tuple[int, int]] = None, start_at: Optional[Tuple[int, int]] = None,
+                 before: Optional[Tuple[int, int]] = None, limit: Optional[int] = None) -> List[Todo]:
+        """TodoRepository.get_children와 같은 의미의 조회를 메모리에서 처리합니다."""
+        ids = self._children.get(parent_id, [])
+        lo, hi = 0, len(ids)
+        if after is not None:
+            lo = max(lo, bisect_right(ids, tuple(after), key=self._key))
+        if start_at is not None:
+            lo = max(lo, bisect_left(ids, tuple(start_at), key=self._key))
+        if before is not None:
+            hi = min(hi, bisect_left(ids, tuple(before), key=self._key))
+        result: List[Todo] = []
+        if before is not None:
+            # 역방향 페이지: 앞쪽 키에서 가까운 것부터 limit개
+            for i in range(hi - 1, lo - 1, -1):
+                t = self.by_id[ids[i]]
+                if self._matches(t, status_filter):
+                    result.append(t)
+                    if limit is not None and len(result) >= limit:
+                        break
+            result.reverse()
+            return result
+        for i in range(lo, hi):
+            t = self.by_id[ids[i]]
+            if self._matches(t, status_filter):
+                result.append(t)
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
+
+    def ids_with_children(self, parent_ids: Iterable[int], status_filter: Optional[str] = None) -> Set[int]:
+        found = set()
+        for pid in parent_ids:
+            for cid in self._children.get(pid, ()):
+                if self._matches(self.by_id[cid], status_filter):
+                    found.add(pid)
+                    break
+        return found
+
+    def iter_all(self, status_filter: Optional[str] = None) -> Iterator[Todo]:
+        """부모별로 묶어 정렬 순서대로 모든 항목을 돌려줍니다 (최상위 먼저)."""
+        for pid in sorted(self._children, key=lambda p: (p is not None, p or 0)):
+            for cid in self._children[pid]:
+                t = self.by_id[cid]
+                if self._matches(t, status_filter):
+                    yield t
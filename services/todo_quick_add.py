@@ -0,0 +1,95 @@
+"""
+Todo 빠른 입력 문법.
+    장보기 #집 !1 @내일 18:00
+#태그는 내용에 그대로 남겨 두고(todo_tags에 정규화되어 저장), !우선순위와 @날짜는 내용에서 빼서 항목 값으로 옮깁니다.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from models.todo import extract_tags
+from services.todo_scheduler import format_schedule
+
+PRIORITY_WORDS = {
+    '1': 1, 'high': 1, '높음': 1,
+    '2': 2, 'medium': 2, 'med': 2, '보통': 2,
+    '3': 3, 'low': 3, '낮음': 3,
+}
+# 시각 없이 날짜만 쓴 마감은 그날이 끝날 때까지
+DEFAULT_DUE_TIME = '23:59'
+_RELATIVE_DAYS = {'today': 0, '오늘': 0, 'tomorrow': 1, '내일': 1, '모레': 2}
+
+_PRIORITY_TOKEN = re.compile(r'(?<!\S)!(\S+)')
+# @날짜 뒤에 HH:MM이 이어지면 마감 시각으로 씀
+_DATE_TOKEN = re.compile(r'(?<!\S)@(\S+)(?:\s+(\d{1,2}:\d{2})(?!\S))?')
+
+
+@dataclass
+class QuickAdd:
+    content: str
+    tags: List[str] = field(default_factory=list)
+    priority: Optional[int] = None
+    due_at: Optional[str] = None
+
+
+def _parse_date(token: str, today: datetime) -> Optional[datetime]:
+    """today/내일/+3d/YYYY-MM-DD/MM-DD 를 날짜로 바꿉니다. MM-DD는 오늘 이후 가장 가까운 날."""
+    token = token.lower()
+    if token in _RELATIVE_DAYS:
+        return today + timedelta(days=_RELATIVE_DAYS[token])
+    m = re.match(r'^\+(\d{1,3})d$', token)
+    if m:
+        return today + timedelta(days=int(m.group(1)))
+    try:
+        return datetime.strptime(token, '%Y-%m-%d')
+    except ValueError:
+        pass
+    m = re.match(r'^(\d{1,2})-(\d{1,2})$', token)
+    if not m:
+        return None
+    month, day = int(m.group(1)), int(m.group(2))
+    # strptime('%m-%d')는 1900년(평년)으로 읽어 02-29를 받지 못하므로 대상 연도에 직접 맞춤.
+    # 2월 29일은 다음 윤년까지 (2100년처럼 건너뛰는 해가 있어도 8년 안에 있음)
+    for year in range(today.year, today.year + 9):
+        try:
+            value = datetime(year, month, day)
+        except ValueError:
+            continue
+        if value >= today:
+            return value
+    return None
+
+
+def parse_quick_add(text: str, now: Optional[datetime] = None) -> QuickAdd:
+    """
+    빠른 입력 문자열을 나눕니다. 해석할 수 없는 !/@ 토큰은 내용에 그대로 둡니다.
+    :param now: 상대 날짜 기준 시각 (기본값: 현재)
+    """
+    today = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    priority = None
+    due_at = None
+
+    def take_priority(m):
+        nonlocal priority
+        value = PRIORITY_WORDS.get(m.group(1).lower())
+        if value is None:
+            return m.group(0)
+        priority = value
+        return ''
+
+    def take_date(m):
+        nonlocal due_at
+        day = _parse_date(m.group(1), today)
+        if day is None:
+            return m.group(0)
+        hour, minute = map(int, (m.group(2) or DEFAULT_DUE_TIME).split(':'))
+        if hour > 23 or minute > 59:
+            return m.group(0)
+        due_at = format_schedule(day.replace(hour=hour, minute=minute))
+        return ''
+
+    parsed = _DATE_TOKEN.sub(take_date, _PRIORITY_TOKEN.sub(take_priority, text))
+    # 토큰을 뺀 자리의 공백만 정리하고, 아무것도 빼지 않았으면 입력 그대로 둠
+    content = ' '.join(parsed.split()) if parsed != text else text
+    return QuickAdd(content, extract_tags(content), priority, due_at)
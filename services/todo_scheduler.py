@@ -0,0 +1,172 @@
+"""
+Todo 마감/알림 일정.
+반복 규칙 계산과, 다음 실행 시각들의 최소 힙을 두고 가장 이른 시각 하나에만 after() 타이머를 거는 스케줄러.
+"""
+import calendar
+import heapq
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+# 마감/알림 시각 저장 형식 (로컬 시각, 문자열 비교로 시간 순서가 됨)
+SCHEDULE_FORMAT = '%Y-%m-%d %H:%M'
+RECURRENCE_RULES = {
+    'daily': '매일',
+    'weekdays': '평일',
+    'weekly': '매주',
+    'monthly': '매월',
+    'yearly': '매년',
+}
+# 절전/시계 변경으로 Tk 타이머가 어긋나도 이 간격 안에는 다시 확인함
+MAX_TIMER_MS = 60 * 60 * 1000
+
+
+def parse_schedule(value: Optional[str]) -> Optional[datetime]:
+    """저장된 시각 문자열을 datetime으로 바꿉니다 (형식이 틀리면 None)."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, SCHEDULE_FORMAT)
+    except ValueError:
+        return None
+
+
+def format_schedule(value: datetime) -> str:
+    return value.strftime(SCHEDULE_FORMAT)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    """달을 더합니다. 없는 날짜(31일, 2월 29일)는 그 달의 마지막 날로 맞춥니다."""
+    month_index = value.month - 1 + months
+    year, month = value.year + month_index // 12, month_index % 12 + 1
+    return value.replace(year=year, month=month, day=min(value.day, calendar.monthrange(year, month)[1]))
+
+
+def next_occurrence(value: datetime, rule: str) -> Optional[datetime]:
+    """반복 규칙에 따른 다음 시각. 알 수 없는 규칙이면 None."""
+    if rule == 'daily':
+        return value + timedelta(days=1)
+    if rule == 'weekdays':
+        value += timedelta(days=1)
+        while value.weekday() >= 5:
+            value += timedelta(days=1)
+        return value
+    if rule == 'weekly':
+        return value + timedelta(weeks=1)
+    if rule == 'monthly':
+        return _add_months(value, 1)
+    if rule == 'yearly':
+        return _add_months(value, 12)
+    return None
+
+
+def next_due_after(due: datetime, rule: str, now: datetime) -> Optional[datetime]:
+    """due 다음 회차부터 now 이후의 첫 회차 (늦게 완료해 지난 회차는 건너뜀)."""
+    value = next_occurrence(due, rule)
+    while value is not None and value <= now:
+        value = next_occurrence(value, rule)
+    return value
+
+
+class TodoScheduler:
+    """
+    알림/마감 시각을 최소 힙으로 관리하고, 가장 이른 시각 하나에만 after() 타이머를 겁니다.
+    힙 항목은 넣을 때의 시각 문자열을 함께 담아 두고, 실행 시점에 현재 항목 값과 다르면 버립니다
+    (일정이 바뀌어도 힙에서 찾아 지우지 않음).
+    """
+    def __init__(self, widget, todo_service, on_remind: Callable, on_due: Callable):
+        """
+        :param widget: after()를 제공하는 Tk 위젯
+        :param todo_service: TodoService 인스턴스
+        :param on_remind: 알림 시각이 된 항목으로 호출 (인자: Todo)
+        :param on_due: 마감 시각이 지난 항목 목록으로 호출 (인자: List[Todo], 지연 표시 갱신용)
+        """
+        self.widget = widget
+        self.todo_service = todo_service
+        self.on_remind = on_remind
+        self.on_due = on_due
+        # (실행 시각, 항목 ID, 'remind' 또는 'due', 넣을 때의 시각 문자열)
+        self._heap: List[Tuple[datetime, int, str, str]] = []
+        self._after_id = None
+        self._armed_at: Optional[datetime] = None
+
+    def reload(self) -> None:
+        """색인의 모든 일정으로 힙을 다시 만듭니다 (외부 변경/가져오기 뒤)."""
+        now = datetime.now()
+        entries = []
+        for t in self.todo_service.get_scheduled_todos():
+            entries.extend(self._entries(t, now))
+        heapq.heapify(entries)
+        self._heap = entries
+        self._arm()
+
+    def schedule(self, todos) -> None:
+        """바뀐 항목의 일정을 추가합니다. 더 이른 시각이 생겼을 때만 타이머를 다시 겁니다."""
+        now = datetime.now()
+        for t in todos:
+            for entry in self._entries(t, now):
+                heapq.heappush(self._heap, entry)
+        self._arm()
+
+    @staticmethod
+    def _entries(t, now: datetime) -> List[Tuple[datetime, int, str, str]]:
+        if t.status == 'completed':
+            return []
+        entries = []
+        remind = parse_schedule(t.remind_at)
+        # 앱이 꺼져 있는 동안 지난 알림도 한 번은 보여줌
+        # (반복 항목은 알림 시각을 지우지 않고 남겨 두므로 지난 알림을 다시 띄우지 않음)
+        if remind is not None and (remind > now or not t.recurrence):
+            entries.append((remind, t.id, 'remind', t.remind_at))
+        due = parse_schedule(t.due_at)
+        if due is not None and due > now:
+            entries.append((due, t.id, 'due', t.due_at))
+        return entries
+
+    def _arm(self) -> None:
+        if not self._heap:
+            self.cancel()
+            return
+        fire_at = self._heap[0][0]
+        if self._after_id is not None and self._armed_at is not None and self._armed_at <= fire_at:
+            return
+        self.cancel()
+        delay = max(0, int((fire_at - datetime.now()).total_seconds() * 1000))
+        self._armed_at = fire_at
+        self._after_id = self.widget.after(min(delay, MAX_TIMER_MS), self._fire)
+
+    def cancel(self) -> None:
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._armed_at = None
+
+    def _fire(self) -> None:
+        self._after_id = None
+        self._armed_at = None
+        now = datetime.now()
+        reminders, overdue = [], []
+        seen = set()
+        while self._heap and self._heap[0][0] <= now:
+            _, todo_id, kind, stamp = heapq.heappop(self._heap)
+            # 같은 항목이 여러 번 바뀌어 같은 일정이 중복으로 들어 있을 수 있음
+            if (todo_id, kind, stamp) in seen:
+                continue
+            seen.add((todo_id, kind, stamp))
+            t = self.todo_service.get_todo(todo_id)
+            if t is None or t.status == 'completed':
+                continue
+            if kind == 'remind' and t.remind_at == stamp:
+                reminders.append(t)
+            elif kind == 'due' and t.due_at == stamp:
+                overdue.append(t)
+        self._arm()
+        if overdue:
+            self.on_due(overdue)
+        for t in reminders:
+            # 한 번 보여준 알림은 지움. 반복 항목은 마감과의 간격을 다음 회차에 그대로 쓰므로 남겨 둠
+            if not t.recurrence:
+                self.todo_service.dismiss_reminder(t.id)
+            self.on_remind(t)
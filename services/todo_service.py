@@ -1,11 +1,23 @@
-
-from typing import List, Optional
+import threading
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from models.todo import Todo
+from models.todo_stats import TodoStats
+from repositories.migrations import MIN_RANK_GAP, RANK_GAP
 from repositories.todo_repository import TodoRepository
+from services.todo_commands import TodoCommand, TodoStates, TodoWriteBehind, UndoJournal
+from services.todo_index import TodoIndex
+from services.todo_quick_add import parse_quick_add
+from services.todo_scheduler import RECURRENCE_RULES, format_schedule, next_due_after, parse_schedule
+from services.todo_transfer import detect_format, dump, load
 
 class TodoService:
     """
     투두리스트 관련 비즈니스 로직을 처리합니다.
+    조회는 메모리 색인(TodoIndex)에서 처리합니다.
+    상태 변경/이동/삭제는 명령으로 색인에 바로 반영하고 DB 기록은 작업 스레드로 미루며(write-behind),
+    되돌리기/다시 실행 기록을 남깁니다. 추가처럼 DB가 ID를 정하는 작업은 대기 중인 기록을 먼저 반영한 뒤 바로 씁니다.
     """
     def __init__(self, repository: TodoRepository):
         """
@@ -13,6 +25,136 @@ class TodoService:
         :param repository: TodoRepository의 인스턴스
         """
         self.repository = repository
+        self._index: Optional[TodoIndex] = None
+        self._writer = TodoWriteBehind(repository)
+        self.journal = UndoJournal()
+        # 색인을 읽을 때의 PRAGMA data_version (다른 프로세스의 변경 감지 기준)
+        self._data_version: Optional[int] = None
+        self._closed = False
+        # 마감/알림이 있는 항목이 바뀌면 호출 (인자: List[Todo], 스케줄러 등록용)
+        self.on_schedule_changed: Optional[Callable[[List[Todo]], None]] = None
+        # 작업 스레드에서 끝난 작업의 색인 처리를 UI 스레드로 넘기는 함수 (예: lambda fn: root.after(0, fn)).
+        # 없으면 호출한 스레드에서 바로 처리
+        self.call_on_ui: Optional[Callable[[Callable[[], None]], None]] = None
+
+    def close(self) -> None:
+        """남은 변경을 기록하고 저장소 연결을 정리합니다. 앱 종료 시 호출합니다."""
+        self._closed = True
+        self._writer.close()
+        if hasattr(self.repository, 'close'):
+            self.repository.close()
+
+    def flush(self) -> bool:
+        """대기 중인 변경을 지금 DB에 기록합니다."""
+        return self._writer.flush()
+
+    @property
+    def on_write_error(self) -> Optional[Callable[[Exception], None]]:
+        """쓰기 지연 기록이 실패하면 호출됩니다 (인자: 예외, 작업 스레드에서 호출됨). 없으면 오류를 출력합니다."""
+        return self._writer.on_error
+
+    @on_write_error.setter
+    def on_write_error(self, callback: Optional[Callable[[Exception], None]]) -> None:
+        self._writer.on_error = callback
+
+    # ---- In-memory index ----
+    @property
+    def index(self) -> TodoIndex:
+        """
+        색인을 반환합니다. 처음 접근하거나 무효화된 뒤에만 DB에서 한 번 읽습니다.
+        보관되지 않은 항목만 담으므로 보관함이 커져도 읽는 양은 늘지 않습니다 (보관 항목은 get_archived_page).
+        """
+        index = self._index
+        if index is None:
+            self._writer.flush()
+            # 읽기 전에 기준값을 잡아 두면, 읽는 사이의 외부 변경은 다음 확인 때 한 번 더 맞추게 됨
+            self._data_version = self.repository.data_version()
+            # 목록을 따로 만들지 않고 스냅샷에서 읽는 대로 색인에 넣음
+            index = TodoIndex(self.repository.iter_all_advanced())
+            self._index = index
+        return index
+
+    def check_external_changes(self) -> Optional[Tuple[List[int], List[int]]]:
+        """
+        다른 프로세스나 스크립트가 DB를 바꿨는지 확인하고, 바뀌었으면 색인에서 달라진 행만 다시 읽습니다.
+        평소에는 PRAGMA data_version 하나만 읽으므로 UI 타이머에서 자주 불러도 됩니다.
+        :return: 변경이 없으면 None, 있으면 (색인에서 바뀐 항목 ID 목록, 충돌로 저장하지 못한 항목 ID 목록)
+        """
+        if self._closed or self._index is None:
+            return None
+        version = self.repository.data_version()
+        conflicts = self._writer.take_conflicts()
+        if version == self._data_version and not conflicts:
+            return None
+        self._data_version = version
+        # 대기 중인 변경을 먼저 기록 (이때 다른 곳에서 먼저 바뀐 항목은 충돌로 걸러짐)
+        self._writer.flush()
+        conflicts += self._writer.take_conflicts()
+        # 충돌 항목은 버전이 같아도 내용이 다를 수 있으므로 부모와 함께 다시 읽음
+        self._sync_with_parents(conflicts)
+        changed = self._reconcile_index()
+        if changed or conflicts:
+            # 기록된 이전 상태가 다른 곳의 변경을 덮어쓸 수 있으므로 되돌리기 기록은 비움
+            self.journal.clear()
+        return sorted(set(changed) | set(conflicts)), conflicts
+
+    def _reconcile_index(self) -> List[int]:
+        """DB의 (버전, 자식 카운터)와 색인을 비교하여 달라진 행만 다시 읽고, 없어진 행은 뺍니다."""
+        index = self._index
+        db = {r[0]: r[1:] for r in self.repository.get_row_versions()}
+        changed = []
+        for tid, key in db.items():
+            t = index.get(tid)
+            if t is None or (t.version, t.child_total, t.child_completed) != key:
+                changed.append(tid)
+        removed = [tid for tid in index.by_id if tid not in db]
+        if changed:
+            index.upsert_many(self.repository.get_many(changed))
+            # 다른 곳에서 내용이 바뀌었을 수 있으므로 태그도 다시 만듦
+            self.repository.sync_tags(changed)
+        if removed:
+            index.remove(removed)
+        return changed + removed
+
+    def invalidate_index(self) -> None:
+        """다른 경로(유지보수 작업 등)로 DB가 바뀐 경우 다음 조회 때 색인을 다시 읽게 합니다."""
+        self._index = None
+        # 기록된 이전 상태가 DB와 어긋날 수 있으므로 되돌리기 기록도 비움
+        self.journal.clear()
+
+    def _invalidate_index_on_ui(self) -> None:
+        """
+        색인과 되돌리기 기록은 UI 스레드에서만 다루므로, 작업 스레드에서 호출되면 무효화를 UI 스레드로 넘깁니다.
+        넘어가기 전에 UI에서 실행된 명령은 버전 확인에서 충돌로 걸러져 check_external_changes가 다시 맞춥니다.
+        """
+        if self.call_on_ui is None or threading.current_thread() is threading.main_thread():
+            self.invalidate_index()
+        else:
+            self.call_on_ui(self.invalidate_index)
+
+    def _sync_rows(self, todo_ids: List[int]) -> None:
+        """지정한 항목만 DB에서 다시 읽어 색인에 반영합니다 (없어지거나 보관된 항목은 제거)."""
+        if self._index is None or not todo_ids:
+            return
+        rows = [t for t in self.repository.get_many(todo_ids) if not t.archived_at]
+        self._index.upsert_many(rows)
+        found = {t.id for t in rows}
+        self._index.remove([tid for tid in todo_ids if tid not in found])
+
+    def _sync_with_parents(self, todo_ids: List[int]) -> None:
+        """항목과 그 부모(자식 진행 카운터가 바뀌었을 수 있음)를 다시 읽어 색인에 반영합니다."""
+        if self._index is None or not todo_ids:
+            return
+        ids = set(todo_ids)
+        for tid in todo_ids:
+            t = self._index.get(tid)
+            if t is not None and t.parent_id is not None:
+                ids.add(t.parent_id)
+        self._sync_rows(list(ids))
+
+    def get_todo(self, todo_id: int) -> Optional[Todo]:
+        """ID로 할 일을 찾습니다 (O(1), DB 조회 없음)."""
+        return self.index.get(todo_id)
 
     def add_todo(self, content: str) -> Optional[Todo]:
         """
@@ -23,82 +165,494 @@ class TodoService:
         if not content.strip():
             # 내용은 비어 있을 수 없습니다 (간단한 유효성 검사).
             return None
-        return self.repository.create(content)
+        self._writer.flush()
+        todo = self.repository.create(content)
+        if todo and self._index is not None:
+            self._index.upsert(todo)
+        return todo
 
     def get_all_todos(self) -> List[Todo]:
         """
         모든 할 일 목록을 가져옵니다.
         :return: Todo 객체 리스트
         """
-        return self.repository.get_all()
+        return sorted(self.index.by_id.values(), key=lambda t: t.created_at or '', reverse=True)
 
     def update_todo_status(self, todo_id: int, status: str) -> bool:
         """
-        할 일의 상태를 업데이트합니다.
+        할 일의 상태를 업데이트합니다. 완료는 하위 항목 전체에 적용됩니다.
         :param todo_id: 할 일 ID
         :param status: 새로운 상태 ('pending' 또는 'completed')
         :return: 성공 여부
         """
-        if status not in ['pending', 'completed']:
+        if status not in ['pending', 'completed'] or self.get_todo(todo_id) is None:
             return False
-        return self.repository.update_status(todo_id, status)
+        self.set_status([todo_id], status)
+        return True
 
     def delete_todo(self, todo_id: int) -> bool:
         """
-        할 일을 삭제합니다.
+        할 일을 하위 항목과 함께 삭제합니다.
         :param todo_id: 삭제할 할 일의 ID
         :return: 성공 여부
         """
-        return self.repository.delete(todo_id)
+        return self.delete_many([todo_id]) > 0
 
     # ---- Advanced helpers (non-breaking additions) ----
     def add_todo_adv(self, content: str, parent_id: Optional[int] = None) -> Optional[Todo]:
-        if not content.strip():
+        """
+        빠른 입력 문법으로 항목을 추가합니다: #태그는 내용에 남고, !1~!3 우선순위와 @날짜(마감)는 항목 값이 됩니다.
+        """
+        parsed = parse_quick_add(content)
+        if not parsed.content.strip():
             return None
-        if hasattr(self.repository, 'create_advanced'):
-            return self.repository.create_advanced(content, parent_id)
-        return self.repository.create(content)
+        self._writer.flush()
+        todo = self.repository.create_advanced(parsed.content, parent_id, priority=parsed.priority,
+                                               due_at=parsed.due_at)
+        if todo and self._index is not None:
+            self._index.upsert(todo)
+            if parent_id is not None:
+                self._sync_rows([parent_id])
+        if todo and todo.due_at and self.on_schedule_changed:
+            self.on_schedule_changed([todo])
+        return todo
 
-    def get_all_todos_adv(self, status_filter: Optional[str] = None, show_archived: bool = False) -> List[Todo]:
-        if hasattr(self.repository, 'get_all_advanced'):
-            return self.repository.get_all_advanced(status_filter, show_archived)
-        return self.repository.get_all()
+    def get_all_todos_adv(self, status_filter: Optional[str] = None) -> List[Todo]:
+        """보관되지 않은 모든 항목 (부모별 정렬 순서). 보관 항목은 get_archived_page로 조회합니다."""
+        return list(self.index.iter_all(status_filter))
+
+    def get_children(self, parent_id: Optional[int], status_filter: Optional[str] = None,
+                     after=None, start_at=None, before=None, limit: Optional[int] = None) -> List[Todo]:
+        """
+        한 부모의 (보관되지 않은) 직계 자식을 정렬 순서대로 가져옵니다. parent_id가 None이면 최상위 항목입니다.
+        after/start_at/before는 (sort_order, id) 키로, 페이지 단위 조회에 사용합니다.
+        """
+        return self.index.children(parent_id, status_filter,
+                                   after=after, start_at=start_at, before=before, limit=limit)
+
+    def ids_with_children(self, parent_ids: List[int], status_filter: Optional[str] = None) -> Set[int]:
+        return self.index.ids_with_children(parent_ids, status_filter)
+
+    def search(self, query: str, limit: int = 200, status_filter: Optional[str] = None,
+               include_archived: bool = False, tags: Optional[List[str]] = None) -> List[Todo]:
+        """전문 검색 결과(관련도 순). 상태 필터와 태그(모두 포함)도 검색 쿼리에서 함께 거릅니다."""
+        self._writer.flush()
+        return self.repository.search(query, limit, include_archived, status_filter, tags)
+
+    def find_by_tags(self, tags: List[str], status_filter: Optional[str] = None, limit: Optional[int] = None,
+                     within: Optional[List[int]] = None) -> List[Todo]:
+        """
+        모든 태그를 가진 활성 항목 (최근 추가 순). 조건 검색은 DB의 todo_tags 색인으로 처리합니다.
+        :param within: 주어지면 이 ID 중에서만 찾음 (오늘/지연 보기와 함께 쓸 때)
+        """
+        self._writer.flush()
+        index = self.index
+        ids = self.repository.find_by_tags(tags, status_filter, limit, within)
+        return [t for t in (index.get(tid) for tid in ids) if t is not None]
+
+    def get_tags(self) -> List[Tuple[str, int]]:
+        """사용 중인 태그와 항목 수 (많은 순)."""
+        return self.repository.get_tag_counts()
+
+    def get_ancestors(self, todo_id: int) -> List[Todo]:
+        """최상위부터 바로 위 부모까지의 조상 목록 (색인 조회)."""
+        return self.index.ancestors(todo_id)
+
+    def get_subtree_ids(self, todo_ids: List[int]) -> List[int]:
+        """항목과 그 모든 자손의 ID 목록 (색인 조회)."""
+        return self.index.subtree_ids(todo_ids)
 
     def update_todos_status_bulk(self, todo_ids: List[int], status: str) -> int:
-        if status not in ['pending', 'completed']:
+        return self.set_status(todo_ids, status)
+
+    def archive_todos(self, todo_ids: List[int]) -> int:
+        """항목들을 하위 항목과 함께 보관합니다."""
+        self._writer.flush()
+        count = self.repository.archive_subtrees(todo_ids)
+        if count and self._index is not None:
+            # 보관된 항목은 색인에서 빠지고, 남은 부모의 카운터만 다시 읽음
+            self._sync_with_parents(self._index.subtree_ids(todo_ids))
+            # 되돌리기 기록의 이전 상태에는 보관 전 값이 들어 있으므로 비움
+            self.journal.clear()
+        return count
+
+    # ---- Commands (write-behind + undo/redo) ----
+    def _with_parent_counts(self, states: TodoStates) -> TodoStates:
+        """
+        states를 적용했을 때의 자식 카운터를 DB 트리거와 같은 규칙으로 계산합니다.
+        카운터는 명령이 기록한 값이 아니라 현재 값(다시 삽입되는 항목은 0)에서 증감하므로,
+        되돌리기 전에 자식이 추가되었더라도 DB와 어긋나지 않습니다.
+        """
+        index = self.index
+        result: TodoStates = {}
+        for tid, t in states.items():
+            if t is not None:
+                cur = index.get(tid)
+                t = replace(t, child_total=cur.child_total if cur else 0,
+                            child_completed=cur.child_completed if cur else 0)
+            result[tid] = t
+        deltas: Dict[int, List[int]] = {}
+
+        def count(t: Optional[Todo], sign: int) -> None:
+            if t is not None and t.parent_id is not None and not t.archived_at:
+                d = deltas.setdefault(t.parent_id, [0, 0])
+                d[0] += sign
+                d[1] += sign * (t.status == 'completed')
+
+        for tid, new in list(result.items()):
+            count(index.get(tid), -1)
+            count(new, 1)
+        for pid, (total, completed) in deltas.items():
+            parent = result[pid] if pid in result else index.get(pid)
+            if parent is None or (total == 0 and completed == 0):
+                continue
+            result[pid] = replace(parent, child_total=parent.child_total + total,
+                                  child_completed=parent.child_completed + completed)
+        return result
+
+    def _apply_states(self, states: TodoStates) -> None:
+        index = self.index
+        # 바뀌는 행은 버전을 현재 값에서 1 올리고, 기록 때 DB가 아직 현재 버전인지 확인하게 함
+        expected = {}
+        versioned: TodoStates = {}
+        for tid, t in states.items():
+            cur = index.get(tid)
+            # 색인에 없는 보관 항목(되돌린 삭제에 딸린 것)은 버전을 알 수 없으므로 확인 없이 기록
+            if cur is not None or (t is not None and not t.archived_at):
+                expected[tid] = cur.version if cur else None
+            versioned[tid] = replace(t, version=(cur.version if cur else t.version) + 1) if t is not None else None
+        counted = self._with_parent_counts(versioned)
+        index.remove([tid for tid, t in counted.items() if t is None or t.archived_at])
+        index.upsert_many([t for t in counted.values() if t is not None and not t.archived_at])
+        # 카운터만 바뀐 부모 행은 DB 트리거가 맞추므로 기록하지 않음
+        self._writer.submit({tid: counted[tid] for tid in states}, expected)
+        self._notify_schedule({tid: counted[tid] for tid in states})
+
+    def _notify_schedule(self, states: TodoStates) -> None:
+        if self.on_schedule_changed:
+            scheduled = [t for t in states.values()
+                         if t is not None and not t.archived_at and (t.due_at or t.remind_at)]
+            if scheduled:
+                self.on_schedule_changed(scheduled)
+
+    def _execute(self, label: str, after: TodoStates) -> None:
+        """명령 결과를 색인에 바로 반영하고, DB 기록을 예약하고, 되돌리기 기록에 남깁니다."""
+        if not after:
+            return
+        before = {tid: self.index.get(tid) for tid in after}
+        self._apply_states(after)
+        self.journal.record(TodoCommand(label, before, after))
+
+    def _execute_direct(self, label: str, after: TodoStates, write: Callable[[], int]) -> int:
+        """
+        저장소의 한 문장짜리 쓰기(하위 트리 완료, 이동)로 DB에 바로 기록하는 명령.
+        대기 중인 기록을 먼저 반영한 뒤 write()를 실행하고, 미리 계산한 결과를 색인과 되돌리기 기록에 남깁니다.
+        바뀐 행의 버전은 DB 트리거가 1 올리므로 색인에도 1 올린 값을 넣습니다.
+        :param write: 저장소를 호출하고 바뀐 행 수를 돌려주는 함수 (0이면 색인과 기록을 건드리지 않음)
+        :return: write()의 결과
+        """
+        if not after:
             return 0
-        if hasattr(self.repository, 'update_status_bulk'):
-            return self.repository.update_status_bulk(todo_ids, status)
-        count = 0
-        for tid in todo_ids:
-            if self.repository.update_status(tid, status):
-                count += 1
+        self._writer.flush()
+        count = write()
+        if not count:
+            return 0
+        index = self.index
+        before = {tid: index.get(tid) for tid in after}
+        versioned: TodoStates = {tid: replace(t, version=before[tid].version + 1) for tid, t in after.items()}
+        counted = self._with_parent_counts(versioned)
+        index.upsert_many(list(counted.values()))
+        self.journal.record(TodoCommand(label, before, versioned))
+        self._notify_schedule(versioned)
         return count
 
+    def undo(self) -> Optional[str]:
+        """마지막 명령을 되돌립니다. 되돌린 명령 이름을 반환합니다 (없으면 None)."""
+        command = self.journal.pop_undo()
+        if command is None:
+            return None
+        self._apply_states(command.before)
+        return command.label
+
+    def redo(self) -> Optional[str]:
+        """되돌린 명령을 다시 실행합니다. 실행한 명령 이름을 반환합니다 (없으면 None)."""
+        command = self.journal.pop_redo()
+        if command is None:
+            return None
+        self._apply_states(command.after)
+        return command.label
+
+    def set_status(self, todo_ids: List[int], status: str) -> int:
+        """
+        상태를 바꿉니다. 완료는 하위 항목 전체에, 미완료는 지정한 항목에만 적용됩니다.
+        반복 항목은 완료하는 대신 같은 항목의 마감/알림을 다음 회차로 옮기고, 그 하위 항목을 미완료로 되돌립니다.
+        :return: 상태가 바뀐 항목 수
+        """
+        if status not in ['pending', 'completed']:
+            return 0
+        index = self.index
+        targets = index.subtree_ids(todo_ids) if status == 'completed' else todo_ids
+        rolled: TodoStates = {}
+        if status == 'completed':
+            now = datetime.now()
+            for tid in targets:
+                t = index.get(tid)
+                if t is not None and t.status == 'pending' and t.recurrence:
+                    t = self._roll_forward(t, now)
+                    if t is not None:
+                        rolled[tid] = t
+        restart = set(index.subtree_ids(list(rolled))) - set(rolled) if rolled else set()
+        after = {}
+        for tid in targets:
+            t = index.get(tid)
+            if t is None:
+                continue
+            if tid in rolled:
+                after[tid] = rolled[tid]
+            elif tid in restart:
+                if t.status != 'pending':
+                    after[tid] = replace(t, status='pending')
+            elif t.status != status:
+                after[tid] = replace(t, status=status)
+        if rolled:
+            # 반복 항목은 행마다 마감/알림이 달라지므로 쓰기 지연 큐로 기록
+            self._execute('완료', after)
+            return len(after)
+        if status == 'completed':
+            # 하위 트리 전체를 클로저 조인 한 문장으로 완료
+            return self._execute_direct('완료', after, lambda: self.repository.complete_subtrees(todo_ids))
+        return self._execute_direct('미완료', after, lambda: self.repository.update_status_bulk(list(after), status))
+
+    @staticmethod
+    def _roll_forward(t: Todo, now: datetime) -> Optional[Todo]:
+        """반복 항목의 다음 회차 (마감이 없거나 규칙을 모르면 None). 알림은 마감과의 간격을 유지합니다."""
+        due = parse_schedule(t.due_at)
+        if due is None:
+            return None
+        next_due = next_due_after(due, t.recurrence, now)
+        if next_due is None:
+            return None
+        remind = parse_schedule(t.remind_at)
+        return replace(t, due_at=format_schedule(next_due),
+                       remind_at=format_schedule(remind + (next_due - due)) if remind else None)
+
     def delete_many(self, todo_ids: List[int]) -> int:
-        if hasattr(self.repository, 'delete_many'):
-            return self.repository.delete_many(todo_ids)
-        count = 0
-        for tid in todo_ids:
-            if self.repository.delete(tid):
-                count += 1
-        return count
+        """
+        항목들을 하위 항목과 함께 삭제합니다. 색인에 없는 보관된 자손(콜드 테이블 포함)도 저장소가 함께 찾아 지우고,
+        지운 행을 그대로 되돌리기 기록에 남깁니다 (되돌리면 보관 상태 그대로 todos에 다시 들어감).
+        :return: 삭제된 항목 수
+        """
+        index = self.index
+        self._writer.flush()
+        removed = self.repository.delete_many(todo_ids)
+        if not removed:
+            return 0
+        # 색인에 있는 항목은 색인의 값(같은 버전)을 이전 상태로 씀
+        before: TodoStates = {t.id: index.get(t.id) or t for t in removed}
+        parents = {t.parent_id for t in before.values() if t.parent_id is not None} - set(before)
+        index.remove(list(before))
+        self._sync_rows(list(parents))
+        self.journal.record(TodoCommand('삭제', before, {tid: None for tid in before}))
+        return len(removed)
+
+    def move_todo(self, todo_id: int, parent_id: Optional[int], prev_id: Optional[int] = None,
+                  next_id: Optional[int] = None) -> bool:
+        """
+        항목을 parent_id 아래 prev_id 뒤(또는 next_id 앞)로 옮깁니다.
+        앞뒤 순서값 사이 값을 쓰므로 보통 옮긴 항목 하나만 바뀌고, 간격이 좁아졌을 때만 형제를 다시 매깁니다.
+        :return: 성공 여부 (자기 자신이나 자손 아래로 옮기려는 경우 등은 False)
+        """
+        index = self.index
+        todo = index.get(todo_id)
+        if todo is None:
+            return False
+        if parent_id is not None:
+            if parent_id == todo_id or index.get(parent_id) is None \
+                    or any(a.id == todo_id for a in index.ancestors(parent_id)):
+                return False
+        siblings = [cid for cid in index.child_ids(parent_id) if cid != todo_id]
+        if prev_id in siblings:
+            pos = siblings.index(prev_id) + 1
+        elif next_id in siblings:
+            pos = siblings.index(next_id)
+        else:
+            pos = len(siblings)
+        if parent_id == todo.parent_id and index.child_ids(parent_id).index(todo_id) == pos:
+            return True  # 제자리
+        lo = (index.by_id[siblings[pos - 1]].sort_order or 0) if pos > 0 else None
+        hi = (index.by_id[siblings[pos]].sort_order or 0) if pos < len(siblings) else None
+        if lo is None and hi is None:
+            rank = RANK_GAP
+        elif hi is None:
+            rank = lo + RANK_GAP
+        elif lo is None:
+            rank = hi - RANK_GAP
+        else:
+            rank = (lo + hi) // 2
+        after: TodoStates = {}
+        if lo is not None and hi is not None and min(rank - lo, hi - rank) < MIN_RANK_GAP:
+            # 간격이 좁아진 경우에만 형제 전체를 다시 매김 (기록은 다른 변경과 함께 작업 스레드에서)
+            ordered = siblings[:pos] + [todo_id] + siblings[pos:]
+            for i, cid in enumerate(ordered, start=1):
+                t = todo if cid == todo_id else index.by_id[cid]
+                if cid == todo_id or t.sort_order != i * RANK_GAP:
+                    after[cid] = replace(t, parent_id=parent_id, sort_order=i * RANK_GAP)
+        else:
+            after[todo_id] = replace(todo, parent_id=parent_id, sort_order=rank)
+        # 옮긴 행 하나만 갱신하고 하위 트리는 클로저 트리거가 따라 옮김 (형제 재배치도 같은 트랜잭션)
+        reranked = {tid: t.sort_order for tid, t in after.items() if tid != todo_id}
+        return bool(self._execute_direct('이동', after, lambda: int(
+            self.repository.move(todo_id, parent_id, after[todo_id].sort_order, reranked))))
+
+    # ---- Schedule (due dates / reminders / recurrence) ----
+    def set_schedule(self, todo_id: int, due_at: Optional[str], remind_at: Optional[str] = None,
+                     recurrence: Optional[str] = None) -> bool:
+        """
+        마감/알림 시각과 반복 규칙을 바꿉니다 (되돌리기 가능).
+        시각은 SCHEDULE_FORMAT 문자열이며, 반복에는 마감 시각이 필요합니다.
+        :return: 성공 여부 (형식이 틀리거나 항목이 없으면 False)
+        """
+        t = self.get_todo(todo_id)
+        due_at, remind_at = due_at or None, remind_at or None
+        if t is None or any(value and parse_schedule(value) is None for value in (due_at, remind_at)):
+            return False
+        recurrence = recurrence or None
+        if recurrence is not None and (recurrence not in RECURRENCE_RULES or due_at is None):
+            return False
+        if (t.due_at, t.remind_at, t.recurrence) != (due_at, remind_at, recurrence):
+            self._execute('일정 변경', {todo_id: replace(t, due_at=due_at, remind_at=remind_at, recurrence=recurrence)})
+        return True
+
+    def dismiss_reminder(self, todo_id: int) -> None:
+        """보여준 알림을 지웁니다. 되돌리기 기록에는 남기지 않습니다."""
+        t = self.get_todo(todo_id)
+        if t is not None and t.remind_at:
+            self._apply_states({todo_id: replace(t, remind_at=None)})
+
+    def get_scheduled_todos(self) -> List[Todo]:
+        """마감이나 알림 시각이 있는 활성 항목 (색인 조회)."""
+        return self.index.scheduled()
+
+    def get_due_today(self, now: Optional[datetime] = None) -> List[Todo]:
+        """오늘 마감인 미완료 항목 (마감 시각 순)."""
+        start = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.index.due_between(format_schedule(start), format_schedule(start + timedelta(days=1)), 'pending')
+
+    def get_overdue(self, now: Optional[datetime] = None) -> List[Todo]:
+        """마감이 지난 미완료 항목 (마감 시각 순)."""
+        return self.index.due_between(None, format_schedule(now or datetime.now()), 'pending')
+
+    # ---- Stats ----
+    def get_stats(self, weeks: int = 8, today: Optional[datetime] = None) -> TodoStats:
+        """
+        대시보드 집계를 읽습니다. 트리거가 유지하는 집계 행과 색인 한 행만 읽으므로 항목 수와 관계없이 일정합니다.
+        UI 타이머에서 부르므로 쓰기 지연 큐를 비우지 않습니다. 아직 기록되지 않은 명령은 작업 스레드가
+        기록한 뒤(FLUSH_DELAY_SECONDS 이내) 다음 조회에 반영됩니다.
+        :param weeks: 이번 주를 포함한 최근 주 수 (주는 월요일 시작, 로컬 날짜)
+        """
+        today = (today or datetime.now()).date()
+        first = today - timedelta(days=today.weekday() + 7 * (weeks - 1))
+        buckets = {(first + timedelta(weeks=i)).isoformat(): [0, 0] for i in range(weeks)}
+        counts, daily, oldest = self.repository.read_stats(first.isoformat())
+        for day, created, completed in daily:
+            d = datetime.strptime(day, '%Y-%m-%d').date()
+            bucket = buckets.get((d - timedelta(days=d.weekday())).isoformat())
+            if bucket is not None:
+                bucket[0] += created
+                bucket[1] += completed
+        return TodoStats(pending=counts.get('pending', 0), completed=counts.get('completed', 0),
+                         archived=counts.get('archived', 0),
+                         weeks=[(week, created, completed) for week, (created, completed) in buckets.items()],
+                         oldest_pending=oldest)
+
+    def get_archived_page(self, before=None, since: Optional[str] = None, until: Optional[str] = None,
+                          limit: int = 100) -> List[Todo]:
+        """보관함 한 페이지 (최근 보관 순). before는 이전 페이지 마지막 행의 (archived_at, id)."""
+        self._writer.flush()
+        return self.repository.get_archived_page(before, since, until, limit)
+
+    def restore_archived(self, todo_ids: List[int]) -> int:
+        """보관된 항목을 (하위 항목, 보관된 조상과 함께) 되살립니다. 되살린 항목 수를 반환합니다."""
+        self._writer.flush()
+        restored = self.repository.restore_archived(todo_ids)
+        if restored and self._index is not None:
+            rows = self.repository.get_many(restored)
+            self._index.upsert_many(rows)
+            self._sync_rows(list({t.parent_id for t in rows if t.parent_id is not None}))
+            self.journal.clear()
+        return len(restored)
+
+    def delete_archived(self, todo_ids: List[int]) -> int:
+        """보관된 항목을 하위 항목과 함께 영구 삭제합니다 (되돌릴 수 없음)."""
+        self._writer.flush()
+        removed = self.repository.delete_many(todo_ids)
+        if self._index is not None:
+            self._index.remove([t.id for t in removed])
+        self.journal.clear()
+        return len(removed)
+
+    # ---- Import / export ----
+    def export(self, path: str, fmt: Optional[str] = None, progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        모든 할 일(보관 포함)을 파일로 내보냅니다. 계층(parent_id)과 순서값을 그대로 담습니다.
+        :param fmt: 'jsonl' 또는 'csv' (없으면 확장자로 판단)
+        :param progress: 진행 콜백 (인자: 지금까지 쓴 행 수). 작업 스레드에서 호출될 수 있음
+        :return: 내보낸 항목 수
+        """
+        fmt = detect_format(path, fmt)
+        self._writer.flush()
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            return dump(self.repository.iter_export_rows(), f, fmt, progress)
 
-    def update_sort_orders(self, parent_id: Optional[int], ordered_ids: List[int]) -> None:
-        if hasattr(self.repository, 'update_sort_orders'):
-            self.repository.update_sort_orders(parent_id, ordered_ids)
+    def import_(self, path: str, fmt: Optional[str] = None, progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        export로 만든 파일에서 할 일을 새 항목으로 추가합니다 (계층/순서 유지, 배치 단위 트랜잭션).
+        :return: 추가된 항목 수
+        """
+        fmt = detect_format(path, fmt)
+        self._writer.flush()
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            count = self.repository.import_rows(load(f, fmt), progress=progress)
+        if count:
+            # 작업 스레드에서 호출될 수 있으므로 색인은 UI 스레드에서 버리고 다음 조회 때 다시 읽음
+            self._invalidate_index_on_ui()
+        return count
 
     def archive_completed_older_than_days(self, days: int) -> int:
-        if hasattr(self.repository, 'archive_completed_older_than_days'):
-            return self.repository.archive_completed_older_than_days(days)
-        return 0
-
-    def add_from_text(self, text: str, parent_id: Optional[int] = None) -> int:
-        lines = [ln.strip() for ln in (text or '').splitlines()]
-        items = [ln for ln in lines if ln]
-        count = 0
-        for ln in items:
-            t = self.add_todo_adv(ln, parent_id)
-            if t:
-                count += 1
+        self._writer.flush()
+        count = self.repository.archive_completed_older_than_days(days)
+        if count:
+            self.invalidate_index()
         return count
+
+    def run_archive_maintenance(self, days: int, min_interval_seconds: int) -> int:
+        """
+        주기 유지보수용 자동 보관. 마지막 실행 후 간격이 지나지 않았으면 아무것도 보관하지 않습니다.
+        보관된 항목(직접 보관한 것 포함)은 배치 단위로 콜드 테이블로 옮겨 todos에는 사용 중인 항목만 남깁니다.
+        :return: 새로 보관된 항목 수
+        """
+        self._writer.flush()
+        count = self.repository.archive_completed_if_due(days, min_interval_seconds)
+        if count:
+            # MaintenanceService의 작업 스레드에서 호출되므로 색인은 UI 스레드에서 버리고 다음 조회 때 다시 읽음
+            self._invalidate_index_on_ui()
+        # 색인에는 보관 항목이 없으므로 옮겨도 다시 읽을 필요 없음
+        self.repository.move_archived_to_cold()
+        return count
+
+    def add_many(self, contents: List[str], parent_id: Optional[int] = None, skip_existing: bool = False) -> int:
+        """
+        여러 할 일을 한 번에 추가합니다 (단일 트랜잭션).
+        :param skip_existing: 같은 부모 아래 이미 있는 내용은 건너뜀
+        :return: 추가된 항목 수
+        """
+        items = [c.strip() for c in contents if c and c.strip()]
+        if not items:
+            return 0
+        self._writer.flush()
+        new_ids = self.repository.bulk_create(items, parent_id, skip_existing)
+        self._sync_rows(new_ids + ([parent_id] if new_ids and parent_id is not None else []))
+        return len(new_ids)
+
+    def add_from_text(self, text: str, parent_id: Optional[int] = None, skip_existing: bool = False) -> int:
+        return self.add_many((text or '').splitlines(), parent_id, skip_existing)
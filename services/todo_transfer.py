@@ -0,0 +1,91 @@
+"""
+Todo 내보내기/가져오기 파일 형식 (JSON Lines, CSV).
+행을 하나씩 쓰고 읽는 제너레이터로만 다루므로 파일 크기와 관계없이 메모리 사용이 일정합니다.
+"""
+import csv
+import json
+import os
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+from repositories.todo_repository import EXPORT_FIELDS
+from services.todo_scheduler import RECURRENCE_RULES
+
+FORMATS = ('jsonl', 'csv')
+# 진행 콜백 호출 간격 (행 수)
+PROGRESS_EVERY = 1000
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """fmt가 없으면 확장자로 형식을 정합니다. 지원하지 않는 형식이면 ValueError."""
+    fmt = (fmt or os.path.splitext(path)[1].lstrip('.')).lower()
+    if fmt == 'json':
+        fmt = 'jsonl'
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt or path}")
+    return fmt
+
+
+def dump(rows: Iterable[tuple], f: TextIO, fmt: str, progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    EXPORT_FIELDS 순서의 튜플을 파일에 씁니다.
+    :return: 쓴 행 수
+    """
+    count = 0
+    if fmt == 'csv':
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_FIELDS)
+        write = lambda row: writer.writerow(['' if v is None else v for v in row])
+    else:
+        write = lambda row: f.write(json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False) + "\n")
+    for row in rows:
+        write(row)
+        count += 1
+        if progress and count % PROGRESS_EVERY == 0:
+            progress(count)
+    if progress:
+        progress(count)
+    return count
+
+
+def _to_int(value) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalize(record: dict) -> Optional[dict]:
+    """파일에서 읽은 값을 저장 가능한 형태로 맞춥니다. 내용이 없으면 None (건너뜀)."""
+    content = str(record.get('content') or '').strip()
+    if not content:
+        return None
+    status = record.get('status')
+    priority = _to_int(record.get('priority'))
+    return {
+        'id': _to_int(record.get('id')),
+        'parent_id': _to_int(record.get('parent_id')),
+        'content': content,
+        'status': status if status in ('pending', 'completed') else 'pending',
+        'created_at': record.get('created_at') or None,
+        'sort_order': _to_int(record.get('sort_order')) or 0,
+        'archived_at': record.get('archived_at') or None,
+        'due_at': record.get('due_at') or None,
+        'remind_at': record.get('remind_at') or None,
+        'recurrence': record.get('recurrence') if record.get('recurrence') in RECURRENCE_RULES else None,
+        'priority': priority if priority in (1, 2, 3) else None,
+    }
+
+
+def load(f: TextIO, fmt: str) -> Iterator[dict]:
+    """파일의 행을 하나씩 읽어 정규화된 dict로 돌려줍니다 (빈 줄/내용 없는 행은 건너뜀)."""
+    if fmt == 'csv':
+        records = csv.DictReader(f)
+    else:
+        records = (json.loads(line) for line in f if line.strip())
+    for record in records:
+        if isinstance(record, dict):
+            row = _normalize(record)
+            if row is not None:
+                yield row
@@ -0,0 +1,124 @@
+"""
+트라이그램(3글자 조각) 색인과 유사도 검색.
+
+문서마다 앞부분(INDEX_CHARS)을 정규화해 트라이그램 집합을 만들고, 트라이그램 → 문서 id 집합으로 색인합니다.
+검색어의 트라이그램 중 일치하는 비율로 점수를 매기므로 오타 한두 글자는 점수만 조금 낮아지고 결과에 남습니다.
+정규화: 대소문자 무시(casefold), NFD로 분해 후 결합 부호 제거(é → e). 한글 음절도 NFD로 자모 단위가 되므로
+'클립보드'를 '클립뵤드'로 잘못 써도 자모 하나 차이로 취급됩니다.
+문서 추가/제거는 그 문서의 트라이그램만 고치므로 전체를 다시 만들지 않습니다.
+"""
+import math
+import re
+import unicodedata
+from bisect import bisect_right
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+# 문서마다 색인할 앞부분 길이 (수 MB 내용도 색인 비용이 일정하도록)
+INDEX_CHARS = 2000
+# 검색어 트라이그램 중 이 비율 이상 일치해야 결과에 포함
+MIN_SCORE = 0.4
+# 정규화된 내용에 검색어가 그대로 들어 있으면 더하는 점수
+SUBSTRING_BONUS = 1.0
+
+_TOKEN = re.compile(r'\w+')
+
+
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize('NFD', text.casefold())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """단어마다 앞에 공백 둘, 뒤에 공백 하나를 붙여 3글자씩 자릅니다 (짧은 단어도 조각이 생기도록)."""
+    grams = set()
+    for token in _TOKEN.findall(normalize(text)):
+        padded = f"  {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """
+    문서 id → 트라이그램 / 트라이그램 → 문서 id 양방향 색인.
+    """
+    def __init__(self, index_chars: int = INDEX_CHARS):
+        """
+        :param index_chars: 문서마다 색인할 앞부분 글자 수
+        """
+        self.index_chars = index_chars
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._docs: Dict[Hashable, Tuple[FrozenSet[str], str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id) -> bool:
+        return doc_id in self._docs
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """문서를 색인합니다. 이미 있는 id면 새 내용으로 바꿉니다."""
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        head = text[:self.index_chars]
+        grams = trigrams(head)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(doc_id)
+        # 부분 문자열 보너스 계산용으로 정규화된 앞부분도 보관
+        self._docs[doc_id] = (grams, normalize(head))
+
+    def remove(self, doc_id: Hashable) -> None:
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for gram in doc[0]:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._docs.clear()
+
+    def search(self, query: str, limit: Optional[int] = None,
+               min_score: float = MIN_SCORE) -> List[Tuple[Hashable, float]]:
+        """
+        검색어와 비슷한 문서를 점수 높은 순으로 돌려줍니다.
+        :param limit: 최대 결과 수
+        :param min_score: 검색어 트라이그램 중 일치해야 하는 최소 비율
+        :return: (문서 id, 점수) 목록. 점수가 같으면 순서는 정하지 않음
+            limit이 있으면 일치한 트라이그램 수 상위 limit개 안에서 점수를 매김
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        total = len(grams)
+        needed = max(1, math.ceil(min_score * total))
+        counts: Counter = Counter()
+        # 드문 트라이그램부터 세고, 남은 조각을 모두 맞혀도 needed에 못 미치는 시점부터는 새 후보를 받지 않음
+        # (Counter.update / 집합 교집합은 C에서 돌므로 항목마다 파이썬 루프를 돌지 않음)
+        ordered = sorted(grams, key=lambda g: len(self._postings.get(g, ())))
+        for i, gram in enumerate(ordered):
+            posting = self._postings.get(gram)
+            if not posting:
+                continue
+            if total - i >= needed:
+                counts.update(posting)
+            else:
+                counts.update(posting.intersection(counts))
+        ranked = sorted(counts.items(), key=itemgetter(1), reverse=True)
+        cut = bisect_right([-count for _, count in ranked], -needed)
+        # 부분 문자열 보너스는 일치 수 상위 후보에만 계산 (후보 전부에 문자열 검색을 하지 않도록)
+        ranked = ranked[:min(cut, limit) if limit is not None else cut]
+        needle = ' '.join(_TOKEN.findall(normalize(query)))
+        results = []
+        for doc_id, count in ranked:
+            score = count / total
+            if needle and needle in self._docs[doc_id][1]:
+                score += SUBSTRING_BONUS
+            results.append((doc_id, score))
+        results.sort(key=itemgetter(1), reverse=True)
+        return results
@@ -0,0 +1,117 @@
+"""
+쓰기 지연(write-behind) 큐.
+
+화면 스레드는 바뀐 상태를 키(항목 id, 내용 해시 등)별로 넘기기만 하고, 작업 스레드가 잠시 모았다가
+한 번에 기록합니다. 같은 키가 기록 전에 여러 번 바뀌면 마지막 상태 하나만 기록됩니다.
+실제 기록 방법은 하위 클래스의 _write가 정합니다.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class WriteBehind:
+    """
+    키별 최종 상태를 모아 두었다가 작업 스레드에서 한 번에 기록합니다.
+    기록이 실패하면 그 배치를 다시 큐에 넣고, 그 사이 들어온 더 새로운 상태는 덮어쓰지 않습니다.
+    """
+    # 작업 스레드 이름과 기록 실패 시 알릴 작업 이름 (하위 클래스에서 정함)
+    thread_name = "write-behind"
+    action = "변경 사항 저장"
+
+    def __init__(self, delay: float, on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        :param delay: 첫 변경 후 기록까지 기다리는 시간(초). 그 사이 들어온 변경은 함께 기록됨
+        :param on_error: 기록이 실패하면 실패한 스레드(대개 작업 스레드)에서 호출. 없으면 오류를 출력함.
+            실패한 배치는 다시 큐에 들어가 다음 기록 때 함께 기록됨
+        """
+        self.delay = delay
+        self.on_error = on_error
+        self._pending: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        # 기록 중인 배치가 끝나기 전에 다음 배치가 기록되지 않도록 보장 (순서 유지)
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def submit(self, changes: Dict[Hashable, Any], *extra) -> None:
+        """
+        :param changes: 키 → 기록할 최종 상태
+        :param extra: 하위 클래스의 _merge에 그대로 넘기는 값
+        """
+        if not changes:
+            return
+        with self._lock:
+            self._merge(changes, *extra)
+            if not self._closed and (self._worker is None or not self._worker.is_alive()):
+                self._worker = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+                self._worker.start()
+        self._wake.set()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            time.sleep(self.delay)
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        대기 중인 변경을 지금 기록합니다 (어느 스레드에서든 호출 가능).
+        :return: 성공 여부
+        """
+        with self._write_lock:
+            with self._lock:
+                batch = self._take()
+            if batch is None:
+                return True
+            try:
+                self._write(batch)
+            except Exception as e:
+                with self._lock:
+                    self._requeue(batch)
+                self._report(e)
+                return False
+            return True
+
+    def _report(self, error: Exception) -> None:
+        if self.on_error is None:
+            print(f"{self.action} 중 오류 발생: {error}")
+            return
+        try:
+            self.on_error(error)
+        except Exception as e:
+            # 알림이 실패해도 작업 스레드는 계속 돌아야 함
+            print(f"{self.action} 오류 알림 중 오류 발생: {e}")
+
+    def close(self) -> None:
+        """작업 스레드를 멈추고 남은 변경을 기록합니다."""
+        self._closed = True
+        self._wake.set()
+        self.flush()
+
+    # ---- 하위 클래스에서 바꾸는 부분 (_merge/_take/_requeue는 _lock 안에서 호출됨) ----
+    def _merge(self, changes: Dict[Hashable, Any]) -> None:
+        self._pending.update(changes)
+
+    def _take(self):
+        """기록할 배치를 꺼냅니다 (없으면 None)."""
+        if not self._pending:
+            return None
+        batch, self._pending = self._pending, {}
+        return batch
+
+    def _requeue(self, batch) -> None:
+        """기록하지 못한 배치를 되돌립니다. 그 사이 들어온 더 새로운 상태가 우선입니다."""
+        for key, state in batch.items():
+            self._pending.setdefault(key, state)
+
+    def _write(self, batch) -> None:
+        raise NotImplementedError
@@ -0,0 +1,67 @@
+"""
+공통 확인 함수. 트리거가 유지하는 테이블(클로저, 자식 카운터, 상태별 수/날짜별 통계, 태그, 전문 색인)을
+원본 행(todos / todos_archive)에서 다시 계산한 값과 비교합니다.
+"""
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.todo import extract_tags  # noqa: E402
+
+
+def _closure_truth(conn: sqlite3.Connection) -> set:
+    return set(conn.execute('''
+        WITH RECURSIVE tree(ancestor, descendant, depth) AS (
+            SELECT id, id, 0 FROM todos
+            UNION ALL
+            SELECT tree.ancestor, t.id, tree.depth + 1 FROM tree JOIN todos t ON t.parent_id = tree.descendant
+        )
+        SELECT ancestor, descendant, depth FROM tree
+    ''').fetchall())
+
+
+def assert_consistent(db_path: str) -> None:
+    """트리거가 유지하는 값이 원본 행에서 계산한 값과 같은지 확인합니다."""
+    conn = sqlite3.connect(db_path)
+    try:
+        assert set(conn.execute("SELECT ancestor, descendant, depth FROM todo_closure").fetchall()) \
+            == _closure_truth(conn)
+
+        counters = conn.execute('''
+            SELECT t.id, t.child_total, t.child_completed,
+                   (SELECT COUNT(*) FROM todos c WHERE c.parent_id = t.id AND c.archived_at IS NULL),
+                   (SELECT COUNT(*) FROM todos c WHERE c.parent_id = t.id AND c.archived_at IS NULL
+                    AND c.status = 'completed')
+              FROM todos t
+        ''').fetchall()
+        assert [row for row in counters if row[1:3] != row[3:5]] == []
+
+        counts = dict(conn.execute("SELECT status, count FROM todo_status_counts").fetchall())
+        assert counts == {
+            'pending': conn.execute(
+                "SELECT COUNT(*) FROM todos WHERE archived_at IS NULL AND status = 'pending'").fetchone()[0],
+            'completed': conn.execute(
+                "SELECT COUNT(*) FROM todos WHERE archived_at IS NULL AND status = 'completed'").fetchone()[0],
+            'archived': conn.execute(
+                "SELECT COUNT(*) FROM todos_all WHERE archived_at IS NOT NULL").fetchone()[0],
+        }
+        created = dict(conn.execute("SELECT day, created FROM todo_stats WHERE created != 0").fetchall())
+        assert created == dict(conn.execute(
+            "SELECT date(created_at, 'localtime'), COUNT(*) FROM todos_all GROUP BY 1").fetchall())
+
+        rows = conn.execute("SELECT id, content FROM todos_all").fetchall()
+        assert set(conn.execute("SELECT tag, todo_id FROM todo_tags").fetchall()) \
+            == {(tag, tid) for tid, content in rows for tag in extract_tags(content)}
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'todos_fts'").fetchone():
+            assert set(conn.execute("SELECT rowid, content FROM todos_fts").fetchall()) == set(rows)
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    return str(tmp_path / "todos.db")
@@ -0,0 +1,89 @@
+"""
+ClipboardHistory의 LRU 순서와 개수/용량 예산 제거, SQLite 저장 후 다시 불러오기를 확인합니다.
+"""
+from repositories.clipboard_repository import ClipboardRepository
+from services.clipboard_history import ClipboardHistory, content_hash, content_size
+
+
+def _contents(history) -> list:
+    return [entry.content for entry in history.entries()]
+
+
+def test_recopy_moves_to_front():
+    history = ClipboardHistory(max_entries=3)
+    for text in ('a', 'b', 'c'):
+        history.add(text)
+    entry, moved, evicted = history.add('a')
+    assert moved and evicted == []
+    assert entry.hash == content_hash('a')
+    assert _contents(history) == ['a', 'c', 'b']
+    assert history.total_bytes == 3
+
+
+def test_entry_budget_evicts_least_recent():
+    history = ClipboardHistory(max_entries=3)
+    for text in ('a', 'b', 'c'):
+        history.add(text)
+    history.add('a')
+    _, moved, evicted = history.add('d')
+    assert not moved
+    assert [e.content for e in evicted] == ['b']
+    assert _contents(history) == ['d', 'a', 'c']
+
+
+def test_byte_budget_evicts_until_under():
+    history = ClipboardHistory(max_entries=100, max_bytes=12)
+    for text in ('가나', 'abc', 'de'):  # 6 + 3 + 2바이트
+        history.add(text)
+    assert history.total_bytes == 11
+    # 5바이트를 넣으면 16이 되므로 가장 오래된 '가나'(6)만 빼면 됨
+    _, _, evicted = history.add('fghij')
+    assert [e.content for e in evicted] == ['가나']
+    assert _contents(history) == ['fghij', 'de', 'abc']
+    assert history.total_bytes == 10
+    # 다시 복사한 항목은 최근으로 옮겨져 제거 순서가 바뀜
+    history.add('abc')
+    _, _, evicted = history.add('klm')
+    assert [e.content for e in evicted] == ['de']
+    assert history.total_bytes == 11
+
+
+def test_oversized_entry_is_rejected():
+    history = ClipboardHistory(max_bytes=4)
+    history.add('ab')
+    entry, moved, evicted = history.add('abcde')
+    assert entry is None and not moved and evicted == []
+    assert _contents(history) == ['ab']
+
+
+def test_precomputed_hash_and_size_are_used():
+    history = ClipboardHistory()
+    text = '큰 내용' * 10
+    entry, _, _ = history.add(text, content_hash(text), content_size(text))
+    assert history.get(content_hash(text)) is entry
+    assert entry.size == content_size(text)
+
+
+def test_persist_and_reload_with_smaller_budget(tmp_path):
+    path = str(tmp_path / "clipboard.db")
+    history = ClipboardHistory(ClipboardRepository(path), max_entries=10)
+    for text in ('a', 'b', 'c', 'd'):
+        history.add(text)
+    history.add('b')
+    history.close()
+
+    history = ClipboardHistory(ClipboardRepository(path), max_entries=10)
+    assert _contents(history) == ['b', 'd', 'c', 'a']
+    # 다시 복사하면 순서가 이어짐
+    history.add('a')
+    history.close()
+
+    # 예산이 줄면 최근 항목만 불러오고 DB에서도 나머지를 지움
+    history = ClipboardHistory(ClipboardRepository(path), max_entries=2)
+    assert _contents(history) == ['a', 'b']
+    history.close()
+    repo = ClipboardRepository(path)
+    try:
+        assert [e.content for e in repo.load_recent()] == ['a', 'b']
+    finally:
+        repo.close()
@@ -0,0 +1,158 @@
+"""
+ClipboardPoller의 변경 확인(변경 번호 → 텍스트 길이 → 전체 해시)과 확인 간격 조절을 가짜 클립보드로 확인합니다.
+"""
+import pytest
+
+from services import clipboard_poller
+from services.clipboard_history import content_hash
+from services.clipboard_poller import ClipboardPoller
+
+
+class FakeClipboard:
+    def __init__(self, text: str = ''):
+        self.text = text
+        self.sequence = 0
+        self.reads = 0
+        self.length = None
+
+    def copy(self, text: str) -> None:
+        self.text = text
+        self.sequence += 1
+
+    def read_text(self) -> str:
+        self.reads += 1
+        return self.text
+
+
+class ScriptedWake:
+    """wait()에 넘어온 간격을 기록하고, 정해진 횟수 뒤 폴러를 멈춥니다."""
+    def __init__(self, poller, rounds: int, before_wait=None):
+        self.poller = poller
+        self.rounds = rounds
+        self.before_wait = before_wait
+        self.timeouts = []
+
+    def wait(self, timeout=None):
+        self.timeouts.append(timeout)
+        if self.before_wait:
+            self.before_wait(len(self.timeouts))
+        if len(self.timeouts) >= self.rounds:
+            self.poller._stopped = True
+        return False
+
+    def clear(self):
+        pass
+
+    def set(self):
+        pass
+
+
+def _poller(clipboard, changes, **kwargs) -> ClipboardPoller:
+    return ClipboardPoller(lambda text, hash_, size: changes.append((text, hash_, size)), clipboard.read_text,
+                           **kwargs)
+
+
+def test_change_detected_by_full_hash():
+    clipboard, changes = FakeClipboard('처음'), []
+    poller = _poller(clipboard, changes)
+    assert poller.check(notify=False)
+    assert not poller.check()
+    # 길이와 앞부분이 같고 끝만 다른 큰 내용도 변경으로 알림
+    big = 'x' * 200_000
+    clipboard.copy(big + 'a')
+    assert poller.check()
+    clipboard.copy(big + 'b')
+    assert poller.check()
+    assert [text[-1] for text, _, _ in changes] == ['a', 'b']
+    assert changes[-1][1:] == (content_hash(big + 'b'), 200_001)
+
+
+def test_unchanged_sequence_skips_read():
+    clipboard, changes = FakeClipboard('내용'), []
+    poller = _poller(clipboard, changes, sequence_number=lambda: clipboard.sequence)
+    poller.check(notify=False)
+    reads = clipboard.reads
+    assert not poller.check()
+    assert clipboard.reads == reads
+    # 선택 영역 이벤트로 깨어나면 변경 번호가 같아도 읽음
+    assert not poller.check(force=True)
+    assert clipboard.reads == reads + 1
+    clipboard.copy('새 내용')
+    assert poller.check()
+    assert [text for text, _, _ in changes] == ['새 내용']
+
+
+def test_text_length_filters_before_read():
+    clipboard, changes = FakeClipboard('내용'), []
+    poller = _poller(clipboard, changes, sequence_number=lambda: clipboard.sequence,
+                     text_length=lambda: clipboard.length, max_length=10)
+    poller.check(notify=False)
+    reads = clipboard.reads
+    # 텍스트가 없음(이미지 등)
+    clipboard.copy('')
+    clipboard.length = 0
+    assert not poller.check()
+    # 용량 예산보다 큰 내용은 가져오지 않지만 변경으로 봄 (간격을 줄임)
+    clipboard.copy('x' * 11)
+    clipboard.length = 11
+    assert poller.check()
+    assert clipboard.reads == reads
+    # 크기를 모르면 읽어서 확인
+    clipboard.copy('짧은 글')
+    clipboard.length = None
+    assert poller.check()
+    assert clipboard.reads == reads + 1
+    assert [text for text, _, _ in changes] == ['짧은 글']
+
+
+def test_ignore_suppresses_own_copy():
+    clipboard, changes = FakeClipboard('처음'), []
+    poller = _poller(clipboard, changes)
+    poller.check(notify=False)
+    clipboard.copy('앱이 복사함')
+    poller.ignore('앱이 복사함')
+    assert not poller.check()
+    assert changes == []
+
+
+def test_backoff_and_reset(monkeypatch):
+    monkeypatch.setattr(clipboard_poller, 'POLL_MIN_SECONDS', 1.0)
+    monkeypatch.setattr(clipboard_poller, 'POLL_BACKOFF', 2.0)
+    monkeypatch.setattr(clipboard_poller, 'POLL_MAX_SECONDS', 4.0)
+    clipboard, changes, stopped = FakeClipboard('처음'), [], []
+    poller = _poller(clipboard, changes, on_stop=lambda: stopped.append(True))
+    poller.interval = 1.0
+
+    def copy_on_fifth(round_):
+        if round_ == 5:
+            clipboard.copy('바뀜')
+
+    poller._wake = ScriptedWake(poller, 7, copy_on_fifth)
+    poller._run()
+    # 첫 확인(기준 기록) 뒤에는 최소값. 변경이 없으면 두 배씩 늘어 최대값에 머물고, 변경 뒤 최소값으로 돌아감
+    assert poller._wake.timeouts == [1.0, 2.0, 4.0, 4.0, 4.0, 1.0, 2.0]
+    assert [text for text, _, _ in changes] == ['바뀜']
+    assert stopped == [True]
+
+
+def test_read_error_stops_thread():
+    errors, stopped = [], []
+
+    def fail():
+        raise RuntimeError('백엔드 없음')
+
+    poller = ClipboardPoller(lambda *args: None, fail, on_error=errors.append, on_stop=lambda: stopped.append(True))
+    poller._run()
+    assert [str(e) for e in errors] == ['백엔드 없음']
+    assert stopped == [True]
+
+
+@pytest.mark.parametrize('poll', [True, False])
+def test_event_mode_waits_without_timeout(poll):
+    clipboard = FakeClipboard('처음')
+    poller = _poller(clipboard, [], poll=poll)
+    poller._wake = ScriptedWake(poller, 2)
+    poller._run()
+    assert poller._wake.timeouts == ([clipboard_poller.POLL_MIN_SECONDS,
+                                      clipboard_poller.POLL_MIN_SECONDS * clipboard_poller.POLL_BACKOFF]
+                                     if poll else [None, None])
@@ -0,0 +1,61 @@
+"""
+ClipboardService의 히스토리 반영(색인/이벤트)과 검색 결과 순서/개수 제한을 Tk 없이 확인합니다.
+"""
+import pytest
+
+pytest.importorskip('pyperclip')
+
+from models.clipboard_event import ADDED, EVICTED, MOVED  # noqa: E402
+from services.clipboard_service import ClipboardService  # noqa: E402
+
+
+@pytest.fixture
+def service():
+    # 모니터링(Tk 타이머/작업 스레드)을 시작하지 않고 변경 반영만 씀
+    svc = ClipboardService(root=None, max_entries=4)
+    svc._is_monitoring = True
+    return svc
+
+
+class Recorder:
+    """구독자는 약하게 참조되므로 테스트 동안 살아 있는 객체로 받음."""
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+
+def _copy(service, *texts):
+    for text in texts:
+        service._apply_change(text)
+
+
+def test_search_ties_break_by_recency_before_limit(service):
+    _copy(service, 'report draft', 'report final', 'report old', 'unrelated')
+    # 세 항목 점수가 같으면 최근에 복사한 것부터, 자르기는 정렬 뒤에
+    assert [e.content for e in service.search_entries('report')] == ['report old', 'report final', 'report draft']
+    assert [e.content for e in service.search_entries('report', limit=2)] == ['report old', 'report final']
+    # 다시 복사하면 같은 점수 안에서 맨 앞으로
+    _copy(service, 'report draft')
+    assert [e.content for e in service.search_entries('report', limit=1)] == ['report draft']
+
+
+def test_search_ranks_score_over_recency(service):
+    _copy(service, 'clipboard history', 'clipbaord histroy notes')
+    assert [e.content for e in service.search_entries('clipboard history')][0] == 'clipboard history'
+
+
+def test_empty_query_returns_recent_entries(service):
+    _copy(service, 'a1', 'b2', 'c3')
+    assert [e.content for e in service.search_entries('  ', limit=2)] == ['c3', 'b2']
+
+
+def test_evicted_entries_leave_search_and_publish_events(service):
+    recorder = Recorder()
+    service.subscribe(recorder)
+    _copy(service, 'alpha one', 'beta', 'gamma', 'delta', 'alpha one', 'epsilon')
+    assert [(e.kind, e.entry.content) for e in recorder.events[-3:]] == [
+        (MOVED, 'alpha one'), (EVICTED, 'beta'), (ADDED, 'epsilon')]
+    assert service.search_entries('beta') == []
+    assert [e.content for e in service.search_entries('alpha')] == ['alpha one']
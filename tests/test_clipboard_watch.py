@@ -0,0 +1,104 @@
+"""
+X 서버에서 xclip으로 선택 영역을 바꿨을 때 XFixes 이벤트와 크기/내용 확인이 동작하는지 확인합니다.
+DISPLAY(Xvfb 등)와 xclip이 없으면 건너뜁니다.
+"""
+import os
+import select
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    sys.platform in ('win32', 'darwin') or not os.environ.get('DISPLAY') or shutil.which('xclip') is None,
+    reason="X 서버(DISPLAY)와 xclip이 필요함")
+
+TIMEOUT_SECONDS = 5.0
+
+
+def _xclip(selection: str, text: str) -> None:
+    # xclip은 백그라운드에서 선택 영역 소유자로 남아 요청에 답함
+    subprocess.run(['xclip', '-selection', selection], input=text.encode('utf-8'), check=True)
+
+
+def _wait_for(predicate, pump=None) -> bool:
+    deadline = time.monotonic() + TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if pump:
+            pump()
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def watcher():
+    from services.clipboard_watch import XFixesSelectionWatcher
+    try:
+        w = XFixesSelectionWatcher(('CLIPBOARD', 'PRIMARY'))
+    except OSError as e:
+        pytest.skip(f"XFixes를 쓸 수 없음: {e}")
+    yield w
+    w.close()
+
+
+@pytest.mark.parametrize('selection', ['CLIPBOARD', 'PRIMARY'])
+def test_watcher_reports_owner_change(watcher, selection):
+    watcher.read_events()
+    _xclip(selection.lower(), f'{selection} 감시')
+    changed = []
+
+    def readable():
+        if select.select([watcher.fileno()], [], [], 0.05)[0]:
+            changed.extend(watcher.read_events())
+        return selection in changed
+
+    assert _wait_for(readable)
+
+
+@pytest.mark.parametrize('selection', ['CLIPBOARD', 'PRIMARY'])
+def test_probe_reads_size_and_text(selection):
+    from services.clipboard_watch import X11SelectionProbe
+    probe = X11SelectionProbe(selection)
+    try:
+        _xclip(selection.lower(), '첫 내용')
+        assert _wait_for(lambda: probe.read_text() == '첫 내용')
+        first = probe.sequence_number()
+        assert probe.sequence_number() == first
+        assert probe.text_length() == len('첫 내용'.encode('utf-8'))
+        _xclip(selection.lower(), '바뀐 내용')
+        assert _wait_for(lambda: probe.sequence_number() != first)
+        assert probe.read_text() == '바뀐 내용'
+    finally:
+        probe.close()
+
+
+def test_service_records_primary_selection(tmp_path):
+    tk = pytest.importorskip('tkinter')
+    pytest.importorskip('pyperclip')
+    from services.clipboard_service import ClipboardService
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk 창을 열 수 없음: {e}")
+    root.withdraw()
+    seen = []
+    service = ClipboardService(root, on_change_callback=lambda: seen.append(True),
+                               selections=('CLIPBOARD', 'PRIMARY'))
+    try:
+        service.start_monitoring()
+        if not service.uses_selection_events:
+            pytest.skip("XFixes 선택 영역 이벤트를 쓸 수 없음")
+        # 시작 시점 내용이 기준으로 잡힐 때까지 기다린 뒤 바꿈
+        time.sleep(0.3)
+        _xclip('primary', '마우스로 선택한 글')
+        assert _wait_for(lambda: '마우스로 선택한 글' in service.get_history(), root.update)
+        assert seen
+        _xclip('clipboard', '복사한 글')
+        assert _wait_for(lambda: service.get_history()[:1] == ['복사한 글'], root.update)
+    finally:
+        service.stop_monitoring()
+        root.destroy()
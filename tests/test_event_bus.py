@@ -0,0 +1,70 @@
+"""
+EventBus의 약한 참조 구독(사라진 구독자 자동 해제), 중복 등록, 해제, 콜백 오류 격리를 확인합니다.
+"""
+import gc
+
+from services.event_bus import EventBus
+
+
+class View:
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event):
+        self.events.append(event)
+
+
+def test_publish_in_subscribe_order():
+    bus = EventBus()
+    first, second = View(), View()
+    bus.subscribe(first.on_event)
+    bus.subscribe(second.on_event)
+    bus.subscribe(first.on_event)
+    bus.publish('a')
+    assert first.events == ['a'] and second.events == ['a']
+    # 같은 메서드를 다시 등록해도 한 번만 호출됨
+    assert len(bus) == 2
+
+
+def test_dead_subscriber_is_dropped():
+    bus = EventBus()
+    kept, dropped = View(), View()
+    bus.subscribe(kept.on_event)
+    bus.subscribe(dropped.on_event)
+    # 바인딩된 메서드를 등록해도 화면 객체를 붙잡지 않음
+    del dropped
+    gc.collect()
+    assert len(bus) == 1
+    bus.publish('b')
+    assert kept.events == ['b']
+    assert len(bus._subscribers) == 1
+
+
+def test_unsubscribe_bound_method_and_function():
+    bus, seen = EventBus(), []
+    view = View()
+
+    def handler(event):
+        seen.append(event)
+
+    bus.subscribe(view.on_event)
+    bus.subscribe(handler)
+    bus.unsubscribe(view.on_event)
+    bus.publish('c')
+    assert view.events == [] and seen == ['c']
+    bus.unsubscribe(handler)
+    bus.publish('d')
+    assert seen == ['c'] and len(bus) == 0
+
+
+def test_failing_subscriber_does_not_stop_others(capsys):
+    bus, view = EventBus(), View()
+
+    def broken(event):
+        raise ValueError('화면 없음')
+
+    bus.subscribe(broken)
+    bus.subscribe(view.on_event)
+    bus.publish('e')
+    assert view.events == ['e']
+    assert '화면 없음' in capsys.readouterr().out
@@ -0,0 +1,131 @@
+"""
+기존(마이그레이션 도입 전) 스키마로 만든 파일을 열었을 때 최신 버전까지 올라가는지 확인합니다.
+"""
+import sqlite3
+
+from conftest import assert_consistent
+from repositories.clipboard_repository import ClipboardRepository
+from repositories.launcher_repository import LauncherRepository
+from repositories.migrations import (CLIPBOARD_MIGRATIONS, CONFIG_MIGRATIONS, RANK_GAP, TODOS_MIGRATIONS,
+                                     get_schema_version)
+from repositories.template_repository import TemplateRepository
+from repositories.todo_repository import TodoRepository
+
+
+def _baseline_todos(path: str) -> None:
+    """마이그레이션 도입 전 TodoRepository가 만들던 테이블과 행."""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute('''
+            CREATE TABLE todos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                content TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                sort_order INTEGER DEFAULT 0,
+                parent_id INTEGER NULL,
+                archived_at TIMESTAMP NULL
+            )
+        ''')
+        conn.executemany(
+            "INSERT INTO todos (id, content, status, sort_order, parent_id, archived_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [(1, '보고서 작성 #work', 'pending', 1, None, None),
+             (2, '초안 #work #draft', 'completed', 1, 1, None),
+             (3, '검토', 'pending', 2, 1, None),
+             (4, '자료 조사', 'pending', 1, 3, None),
+             (5, '부모가 지워진 항목', 'pending', 1, 99, None),
+             (6, '지난 일 #old', 'completed', 2, None, '2025-01-01 00:00:00')]
+        )
+    conn.close()
+
+
+def _schema(path: str) -> list:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT type, name, sql FROM sqlite_master ORDER BY name").fetchall()
+    finally:
+        conn.close()
+
+
+def test_todos_migrate_from_baseline(db_path):
+    _baseline_todos(db_path)
+    repo = TodoRepository(db_path)
+    try:
+        with repo._db.reader() as conn:
+            assert get_schema_version(conn) == len(TODOS_MIGRATIONS)
+            rows = dict((r[0], r[1:]) for r in conn.execute("SELECT id, parent_id, sort_order FROM todos"))
+        # 고아 항목은 최상위로, 순서값은 부모별로 RANK_GAP 간격
+        assert rows[5][0] is None
+        assert (rows[2][1], rows[3][1]) == (RANK_GAP, 2 * RANK_GAP)
+        assert [t.id for t in repo.search('보고서')] == [1]
+        assert set(repo.find_by_tags(['work'])) == {1, 2}
+    finally:
+        repo.close()
+    assert_consistent(db_path)
+
+
+def test_todos_schedule_queries_use_partial_indexes(db_path):
+    repo = TodoRepository(db_path)
+    with repo._db.transaction() as conn:
+        conn.executemany("INSERT INTO todos (content, status, due_at, remind_at) VALUES (?, 'pending', ?, ?)",
+                         [(f'항목 {i}',) + (('2026-01-01 10:00', '2026-01-01 09:00') if i % 50 == 0 else (None, None))
+                          for i in range(2000)])
+    # 닫을 때 PRAGMA optimize로 통계가 생기면 부분 색인을 고름
+    repo.close()
+    conn = sqlite3.connect(db_path)
+    try:
+        for column, index in (('due_at', 'idx_todos_due'), ('remind_at', 'idx_todos_remind')):
+            plan = conn.execute(f"EXPLAIN QUERY PLAN SELECT id FROM todos WHERE {column} < ? "
+                                f"AND {column} IS NOT NULL AND archived_at IS NULL", ('2030-01-01 00:00',)).fetchall()
+            assert any(index in row[-1] for row in plan)
+    finally:
+        conn.close()
+
+
+def test_todos_reopen_runs_no_migration(db_path):
+    _baseline_todos(db_path)
+    TodoRepository(db_path).close()
+    before = _schema(db_path)
+    TodoRepository(db_path).close()
+    assert _schema(db_path) == before
+    assert_consistent(db_path)
+
+
+def test_config_migrate_launcher_items_without_url(tmp_path):
+    path = str(tmp_path / "config.db")
+    conn = sqlite3.connect(path)
+    with conn:
+        # 'url' 타입과 workspace_id가 없던 구버전
+        conn.execute('''
+            CREATE TABLE launcher_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                path TEXT NOT NULL,
+                item_type TEXT NOT NULL CHECK(item_type IN ('file', 'folder'))
+            )
+        ''')
+        conn.execute("INSERT INTO launcher_items (name, path, item_type) VALUES ('문서', 'C:/docs', 'folder')")
+    conn.close()
+
+    launcher = LauncherRepository(path)
+    templates = TemplateRepository(path)
+    assert get_schema_version(launcher.conn) == len(CONFIG_MIGRATIONS)
+    workspace_id = launcher.add_workspace('업무')
+    launcher.add_item('사이트', 'https://example.com', 'url', workspace_id)
+    assert [item.name for item in launcher.get_items_by_workspace(workspace_id)] == ['사이트']
+    assert launcher.conn.execute("SELECT name, item_type FROM launcher_items WHERE workspace_id IS NULL").fetchall() \
+        == [('문서', 'folder')]
+    assert templates.add_template('인사', '안녕하세요') is not None
+
+
+def test_clipboard_migrate_new_file(tmp_path):
+    path = str(tmp_path / "clipboard.db")
+    repo = ClipboardRepository(path)
+    repo.close()
+    repo = ClipboardRepository(path)
+    try:
+        with repo._db.reader() as conn:
+            assert get_schema_version(conn) == len(CLIPBOARD_MIGRATIONS)
+        assert repo.load_recent() == []
+    finally:
+        repo.close()
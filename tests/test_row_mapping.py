@@ -0,0 +1,71 @@
+"""
+슬롯 모델과 행 매핑: SELECT 열 순서가 모델 필드 순서와 같고, 커서를 바로 모델로 바꾸는지 확인합니다.
+"""
+import sqlite3
+from dataclasses import fields
+
+import pytest
+
+from models.clipboard_entry import ClipboardEntry
+from models.clipboard_event import ClipboardEvent
+from models.launcher_item import LauncherItem
+from models.template import Template
+from models.todo import Todo
+from models.workspace import Workspace
+from repositories.launcher_repository import LauncherRepository
+from repositories.row_mapping import iter_mapped, map_all, map_one
+from repositories.template_repository import TemplateRepository
+from repositories.todo_repository import _TODO_COLUMNS, TodoRepository
+
+
+@pytest.mark.parametrize('model', [Todo, ClipboardEntry, ClipboardEvent, LauncherItem, Template, Workspace])
+def test_models_use_slots(model):
+    # 생성자 인자 순서 = 슬롯 순서 = SELECT 열 순서
+    instance = model(*model.__slots__)
+    assert [getattr(instance, name) for name in model.__slots__] == list(model.__slots__)
+    assert not hasattr(instance, '__dict__')
+
+
+def test_todo_columns_match_model_fields():
+    assert [c.strip() for c in _TODO_COLUMNS.split(',')] == [f.name for f in fields(Todo)]
+
+
+def test_repository_rows_map_to_fields(db_path):
+    repo = TodoRepository(db_path)
+    try:
+        parent = repo.create_advanced('상위 #work', None, priority=1, due_at='2025-03-10 18:00')
+        child = repo.create_advanced('하위', parent.id)
+        [row] = [t for t in repo.iter_all_advanced() if t.id == parent.id]
+        assert (row.content, row.status, row.priority, row.due_at, row.child_total) == \
+            ('상위 #work', 'pending', 1, '2025-03-10 18:00', 1)
+        assert repo.get_many([child.id])[0].parent_id == parent.id
+    finally:
+        repo.close()
+
+
+def test_config_rows_map_to_fields(tmp_path):
+    path = str(tmp_path / "config.db")
+    templates = TemplateRepository(path)
+    template_id = templates.add_template('인사', '안녕하세요')
+    template = templates.get_template(template_id)
+    assert (template.id, template.title, template.content) == (template_id, '인사', '안녕하세요')
+    launcher = LauncherRepository(path)
+    workspace_id = launcher.add_workspace('업무')
+    launcher.add_item('문서', '/docs', 'folder', workspace_id)
+    assert [(w.id, w.name) for w in launcher.get_all_workspaces()] == [(workspace_id, '업무')]
+    [item] = launcher.get_items_by_workspace(workspace_id)
+    assert (item.name, item.path, item.item_type) == ('문서', '/docs', 'folder')
+
+
+def test_mapping_helpers():
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE t (hash TEXT, content TEXT, size INTEGER, seq INTEGER, copied_at REAL)")
+    conn.executemany("INSERT INTO t VALUES (?, ?, ?, ?, ?)", [(f'h{i}', f'c{i}', i, i, 0.0) for i in range(5)])
+    select = "SELECT hash, content, size, seq, copied_at FROM t ORDER BY seq"
+    assert [e.seq for e in map_all(conn.execute(select), ClipboardEntry)] == list(range(5))
+    assert map_one(conn.execute(select + " LIMIT 1"), ClipboardEntry).hash == 'h0'
+    assert map_one(conn.execute("SELECT * FROM t WHERE 0"), ClipboardEntry) is None
+    # 배치 크기보다 많은 행도 빠짐없이 순서대로
+    assert [e.content for e in iter_mapped(conn.execute(select), ClipboardEntry, batch_size=2)] == \
+        [f'c{i}' for i in range(5)]
+    conn.close()
@@ -0,0 +1,75 @@
+"""
+다른 연결(다른 프로세스)이 DB를 바꿨을 때 check_external_changes가 바뀐 행만 색인에 다시 맞추는지 확인합니다.
+"""
+import sqlite3
+
+import pytest
+
+from conftest import assert_consistent
+from repositories.todo_repository import TodoRepository
+from services.todo_service import TodoService
+
+
+@pytest.fixture
+def service(db_path):
+    svc = TodoService(repository=TodoRepository(db_path))
+    yield svc
+    svc.close()
+
+
+def _external(db_path, *statements):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        for sql, params in statements:
+            conn.execute(sql, params)
+    conn.close()
+
+
+def _index_matches_db(service, db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT id, content, status, version, due_at FROM todos "
+                            "WHERE archived_at IS NULL ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    assert [(t.id, t.content, t.status, t.version, t.due_at)
+            for t in sorted(service.index.by_id.values(), key=lambda t: t.id)] == rows
+
+
+def test_external_changes_are_reconciled(service, db_path):
+    a = service.add_todo_adv('회의 준비').id
+    b = service.add_todo_adv('메일 답장').id
+    c = service.add_todo_adv('지울 항목').id
+    service.set_status([b], 'completed')
+    assert service.check_external_changes() is None
+    # 자기 연결의 쓰기는 외부 변경으로 보지 않음
+    service.add_todo_adv('내가 추가')
+    assert service.check_external_changes() is None
+
+    _external(db_path,
+              ("UPDATE todos SET content = '회의 준비 #외부' WHERE id = ?", (a,)),
+              ("INSERT INTO todos (content, status) VALUES ('다른 창에서 추가', 'pending')", ()),
+              ("DELETE FROM todos WHERE id = ?", (c,)))
+    changed, conflicts = service.check_external_changes()
+    assert conflicts == []
+    assert a in changed and c in changed and len(changed) == 3
+    _index_matches_db(service, db_path)
+    assert service.get_todo(c) is None
+    assert [t.id for t in service.find_by_tags(['외부'])] == [a]
+    # 바뀐 DB를 덮어쓸 수 있는 되돌리기 기록은 비움
+    assert service.undo() is None
+    assert service.check_external_changes() is None
+    assert_consistent(db_path)
+
+
+def test_stale_command_becomes_conflict(service, db_path):
+    todo_id = service.add_todo_adv('보고서').id
+    assert service.get_todo(todo_id).content == '보고서'
+    _external(db_path, ("UPDATE todos SET content = '보고서 (다른 창)' WHERE id = ?", (todo_id,)))
+    # 색인이 아직 예전 버전인 채로 쓰기 지연 명령을 실행하면 기록 시 충돌로 걸러짐
+    assert service.set_schedule(todo_id, '2030-01-01 09:00')
+    changed, conflicts = service.check_external_changes()
+    assert conflicts == [todo_id] and changed == [todo_id]
+    t = service.get_todo(todo_id)
+    assert (t.content, t.due_at) == ('보고서 (다른 창)', None)
+    _index_matches_db(service, db_path)
@@ -0,0 +1,65 @@
+"""
+빠른 입력 문법(#태그, !우선순위, @날짜 [HH:MM]) 해석의 경계 사례를 확인합니다.
+"""
+from datetime import datetime
+
+import pytest
+
+from services.todo_quick_add import parse_quick_add
+
+NOW = datetime(2025, 3, 10, 9, 30)
+
+
+def test_all_tokens():
+    parsed = parse_quick_add('장보기 #집 !1 @내일 18:00', NOW)
+    assert (parsed.content, parsed.tags, parsed.priority, parsed.due_at) == ('장보기 #집', ['집'], 1, '2025-03-11 18:00')
+
+
+@pytest.mark.parametrize('token, due_at', [
+    ('@오늘', '2025-03-10 23:59'),
+    ('@today 7:05', '2025-03-10 07:05'),
+    ('@모레', '2025-03-12 23:59'),
+    ('@+3d', '2025-03-13 23:59'),
+    ('@2025-04-01 9:05', '2025-04-01 09:05'),
+    # 월-일은 오늘 이후 가장 가까운 날 (지난 날짜면 내년, 2월 29일은 다음 윤년)
+    ('@03-10', '2025-03-10 23:59'),
+    ('@03-01', '2026-03-01 23:59'),
+    ('@02-29', '2028-02-29 23:59'),
+])
+def test_dates(token, due_at):
+    parsed = parse_quick_add(f'보고서 {token}', NOW)
+    assert (parsed.content, parsed.due_at) == ('보고서', due_at)
+
+
+@pytest.mark.parametrize('word, priority', [('1', 1), ('HIGH', 1), ('보통', 2), ('med', 2), ('low', 3), ('낮음', 3)])
+def test_priority_words(word, priority):
+    assert parse_quick_add(f'정리 !{word}', NOW).priority == priority
+
+
+def test_last_priority_wins():
+    parsed = parse_quick_add('두 번 !1 !3', NOW)
+    assert (parsed.content, parsed.priority) == ('두 번', 3)
+
+
+@pytest.mark.parametrize('text', [
+    '메일 a@b.com 보내기',  # 단어 중간의 @는 날짜가 아님
+    '급함 !urgent',
+    '언젠가 @someday',
+    '시간 오류 @내일 25:00',
+    '없는 날 @02-30',
+    '공백  그대로  #Tag',
+])
+def test_unparsed_input_is_kept_verbatim(text):
+    parsed = parse_quick_add(text, NOW)
+    assert (parsed.content, parsed.priority, parsed.due_at) == (text, None, None)
+
+
+def test_tags_are_normalized_and_kept_in_content():
+    parsed = parse_quick_add('#Work 회의 #업무 !2', NOW)
+    assert parsed.content == '#Work 회의 #업무'
+    assert parsed.tags == ['work', '업무']
+
+
+def test_tokens_only_leave_empty_content():
+    parsed = parse_quick_add('!1 @내일', NOW)
+    assert (parsed.content, parsed.priority, parsed.due_at) == ('', 1, '2025-03-11 23:59')
@@ -0,0 +1,178 @@
+"""
+반복 항목 완료(다음 회차로 이동), 일정 스케줄러(최소 힙 + after() 타이머 하나), 색인의 시각 순 목록을 확인합니다.
+"""
+import heapq
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import assert_consistent
+from models.todo import Todo
+from repositories.todo_repository import TodoRepository
+from services import todo_scheduler
+from services.todo_index import TodoIndex
+from services.todo_scheduler import TodoScheduler, format_schedule, next_due_after, next_occurrence
+from services.todo_service import TodoService
+
+
+@pytest.fixture
+def service(db_path):
+    svc = TodoService(repository=TodoRepository(db_path))
+    yield svc
+    svc.close()
+
+
+@pytest.mark.parametrize('rule, start, expected', [
+    ('daily', datetime(2025, 1, 31, 9), datetime(2025, 2, 1, 9)),
+    ('weekdays', datetime(2025, 3, 7, 9), datetime(2025, 3, 10, 9)),  # 금 → 월
+    ('weekly', datetime(2025, 3, 7, 9), datetime(2025, 3, 14, 9)),
+    ('monthly', datetime(2025, 1, 31, 9), datetime(2025, 2, 28, 9)),  # 없는 날은 그 달 마지막 날
+    ('yearly', datetime(2024, 2, 29, 9), datetime(2025, 2, 28, 9)),
+])
+def test_next_occurrence(rule, start, expected):
+    assert next_occurrence(start, rule) == expected
+
+
+def test_next_due_after_skips_missed_occurrences():
+    due = datetime(2025, 3, 1, 9)
+    assert next_due_after(due, 'daily', datetime(2025, 3, 5, 12)) == datetime(2025, 3, 6, 9)
+    assert next_due_after(due, 'unknown', datetime(2025, 3, 5, 12)) is None
+
+
+def test_complete_recurring_rolls_forward(service, db_path):
+    now = datetime.now().replace(second=0, microsecond=0)
+    parent = service.add_todo_adv('주간 보고')
+    child = service.add_todo_adv('자료 모으기', parent.id)
+    due = now - timedelta(days=2, hours=1)
+    assert service.set_schedule(parent.id, format_schedule(due), format_schedule(due - timedelta(hours=1)), 'daily')
+    service.set_status([child.id], 'completed')
+
+    assert service.set_status([parent.id], 'completed') == 2
+    rolled = service.get_todo(parent.id)
+    # 지난 회차는 건너뛰고 지금 이후 첫 회차로, 알림은 마감과의 간격 유지, 하위 항목은 다시 미완료
+    next_due = next_due_after(due, 'daily', now)
+    assert rolled.status == 'pending' and next_due > now
+    assert rolled.due_at == format_schedule(next_due)
+    assert rolled.remind_at == format_schedule(next_due - timedelta(hours=1))
+    assert service.get_todo(child.id).status == 'pending'
+    assert service.flush()
+    assert_consistent(db_path)
+
+    service.undo()
+    assert service.get_todo(parent.id).due_at == format_schedule(due)
+    assert service.get_todo(child.id).status == 'completed'
+    # 반복 규칙이 없으면 그대로 완료
+    service.set_schedule(parent.id, format_schedule(due))
+    assert service.set_status([parent.id], 'completed') == 1
+    assert service.get_todo(parent.id).status == 'completed'
+
+
+class FakeWidget:
+    """after()/after_cancel() 호출을 기록하는 Tk 위젯 대역."""
+    def __init__(self):
+        self.timers = {}
+        self._next = 0
+
+    def after(self, delay, callback):
+        self._next += 1
+        self.timers[self._next] = (delay, callback)
+        return self._next
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def run(self):
+        """걸려 있는 타이머를 (기다리지 않고) 한 번씩 실행합니다."""
+        for after_id in list(self.timers):
+            _, callback = self.timers.pop(after_id)
+            callback()
+
+
+class FakeService:
+    def __init__(self, todos):
+        self.todos = {t.id: t for t in todos}
+        self.dismissed = []
+
+    def get_scheduled_todos(self):
+        return list(self.todos.values())
+
+    def get_todo(self, todo_id):
+        return self.todos.get(todo_id)
+
+    def dismiss_reminder(self, todo_id):
+        self.dismissed.append(todo_id)
+
+
+def _todo(todo_id, due=None, remind=None, status='pending', recurrence=None) -> Todo:
+    return Todo(id=todo_id, content=f'항목 {todo_id}', status=status, created_at='2025-01-01 00:00:00',
+                due_at=due and format_schedule(due), remind_at=remind and format_schedule(remind),
+                recurrence=recurrence)
+
+
+def test_scheduler_keeps_one_timer_for_earliest():
+    now = datetime.now().replace(second=0, microsecond=0) + timedelta(minutes=1)
+    widget = FakeWidget()
+    todos = [_todo(1, due=now + timedelta(hours=3)), _todo(2, remind=now + timedelta(hours=2)),
+             _todo(3, due=now + timedelta(hours=5), status='completed')]
+    scheduler = TodoScheduler(widget, FakeService(todos), on_remind=lambda t: None, on_due=lambda ts: None)
+    scheduler.reload()
+    assert len(widget.timers) == 1 and len(scheduler._heap) == 2
+    assert scheduler._armed_at == now + timedelta(hours=2)
+    armed = dict(widget.timers)
+    # 더 늦은 일정은 타이머를 다시 걸지 않음
+    scheduler.schedule([_todo(4, due=now + timedelta(hours=4))])
+    assert widget.timers == armed
+    # 더 이른 일정이 생기면 기존 타이머를 취소하고 하나만 다시 걺
+    scheduler.schedule([_todo(5, remind=now + timedelta(hours=1))])
+    assert len(widget.timers) == 1 and widget.timers != armed
+    assert scheduler._armed_at == now + timedelta(hours=1)
+    # 먼 일정도 최대 간격마다 다시 확인
+    [(delay, _)] = widget.timers.values()
+    assert delay <= todo_scheduler.MAX_TIMER_MS
+
+
+def test_scheduler_fires_due_items_and_drops_stale_entries():
+    past = datetime.now().replace(second=0, microsecond=0) - timedelta(minutes=5)
+    widget = FakeWidget()
+    service = FakeService([
+        _todo(1, remind=past),
+        # 반복 항목은 지난 알림을 남겨 두므로 다시 띄우지 않음
+        _todo(2, remind=past, due=past + timedelta(days=1), recurrence='daily'),
+        _todo(3, due=past),
+        _todo(4, due=past + timedelta(minutes=1)),
+    ])
+    reminded, overdue = [], []
+    scheduler = TodoScheduler(widget, service, on_remind=reminded.append, on_due=overdue.extend)
+    scheduler.reload()
+    # 앱이 켜져 있는 동안 마감이 지난 항목(3), 같은 일정의 중복 항목(1),
+    # 넣은 뒤 마감이 바뀐 항목(4, 힙의 예전 값은 버림)
+    for entry in [(past, 3, 'due', format_schedule(past)), (past, 1, 'remind', format_schedule(past)),
+                  (past, 4, 'due', format_schedule(past - timedelta(hours=1)))]:
+        heapq.heappush(scheduler._heap, entry)
+    assert [delay for delay, _ in widget.timers.values()] == [0]
+    widget.run()
+    assert [t.id for t in reminded] == [1]
+    assert service.dismissed == [1]
+    assert [t.id for t in overdue] == [3]
+    # 남은 일정(반복 항목의 다음 마감) 하나에 타이머를 다시 걺
+    assert [entry[1:3] for entry in scheduler._heap] == [(2, 'due')]
+    assert len(widget.timers) == 1
+
+
+def test_index_keeps_time_order_on_upsert_and_remove():
+    base = datetime(2025, 3, 10, 9)
+    todos = [_todo(i, due=base + timedelta(hours=h)) for i, h in ((1, 5), (2, 1), (3, 3))] + [_todo(4)]
+    index = TodoIndex(todos)
+    start, end = format_schedule(base), format_schedule(base + timedelta(days=1))
+    assert [t.id for t in index.due_between(start, end)] == [2, 3, 1]
+    # 마감을 옮기면 목록에서 같은 자리를 찾아 빼고 새 자리에 넣음
+    index.upsert(_todo(1, due=base))
+    index.upsert(_todo(4, due=base + timedelta(hours=2)))
+    index.upsert(_todo(2, due=base + timedelta(days=2)))
+    assert [t.id for t in index.due_between(start, end)] == [1, 4, 3]
+    assert [t.id for t in index.due_between(None, format_schedule(base + timedelta(hours=2)))] == [1]
+    index.upsert(_todo(3, due=base + timedelta(hours=3), status='completed'))
+    assert [t.id for t in index.due_between(start, end, 'pending')] == [1, 4]
+    index.remove([4])
+    assert [t.id for t in index.due_between(start, end)] == [1, 3]
+    assert sorted(t.id for t in index.scheduled()) == [1, 2, 3]
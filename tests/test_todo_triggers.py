@@ -0,0 +1,203 @@
+"""
+TodoService 명령(쓰기 지연 기록 포함) 뒤에 트리거가 유지하는 값이 원본 행과 맞는지 확인합니다.
+"""
+import sqlite3
+import threading
+
+import pytest
+
+from conftest import assert_consistent
+from repositories.todo_repository import TodoRepository
+from services.todo_service import TodoService
+
+
+@pytest.fixture
+def service(db_path):
+    svc = TodoService(repository=TodoRepository(db_path))
+    yield svc
+    svc.close()
+
+
+@pytest.fixture
+def tree(service):
+    """root > (a > a1, a2), b #home. 항목 이름 → ID."""
+    root = service.add_todo_adv('프로젝트 #work')
+    a = service.add_todo_adv('설계 #design', root.id)
+    a1 = service.add_todo_adv('화면 설계', a.id)
+    a2 = service.add_todo_adv('DB 설계 #db', a.id)
+    b = service.add_todo_adv('장보기 #home')
+    return {'root': root.id, 'a': a.id, 'a1': a1.id, 'a2': a2.id, 'b': b.id}
+
+
+def _cold_count(db_path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM todos_archive").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _row_ids(db_path) -> list:
+    conn = sqlite3.connect(db_path)
+    try:
+        return [r[0] for r in conn.execute("SELECT id FROM todos_all ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def _check(service, db_path):
+    assert service.flush()
+    assert service._writer.take_conflicts() == []
+    assert_consistent(db_path)
+    # 색인(보관되지 않은 항목)이 DB와 같은 버전/위치/상태/카운터를 가짐
+    fields = "id, status, parent_id, sort_order, version, child_total, child_completed"
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(f"SELECT {fields} FROM todos WHERE archived_at IS NULL ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    index = service.index
+    assert [(t.id, t.status, t.parent_id, t.sort_order, t.version, t.child_total, t.child_completed)
+            for t in sorted(index.by_id.values(), key=lambda t: t.id)] == rows
+
+
+def test_complete_subtree_and_undo(service, tree, db_path):
+    assert service.set_status([tree['root']], 'completed') == 4
+    _check(service, db_path)
+    assert service.get_todo(tree['root']).child_completed == 1
+    service.set_status([tree['a1']], 'pending')
+    _check(service, db_path)
+    service.undo()
+    service.undo()
+    _check(service, db_path)
+    assert service.get_stats().completed == 0
+
+
+def test_delete_subtree_and_undo(service, tree, db_path):
+    assert service.delete_many([tree['a']]) == 3
+    _check(service, db_path)
+    assert service.get_todo(tree['root']).child_total == 0
+    service.undo()
+    _check(service, db_path)
+    assert service.get_todo(tree['root']).child_total == 1
+    assert [t.id for t in service.search('설계')] != []
+
+
+def test_move_subtree(service, tree, db_path):
+    assert service.move_todo(tree['a'], tree['b'])
+    _check(service, db_path)
+    assert [t.id for t in service.get_ancestors(tree['a2'])] == [tree['b'], tree['a']]
+    # 자기 자손 아래로는 옮길 수 없음
+    assert not service.move_todo(tree['b'], tree['a1'])
+    service.undo()
+    _check(service, db_path)
+    service.redo()
+    _check(service, db_path)
+
+
+def test_move_rebalances_tight_gap(service, tree, db_path):
+    # 앞 형제 바로 뒤로 번갈아 옮기면 간격이 절반씩 줄어 결국 형제 순서값을 다시 매김
+    a3 = service.add_todo_adv('배포 설계', tree['a']).id
+    reranked = []
+    move = service.repository.move
+    service.repository.move = lambda *args: reranked.append(bool(args[3])) or move(*args)
+    for _ in range(4):
+        assert service.move_todo(a3, tree['a'], prev_id=tree['a1'])
+        assert service.move_todo(tree['a2'], tree['a'], prev_id=tree['a1'])
+    assert any(reranked)
+    _check(service, db_path)
+    assert service.index.child_ids(tree['a']) == [tree['a1'], tree['a2'], a3]
+    service.undo()
+    _check(service, db_path)
+
+
+def test_archive_cold_restore_and_delete(service, tree, db_path):
+    service.set_status([tree['a']], 'completed')
+    service.archive_todos([tree['a']])
+    _check(service, db_path)
+    assert service.get_stats().archived == 3
+    # 보관 항목을 콜드 테이블로 옮겨도 통계/태그/전문 색인은 그대로
+    service.run_archive_maintenance(0, 0)
+    _check(service, db_path)
+    assert _cold_count(db_path) == 3
+    # 되살리면 보관된 조상(a)도 함께 돌아오고 형제(a1)는 보관함에 남음
+    assert service.restore_archived([tree['a2']]) == 2
+    _check(service, db_path)
+    assert service.get_todo(tree['root']).child_total == 1
+    service.archive_todos([tree['root']])
+    service.run_archive_maintenance(0, 0)
+    assert service.delete_archived([tree['root']]) == 4
+    _check(service, db_path)
+
+
+def test_maintenance_thread_hands_index_to_ui(service, tree, db_path):
+    # 작업 스레드는 색인을 건드리지 않고 무효화를 UI 스레드 대기열로 넘김 (날짜를 바꿔 보관 대상으로 만듦)
+    queued = []
+    service.call_on_ui = queued.append
+    service.set_status([tree['b']], 'completed')
+    assert service.flush()
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("UPDATE todos SET created_at = '2000-01-01 00:00:00' WHERE id = ?", (tree['b'],))
+    conn.close()
+    service.invalidate_index()
+    index = service.index
+    worker = threading.Thread(target=service.run_archive_maintenance, args=(0, 0))
+    worker.start()
+    worker.join()
+    assert service._index is index and tree['b'] in index.by_id
+    assert queued == [service.invalidate_index]
+    queued.pop()()
+    assert service.get_todo(tree['b']) is None
+    assert sorted(service.index.by_id) == sorted(tid for name, tid in tree.items() if name != 'b')
+    assert _cold_count(db_path) == 1
+
+
+def test_export_import_round_trip(service, tree, db_path, tmp_path):
+    # 이동으로 자식(a1)의 ID가 부모(b)보다 작아진 상태도 내보내기/가져오기에서 계층이 유지됨
+    service.move_todo(tree['a1'], tree['b'])
+    service.set_status([tree['a2']], 'completed')
+    path = str(tmp_path / "todos.jsonl")
+    assert service.export(path) == 5
+    assert service.import_(path) == 5
+    _check(service, db_path)
+    copies = {t.content: t for t in service.get_all_todos_adv() if t.id > tree['b']}
+    assert copies['화면 설계'].parent_id == copies['장보기 #home'].id
+    assert copies['DB 설계 #db'].parent_id == copies['설계 #design'].id
+    assert copies['DB 설계 #db'].status == 'completed'
+
+
+def test_import_thread_hands_index_to_ui(service, tree, db_path, tmp_path):
+    path = str(tmp_path / "todos.jsonl")
+    service.export(path)
+    queued = []
+    service.call_on_ui = queued.append
+    index = service.index
+    worker = threading.Thread(target=service.import_, args=(path,))
+    worker.start()
+    worker.join()
+    assert service._index is index and len(index.by_id) == 5
+    assert queued == [service.invalidate_index]
+    queued.pop()()
+    _check(service, db_path)
+    assert len(service.index.by_id) == 10
+
+
+@pytest.mark.parametrize('cold', [False, True])
+def test_delete_with_archived_descendants(service, tree, db_path, cold):
+    # root > a > (a1 보관, a2): 색인에 없는 보관 자손(콜드 테이블 포함)도 함께 지우고 되돌림
+    service.archive_todos([tree['a1']])
+    if cold:
+        service.run_archive_maintenance(0, 0)
+        assert _cold_count(db_path) == 1
+    assert service.delete_many([tree['root']]) == 4
+    _check(service, db_path)
+    assert _row_ids(db_path) == [tree['b']]
+    service.undo()
+    _check(service, db_path)
+    assert _row_ids(db_path) == sorted(tree.values())
+    assert service.get_todo(tree['a1']) is None
+    assert service.get_todo(tree['a']).child_total == 1
+    service.redo()
+    _check(service, db_path)
+    assert _row_ids(db_path) == [tree['b']]
@@ -0,0 +1,76 @@
+"""
+트라이그램 색인의 정규화(대소문자/결합 부호/한글 자모)와 점수, 결과 수 제한, 문서 교체/제거를 확인합니다.
+"""
+import unicodedata
+
+from services.trigram_index import MIN_SCORE, SUBSTRING_BONUS, TrigramIndex, normalize, trigrams
+
+
+def test_normalize_folds_case_and_accents():
+    assert normalize('Résumé CAFÉ') == 'resume cafe'
+    assert trigrams('Résumé') == trigrams('resume')
+
+
+def test_normalize_splits_hangul_into_jamo():
+    # 음절 두 개 → 자모 여섯 개 (받침 포함). 다시 합치면 원래 음절
+    jamo = normalize('클립')
+    assert len(jamo) == 6
+    assert unicodedata.normalize('NFC', jamo) == '클립'
+    # 모음 하나만 다르면 트라이그램 대부분이 겹침
+    assert len(trigrams('클립보드') & trigrams('클립뵤드')) > len(trigrams('클립보드')) // 2
+
+
+def _index() -> TrigramIndex:
+    index = TrigramIndex()
+    index.add('ko', '클립보드 히스토리 검색')
+    index.add('fr', 'Résumé draft')
+    index.add('en', 'clipboard history')
+    index.add('short', 'clipboard')
+    return index
+
+
+def test_typo_scores_below_exact_match():
+    index = _index()
+    [(doc_id, typo)] = index.search('클립뵤드')
+    assert doc_id == 'ko'
+    assert MIN_SCORE <= typo < 1
+    [(_, exact)] = index.search('클립보드')
+    # 그대로 들어 있으면 모든 트라이그램 일치 + 부분 문자열 보너스
+    assert exact == 1 + SUBSTRING_BONUS
+    assert index.search('resume') == [('fr', 1 + SUBSTRING_BONUS)]
+
+
+def test_score_order_and_threshold():
+    index = _index()
+    results = index.search('clipbaord histroy')
+    assert [doc_id for doc_id, _ in results][0] == 'en'
+    assert all(score >= MIN_SCORE for _, score in results)
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    assert index.search('zzzz qqqq') == []
+    assert index.search('  ') == []
+
+
+def test_limit_keeps_best_matches():
+    index = _index()
+    assert [doc_id for doc_id, _ in index.search('clipboard history', limit=1)] == ['en']
+    assert len(index.search('clipboard', limit=1)) == 1
+
+
+def test_replace_and_remove_update_postings():
+    index = _index()
+    index.add('en', 'shopping list')
+    assert [doc_id for doc_id, _ in index.search('clipboard')] == ['short']
+    assert [doc_id for doc_id, _ in index.search('shopping')] == ['en']
+    index.remove('short')
+    index.remove('missing')
+    assert index.search('clipboard') == []
+    assert len(index) == 3 and 'short' not in index
+
+
+def test_only_head_is_indexed():
+    index = TrigramIndex(index_chars=20)
+    index.add(1, 'a' * 30 + ' needle')
+    assert index.search('needle') == []
+    index.add(2, 'needle ' + 'a' * 30)
+    assert [doc_id for doc_id, _ in index.search('needle')] == [2]
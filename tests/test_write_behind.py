@@ -0,0 +1,59 @@
+"""
+WriteBehind: 같은 키의 변경 합치기, 기록 실패 시 오류 콜백과 다시 큐에 넣기를 확인합니다.
+"""
+from services.write_behind import WriteBehind
+
+
+class ListWriter(WriteBehind):
+    action = "테스트 기록"
+
+    def __init__(self, **kwargs):
+        # 작업 스레드가 먼저 기록하지 않도록 긴 대기 시간
+        super().__init__(60, **kwargs)
+        self.fail = False
+        self.batches = []
+
+    def _write(self, batch):
+        if self.fail:
+            raise OSError('디스크 가득 참')
+        self.batches.append(dict(batch))
+
+
+def test_failed_batch_is_reported_and_requeued():
+    errors = []
+    writer = ListWriter(on_error=errors.append)
+    writer.submit({1: 'a', 2: 'b'})
+    writer.fail = True
+    assert not writer.flush()
+    assert [str(e) for e in errors] == ['디스크 가득 참']
+    # 실패한 뒤 들어온 더 새로운 상태가 우선
+    writer.submit({1: 'a2'})
+    writer.fail = False
+    assert writer.flush()
+    assert writer.batches == [{1: 'a2', 2: 'b'}]
+    assert writer.pending_count == 0
+    writer.close()
+
+
+def test_without_callback_error_is_printed(capsys):
+    writer = ListWriter()
+    writer.fail = True
+    writer.submit({1: 'a'})
+    assert not writer.flush()
+    assert '테스트 기록 중 오류 발생: 디스크 가득 참' in capsys.readouterr().out
+    writer.fail = False
+    writer.close()
+    assert writer.batches == [{1: 'a'}]
+
+
+def test_failing_callback_does_not_escape():
+    def broken(error):
+        raise RuntimeError('알림 실패')
+
+    writer = ListWriter(on_error=broken)
+    writer.fail = True
+    writer.submit({1: 'a'})
+    assert not writer.flush()
+    assert writer.pending_count == 1
+    writer.fail = False
+    writer.close()
@@ -1,7 +1,12 @@
 import tkinter as tk
+from models.clipboard_event import EVICTED
 from services.clipboard_service import ClipboardService
 from ui.scroll_util import bind_mousewheel
 
+# 검색어 입력 후 실제 검색까지 대기 시간(ms)과 최대 결과 수
+SEARCH_DEBOUNCE_MS = 150
+SEARCH_LIMIT = 200
+
 
 class ClipboardFrame(tk.Frame):
     """
@@ -11,10 +16,18 @@ class ClipboardFrame(tk.Frame):
         super().__init__(master, **kwargs)
         self.app = app  # 메인 참조
         self.clipboard_service = clipboard_service
-        self.clipboard_service.on_change_callback = self.refresh_history
+        self._search_after_id = None
+        # 목록에 보이는 순서대로의 항목 (검색 중이면 검색 결과)
+        self._shown = []
 
         self._create_widgets()
         self.refresh_history()
+        # 홈 화면과 클립보드 페이지가 각각 구독 (콜백 하나를 서로 덮어쓰지 않음)
+        if hasattr(self.clipboard_service, 'subscribe'):
+            self.clipboard_service.subscribe(self._on_clipboard_event)
+            self.bind('<Destroy>', self._on_destroy)
+        else:
+            self.clipboard_service.on_change_callback = self.refresh_history
 
     def _create_widgets(self):
         """UI 위젯을 생성하고 배치"""
@@ -23,6 +36,15 @@ class ClipboardFrame(tk.Frame):
         title_label = tk.Label(self, text="클립보드 히스토리", font=('Helvetica', 12, 'bold'))
         title_label.pack(fill=tk.X, pady=(0, 5))
 
+        search_frame = tk.Frame(self)
+        search_frame.pack(fill=tk.X, pady=(0, 5))
+        tk.Label(search_frame, text="검색:").pack(side=tk.LEFT)
+        self.search_var = tk.StringVar(value='')
+        search_entry = tk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        search_entry.bind('<Escape>', lambda e: self.search_var.set(''))
+        self._search_trace = self.search_var.trace_add('write', lambda *_: self._schedule_search())
+
         list_frame = tk.Frame(self)
         list_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -36,14 +58,70 @@ class ClipboardFrame(tk.Frame):
         # 마우스 휠 스크롤
         bind_mousewheel(self.history_listbox)
 
+    def _schedule_search(self):
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
+        self.refresh_history()
+
+    def _on_destroy(self, event):
+        if event.widget is not self:
+            return
+        self.clipboard_service.unsubscribe(self._on_clipboard_event)
+        # Tcl 쪽에 남은 변수 trace/after 콜백이 이 프레임을 붙잡지 않도록 해제
+        self.search_var.trace_remove('write', self._search_trace)
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+
+    @staticmethod
+    def _display(item) -> str:
+        text = getattr(item, 'content', item)
+        # 긴 텍스트는 잘라서 표시
+        display_item = (text[:70] + '...') if len(text) > 70 else text
+        return display_item.replace('\n', ' ')
+
+    def _query(self) -> str:
+        return self.search_var.get().strip() if hasattr(self, 'search_var') else ''
+
+    def _row_of(self, entry) -> int:
+        for i, shown in enumerate(self._shown):
+            if shown.hash == entry.hash:
+                return i
+        return -1
+
+    def _on_clipboard_event(self, event):
+        """히스토리 변경 한 건을 목록 한 행의 추가/삭제로 반영합니다."""
+        if not self.winfo_exists():
+            return
+        row = self._row_of(event.entry)
+        if event.kind == EVICTED:
+            if row >= 0:
+                del self._shown[row]
+                self.history_listbox.delete(row)
+            return
+        if self._query():
+            # 검색 중에는 새 항목의 순위를 알 수 없으므로 검색을 다시 실행 (입력 대기와 같은 지연)
+            self._schedule_search()
+            return
+        if row >= 0:
+            del self._shown[row]
+            self.history_listbox.delete(row)
+        self._shown.insert(0, event.entry)
+        self.history_listbox.insert(0, self._display(event.entry))
+
     def refresh_history(self):
-        """클립보드 히스토리 목록을 새로고침"""
+        """클립보드 히스토리 목록을 새로고침 (검색어가 있으면 비슷한 항목만)"""
+        query = self._query()
+        if hasattr(self.clipboard_service, 'search_entries'):
+            self._shown = self.clipboard_service.search_entries(query, SEARCH_LIMIT if query else None)
+        else:
+            self._shown = self.clipboard_service.get_history()
         self.history_listbox.delete(0, tk.END)
-        history = self.clipboard_service.get_history()
-        for item in history:
-            # 긴 텍스트는 잘라서 표시
-            display_item = (item[:70] + '...') if len(item) > 70 else item
-            self.history_listbox.insert(tk.END, display_item.replace('\n', ' '))
+        self.history_listbox.insert(tk.END, *[self._display(item) for item in self._shown])
 
     def on_item_select(self, event):
         """리스트에서 항목 선택 시 클립보드로 복사"""
@@ -52,9 +130,7 @@ class ClipboardFrame(tk.Frame):
             return
 
         selected_index = selected_indices[0]
-        history = self.clipboard_service.get_history()
-        if 0 <= selected_index < len(history):
-            text_to_copy = history[selected_index]
-            self.clipboard_service.copy_to_clipboard(text_to_copy)
+        if 0 <= selected_index < len(self._shown):
+            item = self._shown[selected_index]
+            self.clipboard_service.copy_to_clipboard(getattr(item, 'content', item))
             self.app.update_status(f"'{self.history_listbox.get(selected_index)}' 복사됨")
-
@@ -1,6 +1,7 @@
 import tkinter as tk
 
 from ui.clipboard_frame import ClipboardFrame
+from ui.todo_stats_panel import TodoStatsPanel
 
 
 class HomeFrame(tk.Frame):
@@ -48,7 +49,11 @@ class HomeFrame(tk.Frame):
             elif key == 'todo':
                 lf = tk.LabelFrame(self, text='할 일')
                 lf.pack(fill=tk.X, pady=(8, 8))
-                tk.Button(lf, text='할 일 열기', command=lambda: self.app.show_page('todo')).pack(side=tk.LEFT, padx=6, pady=6)
+                tk.Button(lf, text='할 일 열기',
+                          command=lambda: self.app.show_page('todo')).pack(anchor='w', padx=6, pady=6)
+                todo_service = getattr(self.app, 'todo_service', None)
+                if hasattr(todo_service, 'get_stats'):
+                    TodoStatsPanel(lf, todo_service).pack(fill=tk.X, padx=6, pady=(0, 6))
             elif key == 'workspace':
                 lf = tk.LabelFrame(self, text='작업 공간')
                 lf.pack(fill=tk.X, pady=(8, 8))
@@ -75,7 +75,7 @@ class ScreenshotFrame(tk.Frame):
                 if text is None or not text.strip():
                     return
                 if hasattr(self.app.todo_service, 'add_from_text'):
-                    count = self.app.todo_service.add_from_text(text)
+                    count = self.app.todo_service.add_from_text(text, skip_existing=True)
                     self.app.update_status(f"TODO {count}개 추가")
                 else:
                     self.app.todo_service.add_todo(text.strip())
@@ -0,0 +1,150 @@
+import tkinter as tk
+from datetime import datetime, timedelta
+from tkinter import ttk, messagebox
+from services.todo_service import TodoService
+from ui.scroll_util import bind_mousewheel
+
+# 한 번에 읽는 보관 항목 수. 목록 끝 근처까지 스크롤하면 다음 페이지를 이어 붙임
+ARCHIVE_PAGE_SIZE = 100
+DATE_FORMAT = '%Y-%m-%d'
+
+
+class TodoArchiveWindow(tk.Toplevel):
+    """
+    보관된 할 일을 최근 보관 순으로 보여주는 창.
+    (archived_at, id) keyset으로 페이지 단위로 읽으므로 보관함 크기와 관계없이 여는 비용이 같습니다.
+    """
+    def __init__(self, master, todo_service: TodoService, on_changed=None):
+        """
+        :param todo_service: TodoService 인스턴스
+        :param on_changed: 항목을 되살리거나 삭제한 뒤 호출될 콜백 (Todo 목록 갱신용)
+        """
+        super().__init__(master)
+        self.todo_service = todo_service
+        self.on_changed = on_changed
+        self._last_key = None
+        self._has_more = False
+        self._loading = False
+        self._range = (None, None)
+
+        self.title("보관함")
+        self.geometry("640x480")
+        self._create_widgets()
+        self.reload()
+
+    def _create_widgets(self):
+        self.config(padx=10, pady=10)
+        range_frame = tk.Frame(self)
+        range_frame.pack(fill=tk.X, pady=(0, 5))
+        tk.Label(range_frame, text="보관일:").pack(side=tk.LEFT)
+        self.since_var = tk.StringVar(value='')
+        self.until_var = tk.StringVar(value='')
+        since_entry = tk.Entry(range_frame, textvariable=self.since_var, width=12)
+        since_entry.pack(side=tk.LEFT, padx=(5, 0))
+        tk.Label(range_frame, text="~").pack(side=tk.LEFT, padx=3)
+        until_entry = tk.Entry(range_frame, textvariable=self.until_var, width=12)
+        until_entry.pack(side=tk.LEFT)
+        tk.Label(range_frame, text="(YYYY-MM-DD)").pack(side=tk.LEFT, padx=5)
+        tk.Button(range_frame, text="조회", command=self.reload).pack(side=tk.LEFT, padx=(5, 0))
+        for entry in (since_entry, until_entry):
+            entry.bind('<Return>', lambda e: self.reload())
+
+        list_frame = tk.Frame(self)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.tree = ttk.Treeview(list_frame, columns=("content", "status", "archived_at"), show="headings",
+                                 selectmode='extended')
+        self.tree.heading("content", text="내용")
+        self.tree.heading("status", text="상태")
+        self.tree.heading("archived_at", text="보관일")
+        self.tree.column("status", width=60, anchor="center", stretch=False)
+        self.tree.column("archived_at", width=140, anchor="center", stretch=False)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.config(yscrollcommand=self._on_yscroll)
+        bind_mousewheel(self.tree)
+
+        button_frame = tk.Frame(self)
+        button_frame.pack(fill=tk.X)
+        self.count_label = tk.Label(button_frame, text="")
+        self.count_label.pack(side=tk.LEFT)
+        tk.Button(button_frame, text="영구 삭제", command=self.delete_selected).pack(side=tk.RIGHT)
+        tk.Button(button_frame, text="되살리기", command=self.restore_selected).pack(side=tk.RIGHT, padx=5)
+
+    def _parse_range(self):
+        """입력한 날짜 범위를 (이상, 미만) 문자열로 바꿉니다. 끝 날짜는 그날 전체를 포함합니다."""
+        since = self.since_var.get().strip()
+        until = self.until_var.get().strip()
+        try:
+            since = datetime.strptime(since, DATE_FORMAT).strftime(DATE_FORMAT) if since else None
+            until = (datetime.strptime(until, DATE_FORMAT) + timedelta(days=1)).strftime(DATE_FORMAT) if until else None
+        except ValueError:
+            messagebox.showwarning("입력 오류", "날짜는 YYYY-MM-DD 형식으로 입력하세요.", parent=self)
+            return None
+        return since, until
+
+    def reload(self):
+        """조건을 다시 읽고 첫 페이지부터 표시합니다."""
+        parsed = self._parse_range()
+        if parsed is None:
+            return
+        self._range = parsed
+        self.tree.delete(*self.tree.get_children())
+        self._last_key = None
+        self._has_more = True
+        self.load_more()
+
+    def load_more(self):
+        if self._loading or not self._has_more:
+            return
+        self._loading = True
+        try:
+            since, until = self._range
+            rows = self.todo_service.get_archived_page(self._last_key, since, until, ARCHIVE_PAGE_SIZE + 1)
+            self._has_more = len(rows) > ARCHIVE_PAGE_SIZE
+            rows = rows[:ARCHIVE_PAGE_SIZE]
+            for t in rows:
+                self.tree.insert('', tk.END, iid=str(t.id), values=(
+                    t.content, '완료' if t.status == 'completed' else '미완료', t.archived_at or ''))
+            if rows:
+                self._last_key = (rows[-1].archived_at, rows[-1].id)
+            shown = len(self.tree.get_children())
+            self.count_label.config(text=f"{shown}개 표시" + (" (스크롤하면 더 읽음)" if self._has_more else ""))
+        finally:
+            self._loading = False
+
+    def _on_yscroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if self._has_more and float(last) > 0.95:
+            self.after_idle(self.load_more)
+
+    def _selected_ids(self):
+        return [int(iid) for iid in self.tree.selection()]
+
+    def restore_selected(self):
+        ids = self._selected_ids()
+        if not ids:
+            messagebox.showwarning("선택 오류", "되살릴 항목을 선택하세요.", parent=self)
+            return
+        self.todo_service.restore_archived(ids)
+        self._after_change()
+
+    def delete_selected(self):
+        ids = self._selected_ids()
+        if not ids:
+            messagebox.showwarning("선택 오류", "삭제할 항목을 선택하세요.", parent=self)
+            return
+        if not messagebox.askyesno("삭제 확인", f"선택한 {len(ids)}개 항목을 (하위 항목 포함) 영구 삭제하시겠습니까?",
+                                   parent=self):
+            return
+        self.todo_service.delete_archived(ids)
+        self._after_change()
+
+    def _after_change(self):
+        # 보이는 행만 다시 읽음 (첫 페이지부터, 기존 조건 유지)
+        self.tree.delete(*self.tree.get_children())
+        self._last_key = None
+        self._has_more = True
+        self.load_more()
+        if self.on_changed:
+            self.on_changed()
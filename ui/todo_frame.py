@@ -1,18 +1,59 @@
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, filedialog, messagebox
 import tkinter.font as tkfont
+from datetime import datetime
+from services.todo_scheduler import TodoScheduler, format_schedule
 from services.todo_service import TodoService
 from ui.scroll_util import bind_mousewheel
+from ui.todo_archive_window import TodoArchiveWindow
+from ui.todo_schedule_dialog import TodoScheduleDialog
+from ui.todo_stats_panel import TodoStatsPanel
+
+# 최상위 행은 화면 근처 범위만 Treeview 항목으로 유지 (페이지 단위로 붙이고 떼어냄)
+PAGE_SIZE = 100
+MAX_TOP_LEVEL_ROWS = 300
+# 아직 자식을 읽지 않은 노드에 넣어 두는 자리표시 행 (펼침 화살표 표시용)
+PLACEHOLDER_PREFIX = '~'
+# 검색어 입력 후 실제 검색까지 대기 시간(ms)과 최대 결과 수
+SEARCH_DEBOUNCE_MS = 250
+SEARCH_LIMIT = 200
+TRANSFER_FILETYPES = [("JSON Lines", "*.jsonl"), ("CSV", "*.csv")]
+# 다른 프로세스의 변경을 확인하는 주기(ms). 바뀐 것이 없으면 PRAGMA data_version 한 번만 읽음
+LIVE_REFRESH_MS = 1000
+# 색인의 마감 시각 목록에서 바로 답하는 평면 보기 (트리 대신 결과와 조상만 표시)
+SCHEDULE_VIEWS = ('today', 'overdue')
 
 
 class TodoFrame(tk.Frame):
     def __init__(self, master, todo_service: TodoService, **kwargs):
         super().__init__(master, **kwargs)
         self.todo_service = todo_service
+        # 현재 Treeview에 그려진 행의 Todo (다음 갱신 때 바뀐 행을 찾기 위한 비교 기준)
+        self._todo_by_id = {}
+        self._more_before = False
+        self._more_after = False
+        self._window_shift_pending = False
+        self._search_after_id = None
+        self._archive_window = None
+        self._transfer_running = False
+        self.scheduler = None
 
         self._configure_styles()
         self._create_widgets()
         self.refresh_todos()
+        self.after(LIVE_REFRESH_MS, self._poll_external_changes)
+        # 쓰기 지연 기록 실패는 작업 스레드에서 오므로 Tk 스레드로 넘겨 표시
+        if hasattr(self.todo_service, 'on_write_error'):
+            self.todo_service.on_write_error = lambda e: self.after(0, self._on_write_error, e)
+        # 가져오기 작업 스레드가 바꾼 색인은 Tk 스레드에서 정리 (앱에서 이미 정했으면 그대로 둠)
+        if hasattr(self.todo_service, 'call_on_ui') and self.todo_service.call_on_ui is None:
+            self.todo_service.call_on_ui = lambda fn: self.after(0, fn)
+        # 마감/알림 타이머 (가장 이른 시각 하나에만 after()를 걺)
+        if hasattr(self.todo_service, 'get_scheduled_todos'):
+            self.scheduler = TodoScheduler(self, self.todo_service, on_remind=self._on_remind, on_due=self._on_due)
+            self.todo_service.on_schedule_changed = self.scheduler.schedule
+            self.scheduler.reload()
 
     def _configure_styles(self):
         # Treeview 폰트 설정 (기본/취소선)
@@ -32,26 +73,49 @@ class TodoFrame(tk.Frame):
 
         tk.Button(input_frame, text="추가", command=self.add_todo).pack(side=tk.LEFT)
         tk.Button(input_frame, text="하위 추가", command=self.add_subtask).pack(side=tk.LEFT, padx=(5, 0))
+        tk.Button(input_frame, text="보관", command=self.archive_selected).pack(side=tk.LEFT, padx=(5, 0))
+        tk.Button(input_frame, text="일정", command=self.edit_schedule).pack(side=tk.LEFT, padx=(5, 0))
 
         # Filter bar
         filter_frame = tk.Frame(self)
         filter_frame.pack(fill=tk.X, pady=(0, 5))
         tk.Label(filter_frame, text="필터:").pack(side=tk.LEFT)
         self.filter_var = tk.StringVar(value='all')
-        self.filter_combo = ttk.Combobox(filter_frame, textvariable=self.filter_var, state='readonly', values=['all', 'pending', 'completed'])
+        self.filter_combo = ttk.Combobox(filter_frame, textvariable=self.filter_var, state='readonly',
+                                         values=['all', 'pending', 'completed', *SCHEDULE_VIEWS])
         self.filter_combo.pack(side=tk.LEFT, padx=5)
-        self.filter_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_todos())
-        self.show_archived_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(filter_frame, text='보관 보기', variable=self.show_archived_var, command=self.refresh_todos).pack(side=tk.LEFT, padx=10)
+        self.filter_combo.bind('<<ComboboxSelected>>', lambda e: self._on_filter_changed())
+        # 보관 항목은 목록에 섞지 않고 별도 창에서 페이지 단위로 봄
+        tk.Button(filter_frame, text='보관함', command=self.open_archive).pack(side=tk.LEFT, padx=10)
+        # 입력하는 동안 검색 (마지막 입력 후 잠시 기다렸다가 실행)
+        self.search_var = tk.StringVar(value='')
+        search_entry = tk.Entry(filter_frame, textvariable=self.search_var, width=30)
+        search_entry.pack(side=tk.RIGHT)
+        search_entry.bind('<Escape>', lambda e: self.search_var.set(''))
+        tk.Label(filter_frame, text="검색:").pack(side=tk.RIGHT, padx=(10, 5))
+        self.search_var.trace_add('write', lambda *_: self._schedule_search())
+        # 태그 조건 (#a #b → 둘 다 가진 항목). 목록은 펼칠 때 사용 중인 태그로 채움
+        self.tag_var = tk.StringVar(value='')
+        self.tag_combo = ttk.Combobox(filter_frame, textvariable=self.tag_var, width=16,
+                                      postcommand=self._fill_tag_choices)
+        self.tag_combo.pack(side=tk.RIGHT)
+        self.tag_combo.bind('<Escape>', lambda e: self.tag_var.set(''))
+        tk.Label(filter_frame, text="태그:").pack(side=tk.RIGHT, padx=(10, 5))
+        self.tag_var.trace_add('write', lambda *_: self._schedule_search())
 
         list_frame = tk.Frame(self)
         list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
         # Treeview로 리스트 구현 (다중 선택 + 트리모드)
-        self.todo_tree = ttk.Treeview(list_frame, columns=("content",), show="tree headings", selectmode='extended')
+        self.todo_tree = ttk.Treeview(list_frame, columns=("content", "due", "progress"), show="tree headings",
+                                      selectmode='extended')
         self.todo_tree.heading("#0", text="상태")
         self.todo_tree.heading("content", text="내용")
+        self.todo_tree.heading("due", text="마감")
+        self.todo_tree.heading("progress", text="진행")
         self.todo_tree.column("#0", width=60, anchor="center")
+        self.todo_tree.column("due", width=110, anchor="center", stretch=False)
+        self.todo_tree.column("progress", width=60, anchor="center", stretch=False)
         self.todo_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         # Override status header text and width to be minimal (checkbox-sized)
         try:
@@ -63,10 +127,18 @@ class TodoFrame(tk.Frame):
         # keyboard shortcuts
         self.todo_tree.bind('<Delete>', lambda e: self.delete_selected())
         self.todo_tree.bind('<space>', lambda e: self.toggle_selected_status())
+        for seq in ('<Control-z>', '<Control-Z>'):
+            self.todo_tree.bind(seq, lambda e: self.undo())
+        for seq in ('<Control-y>', '<Control-Y>'):
+            self.todo_tree.bind(seq, lambda e: self.redo())
+        # 자식은 펼칠 때 읽고, 접으면 다시 비움
+        self.todo_tree.bind('<<TreeviewOpen>>', self._on_tree_open)
+        self.todo_tree.bind('<<TreeviewClose>>', self._on_tree_close)
 
         # Drag-and-drop reordering within same parent
         self._drag_item = None
         self._drag_parent = None
+        self._drag_index = 0
         self.todo_tree.bind('<ButtonPress-1>', self._on_tree_button_press)
         self.todo_tree.bind('<B1-Motion>', self._on_tree_motion)
         self.todo_tree.bind('<ButtonRelease-1>', self._on_tree_button_release)
@@ -74,6 +146,7 @@ class TodoFrame(tk.Frame):
         # 상태별 스타일
         self.todo_tree.tag_configure('completed', font=self.strikethrough_font, foreground="#888888")
         self.todo_tree.tag_configure('pending', font=self.normal_font, foreground="#000000")
+        self.todo_tree.tag_configure('overdue', foreground="#D9534F")
         # Adjust colors for current theme (dark/light)
         try:
             self._apply_tree_tags_colors()
@@ -82,7 +155,8 @@ class TodoFrame(tk.Frame):
 
         scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.todo_tree.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.todo_tree.config(yscrollcommand=scrollbar.set)
+        self._scrollbar = scrollbar
+        self.todo_tree.config(yscrollcommand=self._on_tree_yscroll)
         # 마우스 휠로 Treeview 스크롤
         bind_mousewheel(self.todo_tree)
 
@@ -90,6 +164,94 @@ class TodoFrame(tk.Frame):
         button_frame.pack(fill=tk.X, pady=5)
 
         tk.Button(button_frame, text="삭제", command=self.delete_selected).pack(side=tk.RIGHT)
+        tk.Button(button_frame, text="되돌리기", command=self.undo).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="다시 실행", command=self.redo).pack(side=tk.LEFT, padx=(5, 0))
+        tk.Button(button_frame, text="내보내기", command=self.export_todos).pack(side=tk.LEFT, padx=(15, 0))
+        tk.Button(button_frame, text="가져오기", command=self.import_todos).pack(side=tk.LEFT, padx=(5, 0))
+        self.transfer_label = tk.Label(button_frame, text="")
+        self.transfer_label.pack(side=tk.LEFT, padx=10)
+
+        if hasattr(self.todo_service, 'get_stats'):
+            TodoStatsPanel(self, self.todo_service).pack(fill=tk.X, pady=(0, 5))
+
+    def _status_filter(self):
+        view = self.filter_var.get()
+        if view in SCHEDULE_VIEWS:
+            return 'pending'
+        return None if view == 'all' else view
+
+    def _is_flat_view(self) -> bool:
+        """검색/태그/오늘/지연 보기처럼 일부 행과 그 조상만 그리는 보기인지."""
+        return bool(self._search_query() or self._tag_query()) or self.filter_var.get() in SCHEDULE_VIEWS
+
+    def _tag_query(self):
+        if not hasattr(self, 'tag_var') or not hasattr(self.todo_service, 'find_by_tags'):
+            return []
+        return [tag.lstrip('#') for tag in self.tag_var.get().split() if tag.lstrip('#')]
+
+    def _fill_tag_choices(self):
+        try:
+            self.tag_combo['values'] = [f"#{tag}" for tag, _ in self.todo_service.get_tags()]
+        except Exception as e:
+            print(f"태그 목록 조회 중 오류 발생: {e}")
+
+    def _search_query(self) -> str:
+        return self.search_var.get().strip() if hasattr(self, 'search_var') else ''
+
+    def _schedule_search(self):
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
+        # 검색 모드 진입/해제 시에는 행 구성이 완전히 달라지므로 비우고 다시 그림
+        self.todo_tree.delete(*self.todo_tree.get_children(''))
+        self._todo_by_id = {}
+        self._more_before = False
+        self.refresh_todos()
+
+    def _render_search(self, query: str) -> None:
+        """검색 결과와 그 조상 행만 펼친 상태로 보여줍니다."""
+        # 태그 조건도 검색 쿼리 안에서 걸러야 SEARCH_LIMIT이 조건에 맞는 항목에 적용됨
+        matches = self.todo_service.search(query, SEARCH_LIMIT, self._status_filter(), tags=self._tag_query())
+        self._render_matches(matches)
+
+    def _render_matches(self, matches) -> None:
+        rows = {}
+        for t in matches:
+            rows[t.id] = t
+            for ancestor in self.todo_service.get_ancestors(t.id):
+                rows.setdefault(ancestor.id, ancestor)
+        children_map = {}
+        for t in rows.values():
+            parent = t.parent_id if t.parent_id in rows else None
+            children_map.setdefault(parent, []).append(t)
+        for items in children_map.values():
+            items.sort(key=lambda t: (t.sort_order or 0, t.id))
+
+        tree = self.todo_tree
+        tree.delete(*tree.get_children(''))
+        self._todo_by_id = {}
+        self._more_before = self._more_after = False
+
+        def insert_branch(parent_id, parent_iid):
+            for t in children_map.get(parent_id, []):
+                iid = self._insert_row(parent_iid, tk.END, t)
+                if t.id in children_map:
+                    tree.item(iid, open=True)
+                    insert_branch(t.id, iid)
+
+        insert_branch(None, '')
+        if matches:
+            tree.see(str(matches[0].id))
+
+    def _on_filter_changed(self):
+        # 필터가 바뀌면 창 위치를 처음으로 되돌림 (오늘/지연 보기는 행 구성이 달라지므로 비우고 다시 그림)
+        self.todo_tree.delete(*self.todo_tree.get_children(''))
+        self._todo_by_id = {}
+        self._more_before = False
+        self.refresh_todos()
 
     def refresh_todos(self):
         # Re-apply tag colors in case theme changed
@@ -97,38 +259,288 @@ class TodoFrame(tk.Frame):
             self._apply_tree_tags_colors()
         except Exception:
             pass
-        for item in self.todo_tree.get_children():
-            self.todo_tree.delete(item)
 
-        # Auto-archive old completed
+        query = self._search_query()
+        if query:
+            self._render_search(query)
+            return
+        view = self.filter_var.get()
+        scheduled = None
+        if view in SCHEDULE_VIEWS and hasattr(self.todo_service, 'get_due_today'):
+            scheduled = self.todo_service.get_due_today() if view == 'today' else self.todo_service.get_overdue()
+        tags = self._tag_query()
+        if tags:
+            # 오늘/지연 항목으로 좁힌 뒤에 SEARCH_LIMIT을 적용 (태그 상위 결과 밖의 마감 항목이 빠지지 않도록)
+            within = [t.id for t in scheduled] if scheduled is not None else None
+            self._render_matches(self.todo_service.find_by_tags(tags, self._status_filter(), SEARCH_LIMIT, within))
+            return
+        if scheduled is not None:
+            self._render_matches(scheduled)
+            return
+
+        status_filter = self._status_filter()
+        previous = self._todo_by_id
+        self._todo_by_id = {}
+
+        # 현재 창의 첫 행부터 같은 개수만큼 다시 읽음
+        top = self.todo_tree.get_children('')
+        start_at = None
+        if self._more_before and top and int(top[0]) in previous:
+            first = previous[int(top[0])]
+            start_at = (first.sort_order, first.id)
+        count = max(len(top), PAGE_SIZE)
+        rows = self.todo_service.get_children(None, status_filter, start_at=start_at, limit=count + 1)
+        self._more_after = len(rows) > count
+        if start_at is None:
+            self._more_before = False
+
         try:
-            self.todo_service.archive_completed_older_than_days(7)
-        except Exception:
-            pass
+            self._sync_level('', rows[:count], previous)
+        except tk.TclError:
+            # 계층이 뒤집히는 등 이동이 불가능한 경우 전체 재구성
+            self.todo_tree.delete(*self.todo_tree.get_children(''))
+            self._sync_level('', rows[:count], {})
+
+    def _poll_external_changes(self):
+        """다른 앱 인스턴스/스크립트가 DB를 바꿨으면 바뀐 행만 다시 그립니다."""
+        if not self.winfo_exists():
+            return
+        if hasattr(self.todo_service, 'check_external_changes') and not self._transfer_running:
+            try:
+                result = self.todo_service.check_external_changes()
+            except Exception as e:
+                print(f"Todo 외부 변경 확인 중 오류 발생: {e}")
+                result = None
+            if result is not None:
+                changed, conflicts = result
+                if changed:
+                    self.refresh_todos()
+                    if self.scheduler:
+                        self.scheduler.reload()
+                if conflicts:
+                    messagebox.showwarning(
+                        "동시 수정",
+                        f"다른 곳에서 먼저 수정된 항목 {len(conflicts)}개의 변경은 저장하지 않고 최신 내용으로 바꿨습니다."
+                    )
+        self.after(LIVE_REFRESH_MS, self._poll_external_changes)
+
+    # ---- Schedule (due dates / reminders) ----
+    def _on_remind(self, t) -> None:
+        due = f"\n마감: {t.due_at}" if t.due_at else ''
+        messagebox.showinfo("할 일 알림", f"{t.content}{due}")
+
+    def _on_due(self, todos) -> None:
+        """마감이 지난 항목을 지연 표시로 바꿉니다."""
+        if self.filter_var.get() in SCHEDULE_VIEWS:
+            self.refresh_todos()
+            return
+        for t in todos:
+            if t.id in self._todo_by_id:
+                self._todo_by_id[t.id] = t
+                self._update_row(t)
+
+    def edit_schedule(self):
+        todo_id = self.get_selected_todo_id()
+        todo = self.todo_service.get_todo(todo_id) if todo_id is not None else None
+        if todo is None or not hasattr(self.todo_service, 'set_schedule'):
+            return
+        TodoScheduleDialog(self, self.todo_service, todo, on_saved=self.refresh_todos)
+
+    # ---- Tree rendering helpers ----
+    def _row_options(self, t) -> dict:
+        due_at = getattr(t, 'due_at', None)
+        due = ''
+        tags = (t.status,)
+        if due_at:
+            # 연도는 생략하고 월-일 시:분만 표시, 반복 항목은 ↻
+            due = due_at[5:] + (' ↻' if t.recurrence else '')
+            if t.status == 'pending' and due_at < format_schedule(datetime.now()):
+                tags = (t.status, 'overdue')
+        return {
+            'text': ('✔' if t.status == 'completed' else ''),
+            # 하위 항목이 있으면 완료/전체 (DB 카운터 값이라 다시 세지 않음)
+            'values': ((f"!{t.priority} " if getattr(t, 'priority', None) else '') + t.content, due,
+                       f"{t.child_completed}/{t.child_total}" if t.child_total else ''),
+            'tags': tags,
+        }
+
+    def _insert_row(self, parent_iid: str, index, t, has_children: bool = False) -> str:
+        iid = self.todo_tree.insert(parent_iid, index, iid=str(t.id), **self._row_options(t))
+        self._todo_by_id[t.id] = t
+        if has_children:
+            self._set_placeholder(iid)
+        return iid
+
+    def _update_row(self, t) -> None:
+        iid = str(t.id)
+        if self.todo_tree.exists(iid):
+            self.todo_tree.item(iid, **self._row_options(t))
+
+    @staticmethod
+    def _is_placeholder(iid: str) -> bool:
+        return iid.startswith(PLACEHOLDER_PREFIX)
+
+    def _set_placeholder(self, iid: str) -> None:
+        placeholder = PLACEHOLDER_PREFIX + iid
+        kids = self.todo_tree.get_children(iid)
+        if kids == (placeholder,):
+            return
+        if kids:
+            self._forget_rows(kids)
+            self.todo_tree.delete(*kids)
+        self.todo_tree.insert(iid, tk.END, iid=placeholder, text='', values=('…',))
 
-        status_filter = None if self.filter_var.get() == 'all' else self.filter_var.get()
-        show_archived = bool(self.show_archived_var.get())
-        # Advanced fetch for hierarchy/ordering
-        if hasattr(self.todo_service, 'get_all_todos_adv'):
-            self.todos = self.todo_service.get_all_todos_adv(status_filter=status_filter, show_archived=show_archived)
-        else:
-            self.todos = self.todo_service.get_all_todos()
+    def _children_loaded(self, iid: str) -> bool:
+        kids = self.todo_tree.get_children(iid)
+        return not (len(kids) == 1 and self._is_placeholder(kids[0]))
 
-        # Build children mapping
-        children_map = {}
-        for t in self.todos:
-            pid = '' if (t.parent_id is None) else str(t.parent_id)
-            children_map.setdefault(pid, []).append(t)
+    def _is_open(self, iid: str) -> bool:
+        try:
+            return bool(self.todo_tree.tk.getboolean(self.todo_tree.item(iid, 'open')))
+        except Exception:
+            return False
 
-        # Insert recursively
-        def insert_branch(parent_key: str, parent_tree_iid: str):
-            items = children_map.get(parent_key, [])
-            for t in items:
-                tags = (t.status,)
-                iid = self.todo_tree.insert(parent_tree_iid, tk.END, iid=str(t.id), text=('✔' if t.status == 'completed' else ''), values=(t.content,), tags=tags)
-                insert_branch(str(t.id), iid)
+    def _forget_rows(self, iids) -> None:
+        """삭제될 행(과 그 하위 행)의 Todo를 캐시에서 제거합니다."""
+        stack = list(iids)
+        while stack:
+            iid = stack.pop()
+            if not self._is_placeholder(iid):
+                self._todo_by_id.pop(int(iid), None)
+            stack.extend(self.todo_tree.get_children(iid))
+
+    def _sync_level(self, parent_iid: str, todos, previous: dict) -> None:
+        """
+        한 부모 아래의 행을 새 Todo 목록과 비교하여 바뀐 행만 삽입/이동/갱신/삭제합니다.
+        기존 행을 유지하므로 스크롤 위치와 펼침 상태가 보존됩니다.
+        펼쳐진 하위 노드만 다시 읽고, 접힌 노드는 자리표시 행만 둡니다.
+        """
+        tree = self.todo_tree
+        status_filter = self._status_filter()
+        with_children = self.todo_service.ids_with_children([t.id for t in todos], status_filter)
+        desired = tuple(str(t.id) for t in todos)
+        reorder = desired != tree.get_children(parent_iid)
+        for index, t in enumerate(todos):
+            iid = desired[index]
+            if not tree.exists(iid):
+                self._insert_row(parent_iid, index, t, t.id in with_children)
+                continue
+            if reorder:
+                tree.move(iid, parent_iid, index)
+            self._todo_by_id[t.id] = t
+            old = previous.get(t.id)
+            if old is None or self._row_options(old) != self._row_options(t):
+                self._update_row(t)
+            if t.id not in with_children:
+                kids = tree.get_children(iid)
+                if kids:
+                    self._forget_rows(kids)
+                    tree.delete(*kids)
+            elif self._is_open(iid) and self._children_loaded(iid):
+                children = self.todo_service.get_children(t.id, status_filter)
+                self._sync_level(iid, children, previous)
+            else:
+                self._set_placeholder(iid)
+
+        # 더 이상 표시하지 않는 행 제거 (부모가 지워지면 자식도 함께 지워짐)
+        keep = set(desired)
+        stale = [iid for iid in tree.get_children(parent_iid) if iid not in keep]
+        if stale:
+            self._forget_rows(stale)
+            tree.delete(*stale)
+
+    def _load_children(self, iid: str) -> None:
+        status_filter = self._status_filter()
+        children = self.todo_service.get_children(int(iid), status_filter)
+        self._sync_level(iid, children, {})
+
+    def _on_tree_open(self, event=None):
+        iid = self.todo_tree.focus()
+        if not iid or self._is_placeholder(iid) or self._is_flat_view():
+            return
+        if not self._children_loaded(iid):
+            self._load_children(iid)
 
-        insert_branch('', '')
+    def _on_tree_close(self, event=None):
+        iid = self.todo_tree.focus()
+        if not iid or self._is_placeholder(iid) or self._is_flat_view():
+            return
+        # 접힌 노드의 자식은 버려 메모리를 일정하게 유지
+        if self.todo_tree.get_children(iid):
+            self._set_placeholder(iid)
+
+    # ---- Top-level windowing ----
+    def _on_tree_yscroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if self._window_shift_pending:
+            return
+        first, last = float(first), float(last)
+        if (last > 0.95 and self._more_after) or (first < 0.05 and self._more_before):
+            self._window_shift_pending = True
+            self.after_idle(self._shift_window)
+
+    def _visible_row_count(self, iids) -> int:
+        count = 0
+        stack = list(iids)
+        while stack:
+            iid = stack.pop()
+            count += 1
+            if self._is_open(iid):
+                stack.extend(self.todo_tree.get_children(iid))
+        return count
+
+    def _shift_window(self):
+        """스크롤 끝에 닿으면 다음/이전 페이지를 붙이고 반대쪽 끝의 페이지를 떼어냅니다."""
+        self._window_shift_pending = False
+        tree = self.todo_tree
+        top = tree.get_children('')
+        if not top:
+            return
+        first, last = (float(v) for v in tree.yview())
+        status_filter = self._status_filter()
+        if last > 0.95 and self._more_after:
+            anchor = self._current_todo(int(top[-1]))
+            rows = self.todo_service.get_children(None, status_filter,
+                                                  after=(anchor.sort_order, anchor.id), limit=PAGE_SIZE + 1)
+            self._more_after = len(rows) > PAGE_SIZE
+            rows = rows[:PAGE_SIZE]
+            with_children = self.todo_service.ids_with_children([t.id for t in rows], status_filter)
+            for t in rows:
+                self._insert_row('', tk.END, t, t.id in with_children)
+            excess = len(top) + len(rows) - MAX_TOP_LEVEL_ROWS
+            if excess > 0:
+                dropped = top[:excess]
+                removed = self._visible_row_count(dropped)
+                self._forget_rows(dropped)
+                tree.delete(*dropped)
+                self._more_before = True
+                # 위쪽 행을 지운 만큼 되돌려 보던 위치 유지
+                tree.yview_scroll(-removed, 'units')
+        elif first < 0.05 and self._more_before:
+            anchor = self._current_todo(int(top[0]))
+            rows = self.todo_service.get_children(None, status_filter,
+                                                  before=(anchor.sort_order, anchor.id), limit=PAGE_SIZE + 1)
+            self._more_before = len(rows) > PAGE_SIZE
+            rows = rows[-PAGE_SIZE:]
+            with_children = self.todo_service.ids_with_children([t.id for t in rows], status_filter)
+            for index, t in enumerate(rows):
+                self._insert_row('', index, t, t.id in with_children)
+            tree.yview_scroll(len(rows), 'units')
+            excess = len(top) + len(rows) - MAX_TOP_LEVEL_ROWS
+            if excess > 0:
+                dropped = top[-excess:]
+                self._forget_rows(dropped)
+                tree.delete(*dropped)
+                self._more_after = True
+
+    def _matches_filter(self, t) -> bool:
+        status_filter = self.filter_var.get()
+        if status_filter in SCHEDULE_VIEWS or self._tag_query():
+            return False
+        return status_filter == 'all' or t.status == status_filter
+
+    def _selected_ids(self):
+        return [int(i) for i in self.todo_tree.selection() if not self._is_placeholder(i)]
 
     def add_todo(self, event=None):
         content = self.todo_entry.get()
@@ -137,9 +549,10 @@ class TodoFrame(tk.Frame):
             return
         parent_id = None
         add_method = getattr(self.todo_service, 'add_todo_adv', self.todo_service.add_todo)
-        if add_method(content, parent_id):
+        new_todo = add_method(content, parent_id)
+        if new_todo:
             self.todo_entry.delete(0, tk.END)
-            self.refresh_todos()
+            self._patch_added(new_todo, '')
         else:
             messagebox.showerror("추가 실패", "알 수 없는 이유로 항목을 추가하지 못했습니다.")
 
@@ -148,20 +561,64 @@ class TodoFrame(tk.Frame):
         if not content.strip():
             messagebox.showwarning("입력 오류", "추가할 내용을 입력하세요.")
             return
-        sel = self.todo_tree.selection()
+        sel = self._selected_ids()
         if not sel:
             messagebox.showwarning("선택 오류", "하위 작업을 추가할 상위 항목을 선택하세요.")
             return
-        parent_id = int(sel[0])
+        parent_id = sel[0]
         add_method = getattr(self.todo_service, 'add_todo_adv', self.todo_service.add_todo)
-        if add_method(content, parent_id):
+        new_todo = add_method(content, parent_id)
+        if new_todo:
             self.todo_entry.delete(0, tk.END)
-            self.refresh_todos()
+            self._patch_added(new_todo, str(parent_id))
         else:
             messagebox.showerror("추가 실패", "알 수 없는 이유로 하위 작업을 추가하지 못했습니다.")
 
+    def _patch_added(self, new_todo, parent_iid: str) -> None:
+        """새 항목 한 건을 전체 재조회 없이 트리에 추가합니다."""
+        if (self._search_query() or not self._matches_filter(new_todo)
+                or (parent_iid and not self.todo_tree.exists(parent_iid))):
+            self.refresh_todos()
+            return
+        if not parent_iid:
+            # 새 항목은 맨 끝 순서이므로, 창이 끝까지 내려와 있을 때만 붙임
+            if not self._more_after:
+                self._insert_row('', tk.END, new_todo)
+                self.todo_tree.see(str(new_todo.id))
+            return
+        if self._is_open(parent_iid) and self._children_loaded(parent_iid):
+            self._insert_row(parent_iid, tk.END, new_todo)
+        else:
+            self.todo_tree.item(parent_iid, open=True)
+            self._load_children(parent_iid)
+        # 부모의 진행률 표시 갱신
+        parent = self.todo_service.get_todo(int(parent_iid))
+        if parent is not None:
+            self._todo_by_id[parent.id] = parent
+            self._update_row(parent)
+        self.todo_tree.see(str(new_todo.id))
+
+    def _current_todo(self, todo_id: int):
+        """서비스 색인의 최신 Todo (없으면 마지막으로 그린 Todo)."""
+        return self.todo_service.get_todo(todo_id) or self._todo_by_id.get(todo_id)
+
+    def _patch_status(self) -> None:
+        """상태 변경을 해당 행에만 반영합니다. 필터 때문에 행이 사라져야 하면 재조정합니다."""
+        if self.filter_var.get() != 'all':
+            self.refresh_todos()
+            return
+        self._patch_changed_rows()
+
+    def _patch_changed_rows(self) -> None:
+        # 하위 항목 완료 전파와 부모 진행률 변경까지 반영: 색인 객체가 교체된 행만 다시 그림
+        for tid, old in list(self._todo_by_id.items()):
+            t = self.todo_service.get_todo(tid)
+            if t is not None and t is not old:
+                self._todo_by_id[tid] = t
+                self._update_row(t)
+
     def get_selected_todo_id(self):
-        selected_items = self.todo_tree.selection()
+        selected_items = self._selected_ids()
         if not selected_items:
             messagebox.showwarning("선택 오류", "목록에서 항목을 먼저 선택하세요.")
             return None
@@ -171,38 +628,111 @@ class TodoFrame(tk.Frame):
         item_id = self.todo_tree.identify_row(event.y)
         if not item_id:
             return
-        current_todo = next((t for t in self.todos if str(t.id) == item_id), None)
+        current_todo = self.todo_service.get_todo(int(item_id)) if not self._is_placeholder(item_id) else None
         if not current_todo:
             return
         new_status = 'pending' if current_todo.status == 'completed' else 'completed'
         if self.todo_service.update_todo_status(current_todo.id, new_status):
-            self.refresh_todos()
+            self._patch_status()
         else:
             messagebox.showerror("업데이트 실패", "상태를 업데이트하지 못했습니다.")
 
     def toggle_selected_status(self):
-        selected = self.todo_tree.selection()
-        if not selected:
+        ids = self._selected_ids()
+        if not ids:
             return
-        selected_todos = [t for t in self.todos if str(t.id) in selected]
+        selected_todos = [t for t in (self.todo_service.get_todo(tid) for tid in ids) if t is not None]
         all_completed = all(t.status == 'completed' for t in selected_todos)
         target = 'pending' if all_completed else 'completed'
-        ids = [int(i) for i in selected]
         if hasattr(self.todo_service, 'update_todos_status_bulk'):
             self.todo_service.update_todos_status_bulk(ids, target)
         else:
             for tid in ids:
                 self.todo_service.update_todo_status(tid, target)
+        self._patch_status()
+
+    def open_archive(self):
+        window = self._archive_window
+        if window is not None and window.winfo_exists():
+            window.lift()
+            window.focus_set()
+            return
+        self._archive_window = TodoArchiveWindow(self, self.todo_service, on_changed=self._on_archive_changed)
+
+    def _on_write_error(self, error):
+        """실패한 변경은 다시 큐에 들어가 다음 기록 때 다시 시도되므로 대화 상자 대신 라벨에만 표시합니다."""
+        if self.winfo_exists():
+            self.transfer_label.config(text=f"저장 실패 (다시 시도함): {error}")
+
+    def _on_archive_changed(self):
+        self.refresh_todos()
+        # 되살린 항목의 일정도 다시 잡음
+        if self.scheduler:
+            self.scheduler.reload()
+
+    def export_todos(self):
+        if self._transfer_running or not hasattr(self.todo_service, 'export'):
+            return
+        path = filedialog.asksaveasfilename(title="할 일 내보내기", defaultextension=".jsonl",
+                                            filetypes=TRANSFER_FILETYPES)
+        if path:
+            self._run_transfer("내보내기", self.todo_service.export, path)
+
+    def import_todos(self):
+        if self._transfer_running or not hasattr(self.todo_service, 'import_'):
+            return
+        path = filedialog.askopenfilename(title="할 일 가져오기", filetypes=TRANSFER_FILETYPES)
+        if path:
+            self._run_transfer("가져오기", self.todo_service.import_, path)
+
+    def _run_transfer(self, label, func, path):
+        """
+        가져오기/내보내기를 작업 스레드에서 실행하고 진행 상황을 라벨에 표시합니다.
+        Tk 위젯은 메인 스레드에서만 다루도록 after()로 넘깁니다.
+        가져오기 뒤 색인 무효화도 서비스가 같은 방식(call_on_ui)으로 먼저 넘기므로, 완료 처리의 새로 고침은 새 색인을 읽습니다.
+        """
+        self._transfer_running = True
+        self.transfer_label.config(text=f"{label} 중...")
+
+        def progress(count):
+            self.after(0, lambda: self.transfer_label.config(text=f"{label} 중... {count:,}개"))
+
+        def worker():
+            try:
+                count, error = func(path, progress=progress), None
+            except Exception as e:
+                count, error = 0, e
+            self.after(0, lambda: self._on_transfer_done(label, count, error))
+
+        threading.Thread(target=worker, name="todo-transfer", daemon=True).start()
+
+    def _on_transfer_done(self, label, count, error):
+        self._transfer_running = False
+        if error is not None:
+            self.transfer_label.config(text="")
+            messagebox.showerror(f"{label} 오류", f"{label} 중 오류 발생: {error}")
+            return
+        self.transfer_label.config(text=f"{label} 완료: {count:,}개")
+        if label == "가져오기":
+            self.refresh_todos()
+            if self.scheduler:
+                self.scheduler.reload()
+
+    def archive_selected(self):
+        ids = self._selected_ids()
+        if not ids:
+            messagebox.showwarning("선택 오류", "보관할 항목을 선택하세요.")
+            return
+        self.todo_service.archive_todos(ids)
         self.refresh_todos()
 
     def delete_selected(self):
-        selected = self.todo_tree.selection()
-        if not selected:
+        ids = self._selected_ids()
+        if not ids:
             messagebox.showwarning("선택 오류", "삭제할 항목을 선택하세요.")
             return
-        if not messagebox.askyesno("삭제 확인", f"선택한 {len(selected)}개 항목을 삭제하시겠습니까?"):
+        if not messagebox.askyesno("삭제 확인", f"선택한 {len(ids)}개 항목을 (하위 항목 포함) 삭제하시겠습니까?"):
             return
-        ids = [int(i) for i in selected]
         if hasattr(self.todo_service, 'delete_many'):
             self.todo_service.delete_many(ids)
         else:
@@ -210,39 +740,69 @@ class TodoFrame(tk.Frame):
                 self.todo_service.delete_todo(tid)
         self.refresh_todos()
 
+    def undo(self):
+        """마지막 상태 변경/이동/삭제를 되돌립니다 (Ctrl+Z)."""
+        if hasattr(self.todo_service, 'undo') and self.todo_service.undo():
+            self.refresh_todos()
+        return "break"
+
+    def redo(self):
+        """되돌린 변경을 다시 적용합니다 (Ctrl+Y)."""
+        if hasattr(self.todo_service, 'redo') and self.todo_service.redo():
+            self.refresh_todos()
+        return "break"
+
     # Drag-and-drop helpers
     def _on_tree_button_press(self, event):
         iid = self.todo_tree.identify_row(event.y)
-        if iid:
+        # 검색/태그/오늘/지연 보기는 일부 행만 그린 목록이므로 끌어서 옮기지 않음
+        if iid and not self._is_placeholder(iid) and not self._is_flat_view():
             self._drag_item = iid
             parent = self.todo_tree.parent(iid)
             self._drag_parent = parent
+            self._drag_index = self.todo_tree.index(iid)
         else:
             self._drag_item = None
             self._drag_parent = None
 
+    def _is_descendant_or_self(self, iid: str, ancestor: str) -> bool:
+        while iid:
+            if iid == ancestor:
+                return True
+            iid = self.todo_tree.parent(iid)
+        return False
+
     def _on_tree_motion(self, event):
         if not self._drag_item:
             return
         target_iid = self.todo_tree.identify_row(event.y)
-        if not target_iid or target_iid == self._drag_item:
+        if not target_iid or target_iid == self._drag_item or self._is_placeholder(target_iid):
             return
-        # Only move within same parent to keep hierarchy simple
-        if self.todo_tree.parent(target_iid) != self._drag_parent:
+        target_parent = self.todo_tree.parent(target_iid)
+        # 다른 부모 아래로도 옮길 수 있지만, 자기 자신의 하위 항목 아래로는 안 됨
+        if self._is_descendant_or_self(target_parent, self._drag_item):
             return
         index = self.todo_tree.index(target_iid)
-        self.todo_tree.move(self._drag_item, self._drag_parent, index)
+        self.todo_tree.move(self._drag_item, target_parent, index)
 
     def _on_tree_button_release(self, event):
         if not self._drag_item:
             return
-        parent = self._drag_parent
-        # Read new order under this parent and persist
-        children = self.todo_tree.get_children(parent)
-        ordered_ids = [int(i) for i in children]
-        self.todo_service.update_sort_orders(int(parent) if parent else None, ordered_ids)
+        iid = self._drag_item
         self._drag_item = None
-        self._drag_parent = None
+        parent = self.todo_tree.parent(iid)
+        if parent == self._drag_parent and self.todo_tree.index(iid) == self._drag_index:
+            return
+        # 새 위치의 바로 앞/뒤 형제 사이로 옮김: 옮긴 행 하나만 저장됨 (필터로 가려진 형제와의 순서도 유지)
+        siblings = [i for i in self.todo_tree.get_children(parent) if not self._is_placeholder(i)]
+        pos = siblings.index(iid)
+        prev_id = int(siblings[pos - 1]) if pos > 0 else None
+        next_id = int(siblings[pos + 1]) if pos + 1 < len(siblings) else None
+        todo_id = int(iid)
+        if self.todo_service.move_todo(todo_id, int(parent) if parent else None, prev_id, next_id):
+            self._patch_changed_rows()
+        else:
+            self.refresh_todos()
 
     # ---- Theme helpers ----
     def _is_dark_mode(self) -> bool:
@@ -262,6 +822,7 @@ class TodoFrame(tk.Frame):
         try:
             self.todo_tree.tag_configure('pending', font=self.normal_font, foreground=pending_fg)
             self.todo_tree.tag_configure('completed', font=self.strikethrough_font, foreground=completed_fg)
+            self.todo_tree.tag_configure('overdue', foreground="#FF6B6B" if is_dark else "#D9534F")
         except Exception:
             pass
 
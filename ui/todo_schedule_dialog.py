@@ -0,0 +1,74 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from services.todo_scheduler import RECURRENCE_RULES
+from services.todo_service import TodoService
+
+NO_RECURRENCE = '반복 없음'
+
+
+class TodoScheduleDialog(tk.Toplevel):
+    """한 항목의 마감/알림 시각과 반복 규칙을 편집하는 창."""
+    def __init__(self, master, todo_service: TodoService, todo, on_saved=None):
+        """
+        :param todo_service: TodoService 인스턴스
+        :param todo: 편집할 Todo
+        :param on_saved: 저장 뒤 호출될 콜백 (Todo 목록 갱신용)
+        """
+        super().__init__(master)
+        self.todo_service = todo_service
+        self.todo_id = todo.id
+        self.on_saved = on_saved
+
+        self.title("일정")
+        self.resizable(False, False)
+        self.transient(master.winfo_toplevel())
+        self._create_widgets(todo)
+
+    def _create_widgets(self, todo):
+        self.config(padx=10, pady=10)
+        tk.Label(self, text=todo.content, anchor='w').grid(row=0, column=0, columnspan=2, sticky='we', pady=(0, 8))
+
+        self.due_var = tk.StringVar(value=todo.due_at or '')
+        self.remind_var = tk.StringVar(value=todo.remind_at or '')
+        labels = list(RECURRENCE_RULES.values())
+        self.recurrence_var = tk.StringVar(value=RECURRENCE_RULES.get(todo.recurrence, NO_RECURRENCE))
+
+        tk.Label(self, text="마감:").grid(row=1, column=0, sticky='e')
+        tk.Entry(self, textvariable=self.due_var, width=20).grid(row=1, column=1, sticky='w', padx=5, pady=2)
+        tk.Label(self, text="알림:").grid(row=2, column=0, sticky='e')
+        tk.Entry(self, textvariable=self.remind_var, width=20).grid(row=2, column=1, sticky='w', padx=5, pady=2)
+        tk.Label(self, text="반복:").grid(row=3, column=0, sticky='e')
+        ttk.Combobox(self, textvariable=self.recurrence_var, state='readonly', width=17,
+                     values=[NO_RECURRENCE] + labels).grid(row=3, column=1, sticky='w', padx=5, pady=2)
+        tk.Label(self, text="(YYYY-MM-DD HH:MM)").grid(row=4, column=1, sticky='w', padx=5)
+
+        button_frame = tk.Frame(self)
+        button_frame.grid(row=5, column=0, columnspan=2, sticky='e', pady=(8, 0))
+        tk.Button(button_frame, text="저장", command=self.save).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="일정 지우기", command=self.clear).pack(side=tk.LEFT, padx=(5, 0))
+        tk.Button(button_frame, text="취소", command=self.destroy).pack(side=tk.LEFT, padx=(5, 0))
+
+    def _recurrence(self):
+        label = self.recurrence_var.get()
+        return next((rule for rule, text in RECURRENCE_RULES.items() if text == label), None)
+
+    def save(self):
+        due_at = self.due_var.get().strip()
+        remind_at = self.remind_var.get().strip()
+        recurrence = self._recurrence()
+        if recurrence and not due_at:
+            messagebox.showwarning("입력 오류", "반복하려면 마감 시각을 입력하세요.", parent=self)
+            return
+        if not self.todo_service.set_schedule(self.todo_id, due_at, remind_at, recurrence):
+            messagebox.showwarning("입력 오류", "시각은 YYYY-MM-DD HH:MM 형식으로 입력하세요.", parent=self)
+            return
+        self._after_save()
+
+    def clear(self):
+        self.todo_service.set_schedule(self.todo_id, None, None, None)
+        self._after_save()
+
+    def _after_save(self):
+        if self.on_saved:
+            self.on_saved()
+        self.destroy()
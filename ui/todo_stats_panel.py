@@ -0,0 +1,105 @@
+import tkinter as tk
+from datetime import datetime
+from services.todo_service import TodoService
+
+# 보이는 동안 집계를 다시 읽는 주기(ms). 집계 행 몇 개만 읽으므로 항목 수와 관계없이 가벼움
+STATS_REFRESH_MS = 5000
+CHART_HEIGHT = 70
+CREATED_COLOR = "#9E9E9E"
+COMPLETED_COLOR = "#4CAF50"
+
+
+class TodoStatsPanel(tk.LabelFrame):
+    """
+    할 일 현황 (상태별 수, 가장 오래된 미완료, 최근 주별 추가/완료 막대).
+    Todo 페이지와 홈 화면에서 함께 씁니다.
+    """
+    def __init__(self, master, todo_service: TodoService, weeks: int = 8, **kwargs):
+        """
+        :param todo_service: TodoService 인스턴스 (get_stats가 없으면 빈 패널)
+        :param weeks: 막대로 보여줄 최근 주 수
+        """
+        kwargs.setdefault('text', '현황')
+        super().__init__(master, **kwargs)
+        self.todo_service = todo_service
+        self.weeks = weeks
+        self._after_id = None
+        self._stats = None
+
+        self.summary_label = tk.Label(self, text="", anchor='w')
+        self.summary_label.pack(fill=tk.X, padx=6)
+        self.oldest_label = tk.Label(self, text="", anchor='w')
+        self.oldest_label.pack(fill=tk.X, padx=6)
+        self.chart = tk.Canvas(self, height=CHART_HEIGHT, highlightthickness=0)
+        self.chart.pack(fill=tk.X, padx=6, pady=(2, 4))
+        self.chart.bind('<Configure>', lambda e: self._draw(self._stats))
+        self.bind('<Destroy>', self._on_destroy)
+        self.refresh()
+
+    def refresh(self) -> None:
+        if not hasattr(self.todo_service, 'get_stats'):
+            return
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self._after_id = self.after(STATS_REFRESH_MS, self._tick)
+        try:
+            stats = self.todo_service.get_stats(self.weeks)
+        except Exception as e:
+            print(f"할 일 현황 조회 중 오류 발생: {e}")
+            return
+        self._stats = stats
+        self.summary_label.config(
+            text=f"미완료 {stats.pending:,} · 완료 {stats.completed:,} · 보관 {stats.archived:,}")
+        oldest = stats.oldest_pending
+        if oldest is not None:
+            self.oldest_label.config(text=f"가장 오래된 미완료: {oldest.content} ({self._age(oldest.created_at)})")
+        else:
+            self.oldest_label.config(text="미완료 항목 없음")
+        self._draw(stats)
+
+    def _tick(self) -> None:
+        self._after_id = None
+        # 다른 페이지에 가려져 있으면 읽지 않고 다음 주기만 예약
+        if self.winfo_ismapped():
+            self.refresh()
+        else:
+            self._after_id = self.after(STATS_REFRESH_MS, self._tick)
+
+    def _on_destroy(self, event) -> None:
+        if event.widget is self and self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+    @staticmethod
+    def _age(created_at) -> str:
+        try:
+            created = datetime.strptime(str(created_at)[:19], '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            return str(created_at)
+        # created_at은 UTC(CURRENT_TIMESTAMP)
+        days = (datetime.utcnow() - created).days
+        return f"{days}일 전" if days > 0 else "오늘"
+
+    def _draw(self, stats) -> None:
+        """주별로 추가(회색)/완료(녹색) 막대 한 쌍과 완료율, 아래에 주 시작일(MM/DD)."""
+        canvas = self.chart
+        canvas.delete('all')
+        width = canvas.winfo_width()
+        if stats is None or width <= 1 or not stats.weeks:
+            return
+        top, label_h = 12, 12
+        bar_area = CHART_HEIGHT - top - label_h
+        peak = max(1, max(max(created, completed) for _, created, completed in stats.weeks))
+        slot = width / len(stats.weeks)
+        bar_w = max(2, slot * 0.3)
+        for i, (week, created, completed) in enumerate(stats.weeks):
+            x = i * slot + slot / 2
+            for offset, value, color in ((-bar_w, created, CREATED_COLOR), (0, max(completed, 0), COMPLETED_COLOR)):
+                h = bar_area * value / peak
+                canvas.create_rectangle(x + offset, top + bar_area - h, x + offset + bar_w, top + bar_area,
+                                        fill=color, outline='')
+            rate = stats.rate(created, completed)
+            if rate is not None:
+                canvas.create_text(x, top / 2, text=f"{rate:.0%}", font=("TkDefaultFont", 7))
+            canvas.create_text(x, CHART_HEIGHT - label_h / 2, text=week[5:].replace('-', '/'),
+                               font=("TkDefaultFont", 7))